@@ -0,0 +1,291 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the database lookups used for caching and run listings.
+
+The script fills a database with synthetic step runs, pipeline runs and
+builds and then compares query plans and latencies of the hot lookup queries
+with and without the indexes declared on the schemas.
+
+Example:
+    python scripts/benchmark_run_lookups.py --step-runs 1000000
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+import click
+from sqlalchemy import desc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+from sqlmodel import SQLModel, create_engine, select
+
+from zenml.enums import ExecutionStatus
+from zenml.zen_stores.schemas import (
+    PipelineBuildSchema,
+    PipelineRunSchema,
+    StepRunSchema,
+)
+
+STATUSES = [
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.CACHED,
+    ExecutionStatus.FAILED,
+]
+
+
+def _insert_rows(
+    engine: Engine,
+    table: Any,
+    count: int,
+    row_factory: Callable[[int], Dict[str, Any]],
+    batch_size: int,
+) -> None:
+    """Insert synthetic rows into a table.
+
+    Args:
+        engine: The database engine.
+        table: The table to insert the rows into.
+        count: The number of rows to insert.
+        row_factory: Callable that creates the row for a given index.
+        batch_size: Number of rows to insert per statement.
+    """
+    with engine.begin() as connection:
+        for start in range(0, count, batch_size):
+            rows = [
+                row_factory(i)
+                for i in range(start, min(start + batch_size, count))
+            ]
+            connection.execute(table.insert(), rows)
+
+
+def _populate(
+    engine: Engine, num_step_runs: int, batch_size: int
+) -> List[Select]:
+    """Populate the database and build the queries to benchmark.
+
+    Args:
+        engine: The database engine.
+        num_step_runs: Number of step runs to create.
+        batch_size: Number of rows to insert per statement.
+
+    Returns:
+        The queries to benchmark.
+    """
+    workspace_ids = [uuid4() for _ in range(4)]
+    pipeline_ids = [uuid4() for _ in range(100)]
+    num_runs = max(num_step_runs // 10, 1)
+    run_ids = [uuid4() for _ in range(num_runs)]
+    cache_keys = [uuid4().hex for _ in range(max(num_step_runs // 5, 1))]
+    start = datetime.utcnow() - timedelta(days=365)
+
+    def _run_row(i: int) -> Dict[str, Any]:
+        created = start + timedelta(seconds=i)
+        return {
+            "id": run_ids[i],
+            "created": created,
+            "updated": created,
+            "name": f"run_{i}",
+            "pipeline_id": random.choice(pipeline_ids),
+            "deployment_id": uuid4(),
+            "workspace_id": random.choice(workspace_ids),
+            "orchestrator_run_id": uuid4().hex,
+            "status": random.choice(STATUSES),
+            "pipeline_configuration": "{}",
+            "num_steps": 10,
+            "client_version": "0.38.0",
+        }
+
+    def _step_run_row(i: int) -> Dict[str, Any]:
+        created = start + timedelta(seconds=i)
+        return {
+            "id": uuid4(),
+            "created": created,
+            "updated": created,
+            "name": f"step_{i % 10}",
+            "pipeline_run_id": run_ids[i // 10],
+            "workspace_id": random.choice(workspace_ids),
+            "cache_key": random.choice(cache_keys),
+            "status": random.choice(STATUSES),
+            "entrypoint_name": "step",
+            "parameters": "{}",
+            "step_configuration": "{}",
+        }
+
+    def _build_row(i: int) -> Dict[str, Any]:
+        created = start + timedelta(seconds=i)
+        return {
+            "id": uuid4(),
+            "created": created,
+            "updated": created,
+            "workspace_id": random.choice(workspace_ids),
+            "is_local": False,
+            "contains_code": False,
+            "images": "{}",
+            "checksum": uuid4().hex,
+        }
+
+    _insert_rows(
+        engine, PipelineRunSchema.__table__, num_runs, _run_row, batch_size
+    )
+    _insert_rows(
+        engine,
+        StepRunSchema.__table__,
+        num_step_runs,
+        _step_run_row,
+        batch_size,
+    )
+    _insert_rows(
+        engine,
+        PipelineBuildSchema.__table__,
+        max(num_runs // 10, 1),
+        _build_row,
+        batch_size,
+    )
+
+    return [
+        select(StepRunSchema)
+        .where(StepRunSchema.workspace_id == workspace_ids[0])
+        .where(StepRunSchema.cache_key == cache_keys[0])
+        .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+        .order_by(desc(StepRunSchema.created))
+        .limit(1),
+        select(PipelineRunSchema)
+        .where(PipelineRunSchema.pipeline_id == pipeline_ids[0])
+        .order_by(desc(PipelineRunSchema.created))
+        .limit(20),
+        select(PipelineRunSchema).where(
+            PipelineRunSchema.orchestrator_run_id == uuid4().hex
+        ),
+        select(PipelineBuildSchema).where(
+            PipelineBuildSchema.checksum == uuid4().hex
+        ),
+    ]
+
+
+def _explain(engine: Engine, query: Select) -> List[Tuple[Any, ...]]:
+    """Get the query plan for a query.
+
+    Args:
+        engine: The database engine.
+        query: The query to explain.
+
+    Returns:
+        The rows of the query plan.
+    """
+    prefix = (
+        "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    )
+    compiled = query.compile(
+        dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as connection:
+        return list(connection.execute(text(f"{prefix} {compiled}")))
+
+
+def _time(engine: Engine, query: Select, repetitions: int) -> float:
+    """Measure the median latency of a query.
+
+    Args:
+        engine: The database engine.
+        query: The query to run.
+        repetitions: How often to run the query.
+
+    Returns:
+        The median latency in milliseconds.
+    """
+    durations = []
+    with engine.connect() as connection:
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            connection.execute(query).fetchall()
+            durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def _report(engine: Engine, queries: List[Select], repetitions: int) -> None:
+    """Print query plans and latencies for all queries.
+
+    Args:
+        engine: The database engine.
+        queries: The queries to run.
+        repetitions: How often to run each query.
+    """
+    for query in queries:
+        table = query.get_final_froms()[0].name
+        click.echo(f"\n--- {table}: {query.whereclause}")
+        for row in _explain(engine, query):
+            click.echo(f"    {row}")
+        latency = _time(engine, query, repetitions)
+        click.echo(f"    median latency: {latency:.3f}ms")
+
+
+@click.command()
+@click.option(
+    "--url",
+    default=None,
+    help="Database URL. Defaults to a temporary SQLite database.",
+)
+@click.option("--step-runs", default=1_000_000, help="Number of step runs.")
+@click.option("--batch-size", default=10_000, help="Rows per insert.")
+@click.option("--repetitions", default=20, help="Executions per query.")
+def benchmark(
+    url: str, step_runs: int, batch_size: int, repetitions: int
+) -> None:
+    """Compare lookup queries with and without indexes.
+
+    Args:
+        url: Database URL.
+        step_runs: Number of step runs.
+        batch_size: Rows per insert.
+        repetitions: Executions per query.
+    """
+    tmp_dir = tempfile.mkdtemp()
+    url = url or f"sqlite:///{os.path.join(tmp_dir, 'benchmark.db')}"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+
+    click.echo(f"Populating database with {step_runs} step runs...")
+    start = time.perf_counter()
+    queries = _populate(engine, step_runs, batch_size)
+    click.echo(f"Done in {time.perf_counter() - start:.1f}s.")
+
+    click.echo("\n=== With indexes ===")
+    _report(engine, queries, repetitions)
+
+    indexes = [
+        index
+        for table in (
+            StepRunSchema.__table__,
+            PipelineRunSchema.__table__,
+            PipelineBuildSchema.__table__,
+        )
+        for index in table.indexes
+    ]
+    for index in indexes:
+        index.drop(engine)
+
+    click.echo("\n=== Without indexes ===")
+    _report(engine, queries, repetitions)
+
+    for index in indexes:
+        index.create(engine)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -20,9 +20,8 @@ from types import TracebackType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 from uuid import UUID
 
-from zenml import __version__, analytics
+from zenml import analytics
 from zenml.constants import ENV_ZENML_SERVER, handle_bool_env_var
-from zenml.environment import Environment, get_environment
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
@@ -73,6 +72,10 @@ class AnalyticsContext:
         """
         # Fetch the analytics opt-in setting
         from zenml.config.global_config import GlobalConfiguration
+        from zenml.utils.analytics_utils import (
+            get_analytics_store_info,
+            get_analytics_user_id,
+        )
 
         gc = GlobalConfiguration()
         self.analytics_opt_in = gc.analytics_opt_in
@@ -91,8 +94,7 @@ class AnalyticsContext:
                     self.user_id = auth_context.user.id
             else:
                 # If the code is running on the client, use the default user.
-                default_user = gc.zen_store.get_user()
-                self.user_id = default_user.id
+                self.user_id = get_analytics_user_id(gc.zen_store)
 
             # Fetch the `client_id`
             if self.in_server:
@@ -103,7 +105,7 @@ class AnalyticsContext:
                 self.client_id = gc.user_id
 
             # Fetch the store information including the `server_id`
-            store_info = gc.zen_store.get_store_info()
+            store_info = get_analytics_store_info(gc.zen_store)
 
             self.server_id = store_info.id
             self.deployment_type = store_info.deployment_type
@@ -196,7 +198,10 @@ class AnalyticsContext:
         Returns:
             True if tracking information was sent, False otherwise.
         """
-        from zenml.utils.analytics_utils import AnalyticsEvent
+        from zenml.utils.analytics_utils import (
+            AnalyticsEvent,
+            get_system_properties,
+        )
 
         if properties is None:
             properties = {}
@@ -213,12 +218,9 @@ class AnalyticsContext:
             return False
 
         # add basics
-        properties.update(Environment.get_system_info())
+        properties.update(get_system_properties())
         properties.update(
             {
-                "environment": get_environment(),
-                "python_version": Environment.python_version(),
-                "version": __version__,
                 "client_id": str(self.client_id),
                 "user_id": str(self.user_id),
                 "server_id": str(self.server_id),
@@ -12,14 +12,18 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """The base interface to extend the ZenML artifact store."""
+import os
 import textwrap
 from abc import abstractmethod
+from contextlib import contextmanager
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -38,6 +42,9 @@ from zenml.logger import get_logger
 from zenml.stack import Flavor, StackComponent, StackComponentConfig
 from zenml.utils import io_utils
 
+if TYPE_CHECKING:
+    from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
+
 logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
@@ -107,9 +114,27 @@ def _sanitize_paths(_func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        local_cache_size: Maximum size in bytes of the local disk cache for
+            artifacts loaded from a remote artifact store. Set to 0 to disable
+            the cache.
+        local_cache_path: Local directory in which to store cached
+            artifacts. Defaults to a directory inside the global ZenML
+            configuration directory.
+        deduplicate_artifacts: If `True`, step outputs with the same content
+            as an existing artifact of this artifact store are not saved
+            again. Instead, the new artifact references the data of the
+            existing artifact. This only applies to outputs whose
+            materializer computes a content hash.
+    """
 
     path: str
+    local_cache_size: int = 0
+    local_cache_path: Optional[str] = None
+    deduplicate_artifacts: bool = False
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
 
@@ -186,6 +211,71 @@ class BaseArtifactStore(StackComponent):
         """
         return self.config.path
 
+    @property
+    def local_cache(self) -> Optional["LocalArtifactCache"]:
+        """The local disk cache for artifacts of this artifact store.
+
+        Returns:
+            The local cache or `None` if caching is disabled or the artifact
+            store is not remote.
+        """
+        if self.config.local_cache_size <= 0 or not io_utils.is_remote(
+            self.path
+        ):
+            return None
+
+        from zenml.artifact_stores.local_artifact_cache import (
+            get_local_artifact_cache,
+        )
+        from zenml.config.global_config import GlobalConfiguration
+
+        cache_dir = self.config.local_cache_path or os.path.join(
+            GlobalConfiguration().config_directory,
+            "artifact_cache",
+            str(self.id),
+        )
+        return get_local_artifact_cache(
+            cache_dir=cache_dir, max_size=self.config.local_cache_size
+        )
+
+    @contextmanager
+    def cached_uri(self, uri: str) -> Iterator[str]:
+        """Context manager that provides the URI to load an artifact from.
+
+        If local caching is enabled, the artifact is copied into the local
+        cache (unless it is already cached) and the local path is provided.
+        The cache entry is not evicted before the context exits, so the
+        artifact should be loaded inside the context.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Yields:
+            The local path of the cached artifact, or the original URI if the
+            artifact can't be cached.
+        """
+        cache = self.local_cache
+        if cache is None or not uri.startswith(self.path):
+            yield uri
+            return
+
+        try:
+            local_uri = cache.get(uri) if fileio.isdir(uri) else uri
+        except Exception as e:
+            logger.warning(
+                "Failed to load artifact `%s` from the local cache, falling "
+                "back to loading it from the artifact store: %s",
+                uri,
+                e,
+            )
+            local_uri = uri
+
+        try:
+            yield local_uri
+        finally:
+            if local_uri != uri:
+                cache.release(uri)
+
     # --- User interface ---
     @abstractmethod
     def open(self, name: PathType, mode: str = "r") -> Any:
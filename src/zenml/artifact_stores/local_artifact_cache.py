@@ -0,0 +1,428 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local disk cache for artifacts of remote artifact stores."""
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator
+from uuid import uuid4
+
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+try:
+    import fcntl
+except ImportError:
+    # File locks are not available on Windows. Cache entries are then only
+    # protected against eviction by other threads of the same process.
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+TEMPORARY_ENTRY_PREFIX = ".tmp-"
+LOCK_FILE_SUFFIX = ".lock"
+CACHE_LOCK_FILE = ".cache.lock"
+COPY_MAX_WORKERS = 8
+
+
+def _get_directory_size(path: str) -> int:
+    """Computes the total size of all files in a local directory.
+
+    Args:
+        path: The directory path.
+
+    Returns:
+        The size of all files in the directory in bytes.
+    """
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def _lock_file(
+    file: IO[Any], exclusive: bool = True, blocking: bool = True
+) -> bool:
+    """Locks an open file for other processes.
+
+    The lock is released when the file is closed.
+
+    Args:
+        file: The file to lock.
+        exclusive: Whether to acquire an exclusive or a shared lock.
+        blocking: Whether to wait until the lock can be acquired.
+
+    Returns:
+        Whether the lock was acquired.
+    """
+    if fcntl is None:
+        return True
+
+    operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+    if not blocking:
+        operation |= fcntl.LOCK_NB
+    try:
+        fcntl.flock(file.fileno(), operation)
+    except BlockingIOError:
+        return False
+    return True
+
+
+class LocalArtifactCache:
+    """Read-through disk cache for artifacts stored in remote locations.
+
+    Artifacts are write-once, which means a cached copy of an artifact URI
+    never needs to be invalidated. Cache entries are evicted in least
+    recently used order once the total size of the cache exceeds its maximum
+    size.
+
+    The cache directory can be shared by multiple processes. Entries returned
+    by `get(...)` are leased until they are released and leased entries are
+    never evicted, neither by this nor by other processes. The cache can
+    therefore temporarily exceed its maximum size while entries are in use.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int) -> None:
+        """Initializes the cache and loads the existing cache entries.
+
+        Args:
+            cache_dir: The local directory in which to store the cache
+                entries.
+            max_size: The maximum total size of all cache entries in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_downloaded = 0
+
+        self._lock = threading.Lock()
+        self._fill_locks: Dict[str, threading.Lock] = {}
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._leases: Dict[str, int] = {}
+        self._lease_files: Dict[str, IO[Any]] = {}
+
+        io_utils.create_dir_recursive_if_not_exists(cache_dir)
+        with self._locked():
+            self._load_entries()
+
+    @property
+    def size(self) -> int:
+        """The total size of all cache entries.
+
+        Returns:
+            The total size of all cache entries in bytes.
+        """
+        return sum(self._entries.values())
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Locks the cache for other threads and processes.
+
+        Yields:
+            None.
+        """
+        with self._lock:
+            with open(
+                os.path.join(self.cache_dir, CACHE_LOCK_FILE), "a"
+            ) as lock_file:
+                _lock_file(lock_file)
+                yield
+
+    def _get_temporary_path(self) -> str:
+        """Gets a new temporary path inside the cache directory.
+
+        Returns:
+            The temporary path.
+        """
+        return os.path.join(
+            self.cache_dir, f"{TEMPORARY_ENTRY_PREFIX}{uuid4().hex}"
+        )
+
+    def _load_entries(self) -> None:
+        """Loads the entries of the cache directory in LRU order.
+
+        This method must be called while holding the cache lock.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not os.path.isdir(path):
+                continue
+            if name.startswith(TEMPORARY_ENTRY_PREFIX):
+                # Leftover of a process that died while filling the cache,
+                # unless the process is still filling it.
+                lock_path = path + LOCK_FILE_SUFFIX
+                with open(lock_path, "a") as lock_file:
+                    if not _lock_file(lock_file, blocking=False):
+                        continue
+                    shutil.rmtree(path, ignore_errors=True)
+                os.remove(lock_path)
+            else:
+                entries.append(
+                    (os.path.getmtime(path), name, _get_directory_size(path))
+                )
+
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+
+    def get(self, uri: str) -> str:
+        """Gets the local path of a cached artifact.
+
+        If the artifact is not cached yet, it gets downloaded into the cache
+        first. The cache entry is leased until `release(...)` is called for
+        the same URI, so it doesn't get evicted while it is being used.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Returns:
+            The local path of the cached artifact, or the original URI if the
+            artifact is too big to be cached.
+        """
+        key = hashlib.sha256(uri.encode()).hexdigest()
+        path = os.path.join(self.cache_dir, key)
+
+        with self._lock:
+            fill_lock = self._fill_locks.setdefault(key, threading.Lock())
+
+        # Only a single thread fills each entry, other threads loading the
+        # same artifact wait for it and then hit the cache.
+        with fill_lock:
+            with self._locked():
+                if os.path.isdir(path):
+                    if key not in self._entries:
+                        # Filled by another process using the same directory
+                        self._entries[key] = _get_directory_size(path)
+                    self._entries.move_to_end(key)
+                    self._acquire_lease(key)
+                    self.hits += 1
+                    os.utime(path)
+                    logger.debug("Artifact cache hit for `%s`.", uri)
+                    return path
+                self._entries.pop(key, None)
+                self.misses += 1
+
+            logger.debug("Artifact cache miss for `%s`.", uri)
+            return self._fill(uri=uri, key=key, path=path)
+
+    def release(self, uri: str) -> None:
+        """Releases the lease of a cached artifact.
+
+        Args:
+            uri: The URI of the artifact.
+        """
+        key = hashlib.sha256(uri.encode()).hexdigest()
+        with self._lock:
+            count = self._leases.get(key, 0)
+            if count > 1:
+                self._leases[key] = count - 1
+            elif count == 1:
+                del self._leases[key]
+                self._lease_files.pop(key).close()
+
+    @contextmanager
+    def lease(self, uri: str) -> Iterator[str]:
+        """Context manager that leases a cached artifact.
+
+        Args:
+            uri: The URI of the artifact.
+
+        Yields:
+            The local path of the cached artifact, or the original URI if the
+            artifact is too big to be cached.
+        """
+        path = self.get(uri)
+        try:
+            yield path
+        finally:
+            if path != uri:
+                self.release(uri)
+
+    def _acquire_lease(self, key: str) -> None:
+        """Leases a cache entry.
+
+        A shared file lock on the entry prevents other processes from
+        evicting it. This method must be called while holding the cache
+        lock.
+
+        Args:
+            key: The cache key of the entry.
+        """
+        count = self._leases.get(key, 0)
+        if count == 0:
+            lease_file = open(
+                os.path.join(self.cache_dir, key + LOCK_FILE_SUFFIX), "a"
+            )
+            _lock_file(lease_file, exclusive=False)
+            self._lease_files[key] = lease_file
+        self._leases[key] = count + 1
+
+    def _fill(self, uri: str, key: str, path: str) -> str:
+        """Downloads an artifact into the cache.
+
+        The artifact is first downloaded into a temporary directory which is
+        then renamed, so other processes never see partially filled cache
+        entries.
+
+        Args:
+            uri: The URI of the artifact.
+            key: The cache key of the artifact.
+            path: The local path of the cache entry.
+
+        Returns:
+            The local path of the cached artifact, or the original URI if the
+            artifact is too big to be cached.
+        """
+        # Check the size before downloading, so callers which load the
+        # artifact from the original URI don't download it twice.
+        remote_size = fileio.size(uri)
+        if remote_size is not None and remote_size > self.max_size:
+            self._log_too_big(uri=uri, size=remote_size)
+            return uri
+
+        temporary_path = self._get_temporary_path()
+        lock_path = temporary_path + LOCK_FILE_SUFFIX
+        try:
+            with open(lock_path, "a") as lock_file:
+                # Prevents other processes from deleting the temporary
+                # directory while it is being filled.
+                _lock_file(lock_file)
+                io_utils.copy_dir(
+                    uri, temporary_path, max_workers=COPY_MAX_WORKERS
+                )
+                size = _get_directory_size(temporary_path)
+                self.bytes_downloaded += size
+
+                if size > self.max_size:
+                    self._log_too_big(uri=uri, size=size)
+                    return uri
+
+                with self._locked():
+                    try:
+                        os.rename(temporary_path, path)
+                    except OSError:
+                        # Another process filled the same entry in the
+                        # meantime
+                        if not os.path.isdir(path):
+                            raise
+
+                    self._entries[key] = size
+                    self._entries.move_to_end(key)
+                    self._acquire_lease(key)
+                    self._evict()
+        finally:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+            if os.path.exists(lock_path):
+                os.remove(lock_path)
+
+        return path
+
+    def _log_too_big(self, uri: str, size: int) -> None:
+        """Logs that an artifact is too big to be cached.
+
+        Args:
+            uri: The URI of the artifact.
+            size: The size of the artifact in bytes.
+        """
+        logger.debug(
+            "Not caching artifact `%s` as its size (%d bytes) exceeds the "
+            "cache size of %d bytes.",
+            uri,
+            size,
+            self.max_size,
+        )
+
+    def _evict(self) -> None:
+        """Evicts least recently used entries until the cache fits its size.
+
+        Entries which are leased by this or another process are skipped. This
+        method must be called while holding the cache lock.
+        """
+        total_size = self.size
+        for key in list(self._entries):
+            if total_size <= self.max_size:
+                break
+            if key in self._leases or not self._remove_entry(key):
+                continue
+            total_size -= self._entries.pop(key)
+            self.evictions += 1
+
+    def _remove_entry(self, key: str) -> bool:
+        """Removes a cache entry unless another process leased it.
+
+        This method must be called while holding the cache lock.
+
+        Args:
+            key: The cache key of the entry.
+
+        Returns:
+            Whether the entry was removed.
+        """
+        path = os.path.join(self.cache_dir, key)
+        lock_path = path + LOCK_FILE_SUFFIX
+        with open(lock_path, "a") as lock_file:
+            if not _lock_file(lock_file, blocking=False):
+                return False
+
+            # The entry is renamed first so it's removed atomically. This
+            # fails if files of the entry are still open on Windows.
+            temporary_path = self._get_temporary_path()
+            try:
+                os.rename(path, temporary_path)
+            except FileNotFoundError:
+                # Evicted by another process
+                pass
+            except OSError:
+                return False
+            else:
+                shutil.rmtree(temporary_path, ignore_errors=True)
+
+        os.remove(lock_path)
+        return True
+
+
+_caches: Dict[str, LocalArtifactCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_local_artifact_cache(
+    cache_dir: str, max_size: int
+) -> LocalArtifactCache:
+    """Gets the local artifact cache for a directory.
+
+    Caches are shared between all artifact store instances using the same
+    cache directory, so the hit and miss counts cover the whole process.
+
+    Args:
+        cache_dir: The local cache directory.
+        max_size: The maximum total size of all cache entries in bytes.
+
+    Returns:
+        The cache for the given directory.
+    """
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = LocalArtifactCache(cache_dir=cache_dir, max_size=max_size)
+            _caches[cache_dir] = cache
+        cache.max_size = max_size
+        return cache
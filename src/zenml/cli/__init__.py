@@ -1559,25 +1559,68 @@ zenml hub logs
 ```
 """
 
-from zenml.cli.annotator import *  # noqa
-from zenml.cli.artifact import *  # noqa
-from zenml.cli.base import *  # noqa
-from zenml.cli.code_repository import *  # noqa
-from zenml.cli.config import *  # noqa
-from zenml.cli.example import *  # noqa
-from zenml.cli.feature import *  # noqa
-from zenml.cli.hub import *  # noqa
-from zenml.cli.integration import *  # noqa
-from zenml.cli.served_model import *  # noqa
-from zenml.cli.model import *  # noqa
-from zenml.cli.pipeline import *  # noqa
-from zenml.cli.workspace import *  # noqa
-from zenml.cli.role import *  # noqa
-from zenml.cli.secret import *  # noqa
-from zenml.cli.server import *  # noqa
-from zenml.cli.stack import *  # noqa
-from zenml.cli.stack_components import *  # noqa
-from zenml.cli.stack_recipes import *  # noqa
-from zenml.cli.user_management import *  # noqa
-from zenml.cli.version import *  # noqa
-from zenml.cli.downgrade import *  # noqa
+from importlib import import_module, util
+from typing import Any
+
+from zenml.cli.cli import cli
+from zenml.cli.manifest import COMMAND_MODULES, LAZY_COMMANDS
+
+
+def _get_command_module_attribute(name: str) -> Any:
+    """Gets an attribute that was star-imported from the command modules.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute of the command module with this name.
+
+    Raises:
+        AttributeError: If no command module has an attribute with this name.
+    """
+    # Later modules took precedence when the modules were star-imported
+    for module_name in reversed(COMMAND_MODULES):
+        module = import_module(module_name)
+        if hasattr(module, name):
+            return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily imports attributes of the CLI command modules.
+
+    The command modules are not imported with this package, so `zenml`
+    starts quickly. Names that were previously star-imported from the command
+    modules are still importable from this package. As before, attributes of
+    the command modules take precedence over submodules with the name of a
+    command, e.g. `from zenml.cli import stack` imports the `stack` command
+    group.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The submodule or the attribute of the command module with this name.
+
+    Raises:
+        AttributeError: If no command module has an attribute with this name.
+    """
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    is_submodule = util.find_spec(f"{__name__}.{name}") is not None
+    if is_submodule and name.replace("_", "-") not in LAZY_COMMANDS:
+        return import_module(f"{__name__}.{name}")
+
+    try:
+        value = _get_command_module_attribute(name)
+    except AttributeError:
+        if is_submodule:
+            return import_module(f"{__name__}.{name}")
+        raise
+
+    # Importing the command modules sets their names as attributes of this
+    # package, which would shadow the attribute.
+    globals()[name] = value
+    return value
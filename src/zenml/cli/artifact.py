@@ -12,8 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """CLI functionality to interact with artifacts."""
-from functools import partial
-from typing import Any
+from datetime import timedelta
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import click
@@ -24,7 +24,7 @@ from zenml.client import Client
 from zenml.enums import CliCategories
 from zenml.logger import get_logger
 from zenml.models.artifact_models import ArtifactFilterModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.artifact_gc_utils import collect_artifact_garbage
 
 logger = get_logger(__name__)
 
@@ -132,6 +132,25 @@ def delete_artifact(
     is_flag=True,
     help="Only delete metadata and not the actual artifact.",
 )
+@click.option(
+    "--older-than",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only delete artifacts that were created more than the given "
+    "number of days ago.",
+)
+@click.option(
+    "--orphaned",
+    "-o",
+    is_flag=True,
+    help="Also delete directories of the active artifact store that don't "
+    "belong to any artifact, e.g. outputs of failed steps.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only show what would be deleted.",
+)
 @click.option(
     "--yes",
     "-y",
@@ -139,42 +158,73 @@ def delete_artifact(
     help="Don't ask for confirmation.",
 )
 def prune_artifacts(
-    only_artifact: bool = False, only_metadata: bool = False, yes: bool = False
+    only_artifact: bool = False,
+    only_metadata: bool = False,
+    older_than: Optional[int] = None,
+    orphaned: bool = False,
+    dry_run: bool = False,
+    yes: bool = False,
 ) -> None:
     """Delete all unused artifacts.
 
     Args:
         only_artifact: If set, only delete the artifact but not its metadata.
         only_metadata: If set, only delete metadata and not the actual artifact.
+        older_than: If set, only delete artifacts that were created more than
+            this number of days ago.
+        orphaned: If set, also delete directories of the active artifact
+            store that don't belong to any artifact.
+        dry_run: If set, only show what would be deleted.
         yes: If set, don't ask for confirmation.
     """
     cli_utils.print_active_config()
 
-    client = Client()
-    unused_artifacts = depaginate(
-        partial(client.list_artifacts, only_unused=True)
+    gc_kwargs: Dict[str, Any] = dict(
+        older_than=timedelta(days=older_than)
+        if older_than is not None
+        else None,
+        delete_metadata=not only_artifact,
+        delete_from_artifact_store=not only_metadata,
+        include_orphaned=orphaned,
     )
 
-    if not unused_artifacts:
-        cli_utils.declare("No unused artifacts found.")
-        return
+    if dry_run or not yes:
+        report = collect_artifact_garbage(dry_run=True, **gc_kwargs)
+        if not report.unused_artifact_ids and not report.orphaned_uris:
+            cli_utils.declare("No unused artifacts found.")
+            return
+
+        summary = f"Found {len(report.unused_artifact_ids)} unused artifacts"
+        if orphaned:
+            summary += (
+                f" and {len(report.orphaned_uris)} orphaned artifact "
+                "directories"
+            )
+
+        if dry_run:
+            cli_utils.declare(f"{summary}.")
+            for uri in report.uris:
+                cli_utils.declare(f"Would delete '{uri}'.")
+            return
 
-    if not yes:
         confirmation = cli_utils.confirmation(
-            f"Found {len(unused_artifacts)} unused artifacts. Do you want to "
-            f"delete them?"
+            f"{summary}. Do you want to delete them?"
         )
         if not confirmation:
             cli_utils.declare("Artifact deletion canceled.")
             return
 
-    for unused_artifact in unused_artifacts:
-        try:
-            Client().delete_artifact(
-                artifact_id=unused_artifact.id,
-                delete_metadata=not only_artifact,
-                delete_from_artifact_store=not only_metadata,
-            )
-        except Exception as e:
-            cli_utils.error(str(e))
-    cli_utils.declare("All unused artifacts deleted.")
+    report = collect_artifact_garbage(**gc_kwargs)
+    if not report.unused_artifact_ids and not report.orphaned_uris:
+        cli_utils.declare("No unused artifacts found.")
+        return
+    if report.failed_uris:
+        cli_utils.error(
+            f"Failed to delete {len(report.failed_uris)} directories from "
+            "the artifact store: "
+            + ", ".join(f"'{uri}'" for uri in report.failed_uris)
+        )
+    cli_utils.declare(
+        f"Deleted {len(report.unused_artifact_ids)} unused artifacts and "
+        f"{len(report.uris)} directories from the artifact store."
+    )
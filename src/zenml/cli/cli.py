@@ -14,18 +14,32 @@
 """Core CLI functionality."""
 
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import rich
 from click import Command, Context, formatting
+from click.utils import make_default_short_help
 
 from zenml import __version__
 from zenml.cli.formatter import ZenFormatter
-from zenml.client import Client
+from zenml.cli.manifest import LAZY_COMMANDS, LazyCommand
 from zenml.enums import CliCategories
 from zenml.logger import set_root_verbosity
-from zenml.utils import source_utils
+
+if TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
 
 
 class TagGroup(click.Group):
@@ -62,11 +76,144 @@ class ZenContext(click.Context):
     formatter_class = ZenFormatter
 
 
+class LazyCommandDict(Dict[str, Command]):
+    """Dictionary of commands that loads missing commands on access."""
+
+    def __init__(
+        self,
+        commands: Dict[str, Command],
+        load_command: Callable[[str], None],
+    ) -> None:
+        """Initialize the dictionary.
+
+        Args:
+            commands: The already loaded commands.
+            load_command: Function that loads a command by name.
+        """
+        super().__init__(commands)
+        self._load_command = load_command
+
+    def __missing__(self, cmd_name: str) -> Command:
+        """Loads a command that is accessed but not loaded yet.
+
+        Args:
+            cmd_name: The name of the command.
+
+        Returns:
+            The loaded command.
+
+        Raises:
+            KeyError: If no command with this name exists.
+        """
+        self._load_command(cmd_name)
+        if cmd_name not in self:
+            raise KeyError(cmd_name)
+        return super().__getitem__(cmd_name)
+
+
 class ZenMLCLI(click.Group):
-    """Custom click Group to create a custom format command help output."""
+    """Custom click Group to create a custom format command help output.
+
+    Top-level commands can be registered lazily through a manifest, in which
+    case the modules implementing a command are only imported once the
+    command is used.
+    """
 
     context_class = ZenContext
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, LazyCommand]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the ZenML CLI group.
+
+        Args:
+            *args: Positional arguments for the click group.
+            lazy_commands: Manifest entries of the commands to register
+                lazily.
+            **kwargs: Keyword arguments for the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+        self.commands = LazyCommandDict(
+            self.commands, load_command=self.load_lazy_command
+        )
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        """Lists the names of all commands, including lazy ones.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted command names.
+        """
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        """Gets a command, importing its modules if it is registered lazily.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the command.
+
+        Returns:
+            The command or `None` if no command with this name exists.
+        """
+        self.load_lazy_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def load_lazy_command(self, cmd_name: str) -> None:
+        """Imports the modules of a lazily registered command.
+
+        Importing the modules registers the command and its subcommands.
+
+        Args:
+            cmd_name: The name of the command.
+        """
+        lazy_command = self.lazy_commands.get(cmd_name)
+        if lazy_command and cmd_name not in self.commands:
+            for module in lazy_command.modules:
+                import_module(module)
+
+    def shell_complete(
+        self, ctx: Context, incomplete: str
+    ) -> List["CompletionItem"]:
+        """Completes command names and options.
+
+        Lazy commands are completed without importing them.
+
+        Args:
+            ctx: The click context.
+            incomplete: The value that is being completed.
+
+        Returns:
+            The completion items.
+        """
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for cmd_name in self.list_commands(ctx):
+            if not cmd_name.startswith(incomplete):
+                continue
+
+            if cmd_name in self.commands:
+                cmd = self.commands[cmd_name]
+                if not cmd.hidden:
+                    results.append(
+                        CompletionItem(cmd_name, help=cmd.get_short_help_str())
+                    )
+            elif not self.lazy_commands[cmd_name].hidden:
+                help_ = make_default_short_help(
+                    self.lazy_commands[cmd_name].help
+                )
+                results.append(CompletionItem(cmd_name, help=help_))
+
+        results.extend(Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -99,9 +246,18 @@ class ZenMLCLI(click.Group):
             formatter: The click formatter.
         """
         commands: List[
-            Tuple[CliCategories, str, Union[Command, TagGroup]]
+            Tuple[CliCategories, str, Union[Command, TagGroup, LazyCommand]]
         ] = []
         for subcommand in self.list_commands(ctx):
+            # Don't import lazy commands just to show their help text
+            if subcommand not in self.commands:
+                lazy_command = self.lazy_commands[subcommand]
+                if not lazy_command.hidden:
+                    commands.append(
+                        (lazy_command.tag, subcommand, lazy_command)
+                    )
+                continue
+
             cmd = self.get_command(ctx, subcommand)
             # What is this, the tool lied about a command.  Ignore it
             if cmd is None or cmd.hidden:
@@ -133,7 +289,12 @@ class ZenMLCLI(click.Group):
             )
             rows: List[Tuple[str, str, str]] = []
             for (tag, subcommand, cmd) in commands:
-                help_ = cmd.get_short_help_str(limit=formatter.width)
+                if isinstance(cmd, LazyCommand):
+                    help_ = make_default_short_help(
+                        cmd.help, max_length=formatter.width
+                    )
+                else:
+                    help_ = cmd.get_short_help_str(limit=formatter.width)
                 rows.append((tag.value, subcommand, help_))
             if rows:
                 colored_section_title = (
@@ -143,10 +304,13 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+@click.group(cls=ZenMLCLI, lazy_commands=LAZY_COMMANDS)
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
+    from zenml.client import Client
+    from zenml.utils import source_utils
+
     set_root_verbosity()
     repo_root = Client.find_repository()
     if not repo_root:
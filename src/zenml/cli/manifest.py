@@ -0,0 +1,223 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Manifest of the top-level ZenML CLI commands.
+
+The modules implementing the CLI commands import most of ZenML. The manifest
+lists the name, help text and modules of each top-level command, so the CLI
+can show the available commands without importing any of these modules and
+only imports the modules of the command that gets invoked.
+
+Commands added to the CLI must also be added to this manifest.
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+from zenml.enums import CliCategories, StackComponentType
+
+# Modules that register CLI commands, in the order in which they used to be
+# imported by `zenml.cli`
+COMMAND_MODULES = (
+    "zenml.cli.annotator",
+    "zenml.cli.artifact",
+    "zenml.cli.base",
+    "zenml.cli.code_repository",
+    "zenml.cli.config",
+    "zenml.cli.example",
+    "zenml.cli.feature",
+    "zenml.cli.hub",
+    "zenml.cli.integration",
+    "zenml.cli.served_model",
+    "zenml.cli.model",
+    "zenml.cli.pipeline",
+    "zenml.cli.workspace",
+    "zenml.cli.role",
+    "zenml.cli.secret",
+    "zenml.cli.server",
+    "zenml.cli.stack",
+    "zenml.cli.stack_components",
+    "zenml.cli.stack_recipes",
+    "zenml.cli.user_management",
+    "zenml.cli.version",
+    "zenml.cli.downgrade",
+)
+
+
+class LazyCommand(NamedTuple):
+    """Manifest entry of a top-level CLI command.
+
+    Attributes:
+        modules: The modules that need to be imported to register the command
+            and all its subcommands.
+        help: The help text of the command.
+        tag: The category of the command in the CLI help output.
+        hidden: Whether the command is hidden in the CLI help output.
+    """
+
+    modules: Tuple[str, ...]
+    help: str
+    tag: CliCategories = CliCategories.OTHER_COMMANDS
+    hidden: bool = False
+
+
+def _server_command(help: str) -> LazyCommand:
+    """Creates the manifest entry of a server command.
+
+    Args:
+        help: The help text of the command.
+
+    Returns:
+        The manifest entry.
+    """
+    return LazyCommand(modules=("zenml.cli.server",), help=help)
+
+
+def _stack_component_commands() -> Dict[str, LazyCommand]:
+    """Creates the manifest entries of the stack component commands.
+
+    Returns:
+        The manifest entries.
+    """
+    return {
+        component_type.value.replace("_", "-"): LazyCommand(
+            modules=("zenml.cli.stack_components",),
+            help="Commands to interact with "
+            f"{component_type.plural.replace('_', ' ')}.",
+            tag=CliCategories.STACK_COMPONENTS,
+        )
+        for component_type in StackComponentType
+    }
+
+
+LAZY_COMMANDS: Dict[str, LazyCommand] = {
+    "analytics": LazyCommand(
+        modules=("zenml.cli.config",),
+        help="Analytics for opt-in and opt-out.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "artifact": LazyCommand(
+        modules=("zenml.cli.artifact",),
+        help="List or delete artifacts.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "clean": LazyCommand(
+        modules=("zenml.cli.base",),
+        help="Delete all ZenML metadata, artifacts and stacks.",
+        hidden=True,
+    ),
+    "code-repository": LazyCommand(
+        modules=("zenml.cli.code_repository",),
+        help="Interact with code repositories.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "connect": _server_command("Connect to a remote ZenML server."),
+    "deploy": _server_command("Deploy ZenML in the cloud."),
+    "destroy": _server_command(
+        "Tear down and clean up the cloud ZenML deployment."
+    ),
+    "disconnect": _server_command("Disconnect from a ZenML server."),
+    "down": _server_command("Shut down the local ZenML dashboard."),
+    "downgrade": LazyCommand(
+        modules=("zenml.cli.downgrade",),
+        help="Downgrade zenml version in global config.",
+    ),
+    "example": LazyCommand(
+        modules=("zenml.cli.example",),
+        help="Access all ZenML examples.",
+    ),
+    "go": LazyCommand(
+        modules=("zenml.cli.base",),
+        help="Quickly explore ZenML with this walk-through.",
+    ),
+    "hub": LazyCommand(
+        modules=("zenml.cli.hub",),
+        help="Interact with the ZenML Hub.",
+        tag=CliCategories.HUB,
+    ),
+    "info": LazyCommand(
+        modules=("zenml.cli.base",),
+        help="Show information about the current user setup.",
+        hidden=True,
+    ),
+    "init": LazyCommand(
+        modules=("zenml.cli.base",),
+        help="Initialize a ZenML repository.",
+    ),
+    "integration": LazyCommand(
+        modules=("zenml.cli.integration",),
+        help="Interact with external integrations.",
+        tag=CliCategories.INTEGRATIONS,
+    ),
+    "logging": LazyCommand(
+        modules=("zenml.cli.config",),
+        help="Configuration of logging for ZenML pipelines.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "logs": _server_command(
+        "Show the logs for the local or cloud ZenML server."
+    ),
+    "permission": LazyCommand(
+        modules=("zenml.cli.role",),
+        help="Commands for role management.",
+        tag=CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "pipeline": LazyCommand(
+        modules=("zenml.cli.pipeline",),
+        help="Interact with pipelines, runs and schedules.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "project": LazyCommand(
+        modules=("zenml.cli.workspace",),
+        help="Deprecated commands for project management.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "role": LazyCommand(
+        modules=("zenml.cli.role",),
+        help="Commands for role management.",
+        tag=CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "secret": LazyCommand(
+        modules=("zenml.cli.secret",),
+        help="Create, list, update, or delete secrets.",
+        tag=CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "stack": LazyCommand(
+        modules=("zenml.cli.stack", "zenml.cli.stack_recipes"),
+        help="Stacks to define various environments.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "status": _server_command(
+        "Show information about the current configuration."
+    ),
+    "team": LazyCommand(
+        modules=("zenml.cli.user_management",),
+        help="Commands for team management.",
+        tag=CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "up": _server_command("Start the ZenML dashboard locally."),
+    "user": LazyCommand(
+        modules=("zenml.cli.user_management",),
+        help="Commands for user management.",
+        tag=CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "version": LazyCommand(
+        modules=("zenml.cli.version",),
+        help="Version of ZenML.",
+    ),
+    "workspace": LazyCommand(
+        modules=("zenml.cli.workspace",),
+        help="Commands for workspace management.",
+        tag=CliCategories.MANAGEMENT_TOOLS,
+    ),
+    **_stack_component_commands(),
+}
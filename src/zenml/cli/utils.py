@@ -61,7 +61,7 @@ from zenml.secret import BaseSecretSchema
 from zenml.services import BaseService, ServiceState
 from zenml.stack import StackComponent
 from zenml.stack.stack_component import StackComponentConfig
-from zenml.utils import secret_utils
+from zenml.utils import secret_utils, source_utils
 from zenml.zen_server.deploy import ServerDeployment
 
 logger = get_logger(__name__)
@@ -675,6 +675,7 @@ def install_packages(
         ]
 
     subprocess.check_call(command)
+    source_utils.invalidate_distribution_index()
 
 
 def uninstall_package(package: str) -> None:
@@ -694,6 +695,7 @@ def uninstall_package(package: str) -> None:
             package,
         ]
     )
+    source_utils.invalidate_distribution_index()
 
 
 def pretty_print_secret(
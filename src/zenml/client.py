@@ -23,6 +23,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -50,6 +51,7 @@ from zenml.constants import (
 )
 from zenml.enums import (
     ArtifactType,
+    GenericFilterOps,
     LogicalOperators,
     PermissionType,
     SecretScope,
@@ -132,10 +134,10 @@ from zenml.models.schedule_model import (
     ScheduleFilterModel,
     ScheduleResponseModel,
 )
-from zenml.utils import io_utils, source_utils
+from zenml.utils import io_utils, secret_utils, source_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, event_handler, track
 from zenml.utils.filesync_model import FileSyncModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import iter_items, iter_pages
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -3242,6 +3244,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        after: Optional[str] = None,
+        skip_count: bool = False,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -3268,6 +3272,9 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            after: Cursor returned as `next_cursor` of a previous page. If
+                given, the page starts right after the last item of that page.
+            skip_count: Whether to skip counting the total amount of items.
             id: The id of the runs to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -3295,6 +3302,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            after=after,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3362,6 +3371,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        after: Optional[str] = None,
+        skip_count: bool = False,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -3385,6 +3396,9 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            after: Cursor returned as `next_cursor` of a previous page. If
+                given, the page starts right after the last item of that page.
+            skip_count: Whether to skip counting the total amount of items.
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -3409,6 +3423,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            after=after,
+            skip_count=skip_count,
             id=id,
             entrypoint_name=entrypoint_name,
             code_hash=code_hash,
@@ -3451,6 +3467,8 @@ class Client(metaclass=ClientMetaClass):
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
         logical_operator: LogicalOperators = LogicalOperators.AND,
+        after: Optional[str] = None,
+        skip_count: bool = False,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -3462,6 +3480,7 @@ class Client(metaclass=ClientMetaClass):
         materializer: Optional[str] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        content_hash: Optional[str] = None,
         only_unused: Optional[bool] = False,
     ) -> Page[ArtifactResponseModel]:
         """Get all artifacts.
@@ -3471,6 +3490,9 @@ class Client(metaclass=ClientMetaClass):
             page: The page of items
             size: The maximum size of all pages
             logical_operator: Which logical operator to use [and, or]
+            after: Cursor returned as `next_cursor` of a previous page. If
+                given, the page starts right after the last item of that page.
+            skip_count: Whether to skip counting the total amount of items.
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -3482,6 +3504,7 @@ class Client(metaclass=ClientMetaClass):
             materializer: The materializer of the artifact to filter by.
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
+            content_hash: The content hash of the artifact to filter by.
             only_unused: Only return artifacts that are not used in any runs.
 
         Returns:
@@ -3492,6 +3515,8 @@ class Client(metaclass=ClientMetaClass):
             page=page,
             size=size,
             logical_operator=logical_operator,
+            after=after,
+            skip_count=skip_count,
             id=id,
             created=created,
             updated=updated,
@@ -3503,6 +3528,7 @@ class Client(metaclass=ClientMetaClass):
             materializer=materializer,
             workspace_id=workspace_id,
             user_id=user_id,
+            content_hash=content_hash,
             only_unused=only_unused,
         )
         artifact_filter_model.set_scope_workspace(self.active_workspace.id)
@@ -3568,6 +3594,13 @@ class Client(metaclass=ClientMetaClass):
                 component_type=StackComponentType.ARTIFACT_STORE,
                 name_id_or_prefix=artifact.artifact_store_id,
             )
+            if self._is_artifact_data_shared(artifact):
+                logger.info(
+                    f"Not deleting artifact '{artifact.uri}' from the "
+                    "artifact store because other artifacts with the same "
+                    "content still reference it."
+                )
+                return
             artifact_store = StackComponent.from_model(artifact_store_model)
             assert isinstance(artifact_store, BaseArtifactStore)
             artifact_store.rmtree(artifact.uri)
@@ -3585,6 +3618,34 @@ class Client(metaclass=ClientMetaClass):
                 f"Deleted artifact '{artifact.uri}' from the artifact store."
             )
 
+    def _is_artifact_data_shared(
+        self, artifact: ArtifactResponseModel
+    ) -> bool:
+        """Checks whether other artifacts reference the data of an artifact.
+
+        Artifact stores that deduplicate artifacts store the data of
+        artifacts with the same content only once, so all these artifacts
+        share the same URI.
+
+        Args:
+            artifact: The artifact to check.
+
+        Returns:
+            Whether other artifacts reference the data of the artifact.
+        """
+        if not artifact.content_hash:
+            # Only artifacts with a content hash are deduplicated.
+            return False
+
+        artifacts = self.zen_store.list_artifacts(
+            ArtifactFilterModel(
+                artifact_store_id=artifact.artifact_store_id,
+                content_hash=artifact.content_hash,
+                uri=f"{GenericFilterOps.EQUALS.value}:{artifact.uri}",
+            )
+        )
+        return any(other.id != artifact.id for other in artifacts.items)
+
     def _delete_artifact_metadata(
         self, artifact: ArtifactResponseModel
     ) -> None:
@@ -3596,15 +3657,14 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact is still used in any runs.
         """
-        if artifact not in depaginate(
-            partial(self.list_artifacts, only_unused=True)
-        ):
+        # The store checks whether the artifact is used and deletes it in a
+        # single operation.
+        if not self.zen_store.delete_unused_artifacts([artifact.id]):
             raise ValueError(
                 "The metadata of artifacts that are used in runs cannot be "
                 "deleted. Please delete all runs that use this artifact "
                 "first."
             )
-        self.zen_store.delete_artifact(artifact.id)
         logger.info(f"Deleted metadata of artifact '{artifact.uri}'.")
 
     # ----------------
@@ -3642,8 +3702,6 @@ class Client(metaclass=ClientMetaClass):
             ValueError: If not exactly one of either `pipeline_run_id`,
                 `step_run_id`, or `artifact_id` is provided.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
         if not (pipeline_run_id or step_run_id or artifact_id):
             raise ValueError(
                 "Cannot create run metadata without linking it to any entity. "
@@ -3662,6 +3720,47 @@ class Client(metaclass=ClientMetaClass):
             )
 
         created_metadata: Dict[str, RunMetadataResponseModel] = {}
+        for run_metadata in self.build_run_metadata_requests(
+            metadata=metadata,
+            pipeline_run_id=pipeline_run_id,
+            step_run_id=step_run_id,
+            artifact_id=artifact_id,
+            stack_component_id=stack_component_id,
+        ):
+            metadata_model = self.zen_store.create_run_metadata(run_metadata)
+            created_metadata[run_metadata.key] = metadata_model
+        return created_metadata
+
+    def build_run_metadata_requests(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        pipeline_run_id: Optional[UUID] = None,
+        step_run_id: Optional[UUID] = None,
+        artifact_id: Optional[UUID] = None,
+        stack_component_id: Optional[UUID] = None,
+    ) -> List[RunMetadataRequestModel]:
+        """Builds the requests to create run metadata.
+
+        Metadata values that are too large or not of a supported type are
+        skipped with a warning.
+
+        Args:
+            metadata: The metadata as a dictionary of key-value pairs.
+            pipeline_run_id: The ID of the pipeline run during which the
+                metadata was produced.
+            step_run_id: The ID of the step run during which the metadata was
+                produced.
+            artifact_id: The ID of the artifact for which the metadata was
+                produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+
+        Returns:
+            The run metadata requests.
+        """
+        from zenml.metadata.metadata_types import get_metadata_type
+
+        run_metadata_requests = []
         for key, value in metadata.items():
 
             # Skip metadata that is too large to be stored in the database.
@@ -3682,20 +3781,20 @@ class Client(metaclass=ClientMetaClass):
                 )
                 continue
 
-            run_metadata = RunMetadataRequestModel(
-                workspace=self.active_workspace.id,
-                user=self.active_user.id,
-                pipeline_run_id=pipeline_run_id,
-                step_run_id=step_run_id,
-                artifact_id=artifact_id,
-                stack_component_id=stack_component_id,
-                key=key,
-                value=value,
-                type=metadata_type,
+            run_metadata_requests.append(
+                RunMetadataRequestModel(
+                    workspace=self.active_workspace.id,
+                    user=self.active_user.id,
+                    pipeline_run_id=pipeline_run_id,
+                    step_run_id=step_run_id,
+                    artifact_id=artifact_id,
+                    stack_component_id=stack_component_id,
+                    key=key,
+                    value=value,
+                    type=metadata_type,
+                )
             )
-            metadata_model = self.zen_store.create_run_metadata(run_metadata)
-            created_metadata[key] = metadata_model
-        return created_metadata
+        return run_metadata_requests
 
     def list_run_metadata(
         self,
@@ -3793,13 +3892,17 @@ class Client(metaclass=ClientMetaClass):
             workspace=self.active_workspace.id,
         )
         try:
-            return self.zen_store.create_secret(secret=create_secret_request)
+            secret = self.zen_store.create_secret(secret=create_secret_request)
         except NotImplementedError:
             raise NotImplementedError(
                 "centralized secrets management is not supported or explicitly "
                 "disabled in the target ZenML deployment."
             )
 
+        # The secret might have been cached as missing before
+        secret_utils.refresh_secret_cache(name)
+        return secret
+
     def get_secret(
         self,
         name_id_or_prefix: Union[str, UUID],
@@ -4121,9 +4224,13 @@ class Client(metaclass=ClientMetaClass):
         if values:
             secret_update.values = values
 
-        return Client().zen_store.update_secret(
+        updated_secret = Client().zen_store.update_secret(
             secret_id=secret.id, secret_update=secret_update
         )
+        secret_utils.refresh_secret_cache(secret.name)
+        if updated_secret.name != secret.name:
+            secret_utils.refresh_secret_cache(updated_secret.name)
+        return updated_secret
 
     def delete_secret(
         self, name_id_or_prefix: str, scope: Optional[SecretScope] = None
@@ -4143,6 +4250,7 @@ class Client(metaclass=ClientMetaClass):
         )
 
         self.zen_store.delete_secret(secret_id=secret.id)
+        secret_utils.refresh_secret_cache(secret.name)
 
     # .-------------------.
     # | CODE REPOSITORIES |
@@ -4308,6 +4416,67 @@ class Client(metaclass=ClientMetaClass):
         )
         self.zen_store.delete_code_repository(code_repository_id=repo.id)
 
+    # ---- utility pagination functions -----
+
+    @staticmethod
+    def iter_pages(
+        list_method: Callable[..., Page[AnyResponseModel]],
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> Iterator[Page[AnyResponseModel]]:
+        """Lazily iterate over all pages of a list method.
+
+        Usage example:
+        ```python
+        client = Client()
+        for page in client.iter_pages(client.list_artifacts, prefetch=4):
+            ...
+        ```
+
+        Args:
+            list_method: The list method of the client, e.g.
+                `client.list_artifacts`.
+            prefetch: The number of pages to fetch concurrently ahead of the
+                page that is currently being processed.
+            **kwargs: Filter arguments passed to the list method.
+
+        Returns:
+            An iterator over all pages.
+        """
+        return iter_pages(partial(list_method, **kwargs), prefetch=prefetch)
+
+    @staticmethod
+    def iter_items(
+        list_method: Callable[..., Page[AnyResponseModel]],
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> Iterator[AnyResponseModel]:
+        """Lazily iterate over all items returned by a list method.
+
+        Only the pages that are currently being processed or prefetched are
+        held in memory.
+
+        Usage example:
+        ```python
+        client = Client()
+        for artifact in client.iter_items(
+            client.list_artifacts, prefetch=4, only_unused=True
+        ):
+            ...
+        ```
+
+        Args:
+            list_method: The list method of the client, e.g.
+                `client.list_artifacts`.
+            prefetch: The number of pages to fetch concurrently ahead of the
+                page that is currently being processed.
+            **kwargs: Filter arguments passed to the list method.
+
+        Returns:
+            An iterator over all items.
+        """
+        return iter_items(partial(list_method, **kwargs), prefetch=prefetch)
+
     # ---- utility prefix matching get functions -----
 
     @staticmethod
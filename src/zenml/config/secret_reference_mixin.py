@@ -19,6 +19,9 @@ from pydantic import BaseModel
 from zenml.logger import get_logger
 from zenml.utils import secret_utils
 
+if TYPE_CHECKING:
+    from zenml.secrets_managers import BaseSecretsManager
+
 logger = get_logger(__name__)
 
 
@@ -111,32 +114,42 @@ class SecretReferenceMixin(BaseModel):
         secret_ref = secret_utils.parse_secret_reference(value)
 
         # Try to resolve the secret using the secret store first
-        try:
-            store_secret = Client().get_secret_by_name_and_scope(
-                name=secret_ref.name,
-            )
-        except (KeyError, NotImplementedError):
-            pass
-        else:
-            if secret_ref.key in store_secret.values:
-                return store_secret.secret_values[secret_ref.key]
+        store_secret_values = secret_utils.get_store_secret_values(
+            secret_ref.name
+        )
+        if store_secret_values is not None:
+            if secret_ref.key in store_secret_values:
+                return store_secret_values[secret_ref.key]
             else:
                 raise KeyError(
                     f"Failed to resolve secret reference for attribute {key}: "
                     f"The secret {secret_ref.name} does not contain a value "
                     f"for key {secret_ref.key}. Available keys: "
-                    f"{set(store_secret.values)}."
+                    f"{set(store_secret_values)}."
                 )
 
-        secrets_manager = Client().active_stack.secrets_manager
-        if not secrets_manager:
-            raise RuntimeError(
-                f"Failed to resolve secret reference for attribute {key}: "
-                "The active stack does not have a secrets manager."
-            )
+        def _get_secrets_manager() -> "BaseSecretsManager":
+            """Gets the secrets manager of the active stack.
+
+            Returns:
+                The secrets manager.
+
+            Raises:
+                RuntimeError: If the active stack is missing a secrets
+                    manager.
+            """
+            secrets_manager = Client().active_stack.secrets_manager
+            if not secrets_manager:
+                raise RuntimeError(
+                    f"Failed to resolve secret reference for attribute {key}: "
+                    "The active stack does not have a secrets manager."
+                )
+            return secrets_manager
 
         try:
-            secret = secrets_manager.get_secret(secret_ref.name)
+            secret_values = secret_utils.get_secrets_manager_secret_values(
+                secret_ref.name, get_secrets_manager=_get_secrets_manager
+            )
         except KeyError:
             raise KeyError(
                 f"Failed to resolve secret reference for attribute {key}: "
@@ -144,12 +157,12 @@ class SecretReferenceMixin(BaseModel):
             )
 
         try:
-            secret_value = secret.content[secret_ref.key]
+            secret_value = secret_values[secret_ref.key]
         except KeyError:
             raise KeyError(
                 f"Failed to resolve secret reference for attribute {key}: "
                 f"The secret {secret_ref.name} does not contain a value for key "
-                f"{secret_ref.key}. Available keys: {set(secret.content)}."
+                f"{secret_ref.key}. Available keys: {set(secret_values)}."
             )
 
         return str(secret_value)
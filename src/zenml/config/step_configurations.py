@@ -67,6 +67,7 @@ class StepConfigurationUpdate(StrictBaseModel):
 
     name: Optional[str] = None
     enable_cache: Optional[bool] = None
+    content_addressed_cache: Optional[bool] = None
     enable_artifact_metadata: Optional[bool] = None
     enable_artifact_visualization: Optional[bool] = None
     step_operator: Optional[str] = None
@@ -95,6 +95,21 @@ ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT = "ZENML_SKIP_IMAGE_BUILDER_DEFAULT"
 ENV_ZENML_REQUIRES_CODE_DOWNLOAD = "ZENML_REQUIRES_CODE_DOWNLOAD"
 ENV_ZENML_SERVER = "ZENML_SERVER"
 ENV_ZENML_HUB_URL = "ZENML_HUB_URL"
+ENV_ZENML_ARTIFACT_METADATA_SAMPLE_SIZE = "ZENML_ARTIFACT_METADATA_SAMPLE_SIZE"
+ENV_ZENML_ARTIFACT_METADATA_MAX_SIZE = "ZENML_ARTIFACT_METADATA_MAX_SIZE"
+ENV_ZENML_STEP_OUTPUT_MAX_WORKERS = "ZENML_STEP_OUTPUT_MAX_WORKERS"
+ENV_ZENML_HUGGINGFACE_DATASETS_CACHE_SIZE = (
+    "ZENML_HUGGINGFACE_DATASETS_CACHE_SIZE"
+)
+ENV_ZENML_SERVER_AUTH_CACHE_TTL = "ZENML_SERVER_AUTH_CACHE_TTL"
+ENV_ZENML_SERVER_AUTH_CACHE_SIZE = "ZENML_SERVER_AUTH_CACHE_SIZE"
+ENV_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE = (
+    "ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE"
+)
+ENV_ZENML_SECRET_CACHE_TTL = "ZENML_SECRET_CACHE_TTL"
+ENV_ZENML_SECRET_CACHE_SIZE = "ZENML_SECRET_CACHE_SIZE"
+ENV_ZENML_ANALYTICS_QUEUE_SIZE = "ZENML_ANALYTICS_QUEUE_SIZE"
+ENV_ZENML_COMPUTE_CONTENT_HASH = "ZENML_COMPUTE_CONTENT_HASH"
 
 
 # Logging variables
@@ -157,6 +172,13 @@ DISABLE_CLIENT_SERVER_MISMATCH_WARNING = handle_bool_env_var(
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING, default=False
 )
 
+# Whether to compute the content hash of all step outputs. By default, it is
+# only computed for outputs that are deduplicated or consumed by steps with
+# content-addressed caching.
+COMPUTE_CONTENT_HASH = handle_bool_env_var(
+    ENV_ZENML_COMPUTE_CONTENT_HASH, default=False
+)
+
 # Services
 DEFAULT_SERVICE_START_STOP_TIMEOUT = 60
 DEFAULT_LOCAL_SERVICE_IP_ADDRESS = "127.0.0.1"
@@ -207,6 +229,8 @@ INFO = "/info"
 VERSION_1 = "/v1"
 STATUS = "/status"
 GET_OR_CREATE = "/get-or-create"
+BATCH = "/batch"
+PREPARE = "/prepare"
 SECRETS = "/secrets"
 VISUALIZE = "/visualize"
 CODE_REPOSITORIES = "/code_repositories"
@@ -234,6 +258,60 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Artifact metadata and visualization extraction: Expensive statistics of
+# artifacts with more rows/elements than the sample size are computed on a
+# random sample, and are skipped entirely above the maximum size (0 = no limit)
+ARTIFACT_METADATA_SAMPLE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_ARTIFACT_METADATA_SAMPLE_SIZE, default=100000
+)
+ARTIFACT_METADATA_MAX_SIZE: int = handle_int_env_var(
+    ENV_ZENML_ARTIFACT_METADATA_MAX_SIZE, default=0
+)
+
+# Maximum number of threads used to store the outputs of a step concurrently.
+# Materializers are not guaranteed to be thread-safe, so the outputs are
+# stored one after the other unless this is increased.
+STEP_OUTPUT_MAX_WORKERS: int = handle_int_env_var(
+    ENV_ZENML_STEP_OUTPUT_MAX_WORKERS, default=1
+)
+
+# Maximum size in bytes of the local disk cache for Huggingface datasets
+# loaded from remote artifact stores (0 = no cache)
+HUGGINGFACE_DATASETS_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_HUGGINGFACE_DATASETS_CACHE_SIZE, default=50 * 1024**3
+)
+
+# Number of seconds for which the ZenML server caches the authenticated user
+# of an access token (0 = no cache) and maximum number of cached tokens
+SERVER_AUTH_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SERVER_AUTH_CACHE_TTL, default=30
+)
+SERVER_AUTH_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SERVER_AUTH_CACHE_SIZE, default=1000
+)
+
+# Maximum size in bytes to which the ZenML server decompresses gzip-encoded
+# request bodies. Larger requests are rejected.
+SERVER_MAX_DECOMPRESSED_REQUEST_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE, default=100 * 1024**2
+)
+
+# Number of seconds for which the values of secrets referenced by stack
+# components are cached in each process (0 = no cache) and maximum number of
+# cached secrets
+SECRET_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SECRET_CACHE_TTL, default=60
+)
+SECRET_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SECRET_CACHE_SIZE, default=1000
+)
+
+# Maximum number of analytics events waiting to be sent in the background
+# (0 = send analytics events synchronously)
+ANALYTICS_QUEUE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_ANALYTICS_QUEUE_SIZE, default=1000
+)
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
@@ -13,7 +13,9 @@
 #  permissions and limitations under the License.
 """Implementation of the Huggingface datasets materializer."""
 
+import atexit
 import os
+import shutil
 from collections import defaultdict
 from tempfile import TemporaryDirectory, mkdtemp
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, Union
@@ -21,8 +23,13 @@ from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, Union
 from datasets import Dataset, load_from_disk
 from datasets.dataset_dict import DatasetDict
 
+from zenml.constants import (
+    ENV_ZENML_HUGGINGFACE_DATASETS_CACHE_SIZE,
+    HUGGINGFACE_DATASETS_CACHE_SIZE,
+)
 from zenml.enums import ArtifactType
 from zenml.io import fileio
+from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
 from zenml.utils import io_utils
@@ -30,7 +37,53 @@ from zenml.utils import io_utils
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
 
+logger = get_logger(__name__)
+
 DEFAULT_DATASET_DIR = "hf_datasets"
+COPY_MAX_WORKERS = 8
+
+
+def _make_temporary_directory() -> str:
+    """Creates a temporary directory which is deleted when the process exits.
+
+    The files of loaded datasets are memory-mapped, so they can only be
+    deleted once the process exits.
+
+    Returns:
+        The path of the temporary directory.
+    """
+    temp_dir = mkdtemp(prefix="zenml-hf-dataset-")
+    atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+    return temp_dir
+
+
+def _link_to_temporary_directory(source_dir: str) -> str:
+    """Mirrors a local directory in a temporary directory using symlinks.
+
+    Args:
+        source_dir: The local directory to mirror.
+
+    Returns:
+        The path of a temporary directory with the same structure as the
+        source directory, in which every file is a symlink to the respective
+        file of the source directory.
+    """
+    target_dir = _make_temporary_directory()
+    for root, dirs, files in os.walk(source_dir):
+        target_root = os.path.join(
+            target_dir, os.path.relpath(root, source_dir)
+        )
+        for dir_ in dirs:
+            os.makedirs(os.path.join(target_root, dir_), exist_ok=True)
+        for file in files:
+            source_file = os.path.abspath(os.path.join(root, file))
+            target_file = os.path.join(target_root, file)
+            try:
+                os.symlink(source_file, target_file)
+            except OSError:
+                # Creating symlinks requires special privileges on Windows
+                shutil.copy2(source_file, target_file)
+    return target_dir
 
 
 class HFDatasetMaterializer(BaseMaterializer):
@@ -46,18 +99,68 @@ class HFDatasetMaterializer(BaseMaterializer):
     ) -> Union[Dataset, DatasetDict]:
         """Reads Dataset.
 
+        The Arrow files of the dataset are memory-mapped from a local copy of
+        the artifact, which is either the artifact itself (for local artifact
+        stores), an entry of a local cache shared by all loads or a temporary
+        copy. Methods like `Dataset.map(...)` write their cache files next to
+        the memory-mapped files, so shared copies are loaded through a
+        temporary directory of symlinks which keeps them unchanged.
+
         Args:
             data_type: The type of the dataset to read.
 
         Returns:
             The dataset read from the specified dir.
         """
-        temp_dir = mkdtemp()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            temp_dir,
+        local_uri, is_shared = self._get_local_uri()
+        dataset_path = os.path.join(local_uri, DEFAULT_DATASET_DIR)
+        if is_shared:
+            dataset_path = _link_to_temporary_directory(dataset_path)
+        return load_from_disk(dataset_path)
+
+    def _get_local_uri(self) -> Tuple[str, bool]:
+        """Gets a local copy of the artifact.
+
+        Returns:
+            The local path of the artifact and whether this path is shared
+            with other loads of the artifact.
+        """
+        if not io_utils.is_remote(self.uri):
+            return self.uri, True
+
+        # Datasets which don't fit into the cache are copied into a temporary
+        # directory instead, so the size is checked before downloading them.
+        size = fileio.size(self.uri)
+        if size is not None and size <= HUGGINGFACE_DATASETS_CACHE_SIZE:
+            from zenml.artifact_stores.local_artifact_cache import (
+                get_local_artifact_cache,
+            )
+            from zenml.config.global_config import GlobalConfiguration
+
+            cache = get_local_artifact_cache(
+                cache_dir=os.path.join(
+                    GlobalConfiguration().config_directory,
+                    "artifact_cache",
+                    "huggingface_datasets",
+                ),
+                max_size=HUGGINGFACE_DATASETS_CACHE_SIZE,
+            )
+            # The files of the dataset are memory-mapped, so the cache entry
+            # stays leased until the process exits.
+            local_uri = cache.get(self.uri)
+            if local_uri != self.uri:
+                return local_uri, True
+
+        logger.warning(
+            "Unable to cache the dataset stored at `%s` locally, copying it "
+            "into a temporary directory instead. Increase the "
+            "`%s` environment variable to cache bigger datasets.",
+            self.uri,
+            ENV_ZENML_HUGGINGFACE_DATASETS_CACHE_SIZE,
         )
-        return load_from_disk(temp_dir)
+        temp_dir = _make_temporary_directory()
+        io_utils.copy_dir(self.uri, temp_dir, max_workers=COPY_MAX_WORKERS)
+        return temp_dir, False
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
@@ -65,16 +168,15 @@ class HFDatasetMaterializer(BaseMaterializer):
         Args:
             ds: The Dataset to write.
         """
-        temp_dir = TemporaryDirectory()
-        path = os.path.join(temp_dir.name, DEFAULT_DATASET_DIR)
-        try:
+        path = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        if not io_utils.is_remote(path):
             ds.save_to_disk(path)
-            io_utils.copy_dir(
-                path,
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            )
-        finally:
-            fileio.rmtree(temp_dir.name)
+            return
+
+        with TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, DEFAULT_DATASET_DIR)
+            ds.save_to_disk(temp_path)
+            io_utils.copy_dir(temp_path, path, max_workers=COPY_MAX_WORKERS)
 
     def extract_metadata(
         self, ds: Union[Dataset, DatasetDict]
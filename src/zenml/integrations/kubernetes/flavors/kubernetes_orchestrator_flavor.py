@@ -15,7 +15,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
-from pydantic import root_validator
+from pydantic import PositiveInt, root_validator
 
 from zenml.config.base_settings import BaseSettings
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -46,6 +46,12 @@ class KubernetesOrchestratorSettings(BaseSettings):
             orchestrator pod. If not provided, a new service account with "edit"
             permissions will be created.
         pod_settings: Pod settings to apply.
+        max_parallelism: Maximum number of step pods to run at the same time.
+            If not set, the limit depends on the number of CPUs of the
+            orchestrator pod.
+        fail_fast: If `True`, no new step pods are started once a step
+            failed. Otherwise, all steps that don't depend on the failed step
+            keep running.
     """
 
     synchronous: bool = False
@@ -54,6 +60,8 @@ class KubernetesOrchestratorSettings(BaseSettings):
     timeout: int = 0
     service_account_name: Optional[str] = None
     pod_settings: Optional[KubernetesPodSettings] = None
+    max_parallelism: Optional[PositiveInt] = None
+    fail_fast: bool = False
 
 
 class KubernetesOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
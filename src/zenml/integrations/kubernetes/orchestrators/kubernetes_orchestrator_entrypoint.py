@@ -34,7 +34,7 @@ from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
 from zenml.logger import get_logger
-from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators.dag_runner import FailurePolicy, ThreadedDagRunner
 from zenml.orchestrators.utils import get_config_environment_vars
 
 logger = get_logger(__name__)
@@ -141,7 +141,19 @@ def main() -> None:
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    pipeline_settings = KubernetesOrchestratorSettings.parse_obj(
+        deployment_config.pipeline_configuration.settings.get(
+            "orchestrator.kubernetes", {}
+        )
+    )
+    ThreadedDagRunner(
+        dag=pipeline_dag,
+        run_fn=run_step_on_kubernetes,
+        max_parallelism=pipeline_settings.max_parallelism,
+        failure_policy=FailurePolicy.FAIL_FAST
+        if pipeline_settings.fail_fast
+        else FailurePolicy.CONTINUE,
+    ).run()
 
     logger.info("Orchestration pod completed.")
 
@@ -23,6 +23,8 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def _get_filesystem(path: "PathType") -> Type["BaseFilesystem"]:
     """Returns a filesystem class for a given path from the registry.
@@ -64,18 +66,37 @@ def open(path: "PathType", mode: str = "r") -> Any:  # noqa
     return _get_filesystem(path).open(path, mode=mode)
 
 
-def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
+def copy(
+    src: "PathType",
+    dst: "PathType",
+    overwrite: bool = False,
+    chunk_size: int = DEFAULT_COPY_CHUNK_SIZE,
+) -> None:
     """Copy a file from the source to the destination.
 
+    If source and destination are on different filesystems, the file is
+    streamed in chunks so the memory usage is bounded by the chunk size
+    instead of the file size. Remote filesystems that buffer their writes
+    upload these chunks as parts of a multipart upload.
+
     Args:
         src: The path of the file to copy.
         dst: The path to copy the source file to.
         overwrite: Whether to overwrite the destination file if it exists.
+        chunk_size: The maximum number of bytes to read and write at once
+            when copying between different filesystems.
 
     Raises:
         FileExistsError: If a file already exists at the destination and
             `overwrite` is not set to `True`.
+        ValueError: If the chunk size is not positive.
     """
+    if chunk_size <= 0:
+        raise ValueError(
+            f"Invalid chunk size {chunk_size}, the chunk size must be "
+            "positive."
+        )
+
     src_fs = _get_filesystem(src)
     dst_fs = _get_filesystem(dst)
     if src_fs is dst_fs:
@@ -86,11 +107,12 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        with open(src, mode="rb") as source, open(dst, mode="wb") as target:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                target.write(chunk)
 
 
 def exists(path: "PathType") -> bool:
@@ -14,7 +14,7 @@
 """Metaclass implementation for registering ZenML BaseMaterializer subclasses."""
 
 import inspect
-from typing import Any, ClassVar, Dict, Tuple, Type, cast
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type, cast
 
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.exceptions import MaterializerInterfaceError
@@ -198,6 +198,31 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         # Optionally, extract some metadata from `data` for ZenML to store.
         return {}
 
+    def compute_content_hash(self, data: Any) -> Optional[str]:
+        """Computes a digest of the content of the given data.
+
+        The digest is stored alongside the artifact and used by steps with
+        content-addressed caching enabled: Two artifacts with the same
+        digest are considered to be identical, even if they were produced by
+        different step runs. The digest must therefore only depend on the
+        content of the data and should be cheap to compute compared to
+        saving the data.
+
+        Example:
+        ```
+        return hashlib.sha256(data.encode()).hexdigest()
+        ```
+
+        Args:
+            data: The data to compute the digest of.
+
+        Returns:
+            The content digest, or `None` if the materializer doesn't support
+            computing a digest for the data.
+        """
+        # Optionally, compute a digest of `data` for content-based caching.
+        return None
+
     # ================
     # Internal Methods
     # ================
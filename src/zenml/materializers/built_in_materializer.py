@@ -13,25 +13,34 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import hashlib
+import json
 import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
-    Iterable,
     List,
+    Optional,
+    Set,
     Tuple,
     Type,
     Union,
 )
+from uuid import uuid4
 
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.materializer_registry import materializer_registry
-from zenml.utils import source_utils, yaml_utils
+from zenml.utils import io_utils, source_utils, yaml_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -40,12 +49,20 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+PACKED_FILENAME_TEMPLATE = "packed_{}.bin"
 BASIC_TYPES = (
     bool,
     float,
     int,
     str,
 )  # complex/bytes are not JSON serializable
+# Non-serializable containers store JSON-serializable elements of these types
+# directly in their metadata file
+JSON_ELEMENT_TYPES = (*BASIC_TYPES, dict, list, set, tuple)
+# Elements of non-serializable containers up to this size (in bytes) are
+# packed into a single file per element type
+PACKED_ELEMENT_MAX_SIZE = 1024 * 1024
+ELEMENT_MAX_WORKERS = 8
 
 
 class BuiltInMaterializer(BaseMaterializer):
@@ -109,6 +126,21 @@ class BuiltInMaterializer(BaseMaterializer):
 
         return {}
 
+    def compute_content_hash(
+        self, data: Union[bool, float, int, str]
+    ) -> Optional[str]:
+        """Computes a digest of the given basic type.
+
+        Args:
+            data: The data to compute the digest of.
+
+        Returns:
+            The content digest.
+        """
+        # Include the type so e.g. `1` and `True` get different digests.
+        content = f"{type(data).__name__}:{json.dumps(data)}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
 
 class BytesMaterializer(BaseMaterializer):
     """Handle `bytes` data type, which is not JSON serializable."""
@@ -146,39 +178,48 @@ class BytesMaterializer(BaseMaterializer):
         with fileio.open(self.data_path, "wb") as file_:
             file_.write(data)
 
+    def compute_content_hash(self, data: Any) -> Optional[str]:
+        """Computes a digest of the given bytes object.
 
-def _all_serializable(iterable: Iterable[Any]) -> bool:
-    """For an iterable, check whether all of its elements are JSON-serializable.
-
-    Args:
-        iterable (Iterable): The iterable to check.
+        Args:
+            data: The data to compute the digest of.
 
-    Returns:
-        True if all elements are JSON-serializable, else False.
-    """
-    return all(_is_serializable(element) for element in iterable)
+        Returns:
+            The content digest.
+        """
+        return hashlib.sha256(data).hexdigest()
 
 
 def _is_serializable(obj: Any) -> bool:
     """Check whether a built-in object is JSON-serializable.
 
+    The object is traversed iteratively, so deeply nested objects don't hit
+    the recursion limit, and containers that are referenced multiple times
+    are only checked once.
+
     Args:
         obj: The object to check.
 
     Returns:
         True if the entire object is JSON-serializable, else False.
     """
-    if obj is None:
-        return True
-    if isinstance(obj, tuple(BASIC_TYPES)):
-        return True
-    if isinstance(obj, (list, tuple, set)):
-        return _all_serializable(obj)
-    if isinstance(obj, dict):
-        return _all_serializable(obj.keys()) and _all_serializable(
-            obj.values()
-        )
-    return False
+    stack = [obj]
+    checked_container_ids: Set[int] = set()
+    while stack:
+        obj = stack.pop()
+        if obj is None or isinstance(obj, BASIC_TYPES):
+            continue
+        if not isinstance(obj, (dict, list, set, tuple)):
+            return False
+        if id(obj) in checked_container_ids:
+            continue
+        checked_container_ids.add(id(obj))
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        else:
+            stack.extend(obj)
+    return True
 
 
 def find_type_by_str(type_str: str) -> Type[Any]:
@@ -241,6 +282,131 @@ def find_materializer_registry_type(type_: Type[Any]) -> Type[Any]:
     )
 
 
+def _wait_for_all(futures: List["Future[Any]"]) -> None:
+    """Waits for futures and raises the first exception that occurs.
+
+    Args:
+        futures: The futures to wait for.
+
+    Raises:
+        BaseException: The first exception raised by any of the futures.
+    """
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def _save_element(element: Any, materializer: BaseMaterializer) -> None:
+    """Saves an element of a container.
+
+    Args:
+        element: The element to save.
+        materializer: The materializer to save the element with.
+    """
+    materializer.validate_type_compatibility(type(element))
+    materializer.save(element)
+
+
+def _get_directory_size(path: str) -> int:
+    """Computes the total size of all files in a local directory.
+
+    Args:
+        path: The directory path.
+
+    Returns:
+        The size of all files in the directory in bytes.
+    """
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def _write_packed_file(
+    packed_path: str, staged_paths: List[str], entries: List[Dict[str, Any]]
+) -> None:
+    """Packs the files of multiple locally saved elements into a single file.
+
+    The offset and size of each file are stored in the metadata entry of the
+    corresponding element.
+
+    Args:
+        packed_path: The path of the packed file to write.
+        staged_paths: The local directories of the elements to pack.
+        entries: The metadata entries of the elements to pack.
+    """
+    offset = 0
+    with fileio.open(packed_path, "wb") as packed_file:
+        for staged_path, entry in zip(staged_paths, entries):
+            files = []
+            for root, _, filenames in os.walk(staged_path):
+                for filename in sorted(filenames):
+                    file_path = os.path.join(root, filename)
+                    with open(file_path, "rb") as f:
+                        content = f.read()
+                    packed_file.write(content)
+                    relative_path = os.path.relpath(file_path, staged_path)
+                    files.append(
+                        {
+                            "path": relative_path.replace(os.sep, "/"),
+                            "offset": offset,
+                            "size": len(content),
+                        }
+                    )
+                    offset += len(content)
+            entry["packed"] = {"path": packed_path, "files": files}
+
+
+def _get_local_path(path: str, temp_dir: str) -> str:
+    """Gets a local path of a file, downloading it if necessary.
+
+    Args:
+        path: The path of the file.
+        temp_dir: Local directory into which to download remote files.
+
+    Returns:
+        The local path of the file.
+    """
+    if not io_utils.is_remote(path):
+        return path
+
+    local_path = os.path.join(temp_dir, f"packed-{uuid4().hex}")
+    fileio.copy(path, local_path)
+    return local_path
+
+
+def _load_packed_element(
+    entry: Dict[str, Any], local_packed_path: str, path: str
+) -> Any:
+    """Extracts a packed element into a local directory and loads it.
+
+    Args:
+        entry: The metadata entry of the element, with resolved type and
+            materializer class.
+        local_packed_path: The local path of the packed file.
+        path: The local directory into which to extract the element.
+
+    Returns:
+        The loaded element.
+    """
+    os.makedirs(path)
+    with open(local_packed_path, "rb") as packed_file:
+        for file in entry["packed"]["files"]:
+            file_path = os.path.join(path, *file["path"].split("/"))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            packed_file.seek(file["offset"])
+            with open(file_path, "wb") as f:
+                f.write(packed_file.read(file["size"]))
+
+    materializer = entry["materializer"](uri=path)
+    return materializer.load(entry["type"])
+
+
 class BuiltInContainerMaterializer(BaseMaterializer):
     """Handle built-in container types (dict, list, set, tuple)."""
 
@@ -267,10 +433,12 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         If the data was serialized to JSON, deserialize it.
 
         Otherwise, reconstruct all elements according to the metadata file:
-            1. Resolve the data type using `find_type_by_str()`,
-            2. Get the materializer via the `default_materializer_registry`,
-            3. Initialize the materializer with the desired path,
-            4. Use `load()` of that materializer to load the element.
+            1. Resolve the data type and materializer of each element,
+            2. Initialize the materializer with the path of the element,
+            3. Use `load()` of that materializer to load the element.
+
+        Elements are loaded in parallel. Packed elements are extracted from
+        their packed file, which is downloaded only once.
 
         Args:
             data_type: The type of the data to read.
@@ -297,34 +465,39 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         # Otherwise, use the metadata to reconstruct the data as a list.
         else:
             metadata = yaml_utils.read_json(self.metadata_path)
-            outputs = []
 
             # Backwards compatibility for zenml <= 0.37.0
             if isinstance(metadata, dict):
+                entries = []
                 for path_, type_str in zip(
                     metadata["paths"], metadata["types"]
                 ):
                     type_ = find_type_by_str(type_str)
-                    materializer_class = materializer_registry[type_]
-                    materializer = materializer_class(uri=path_)
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                    entries.append(
+                        {
+                            "path": path_,
+                            "type": type_,
+                            "materializer": materializer_registry[type_],
+                        }
+                    )
 
             # New format for zenml > 0.37.0
             elif isinstance(metadata, list):
+                entries = []
                 for entry in metadata:
-                    path_ = entry["path"]
-                    type_ = source_utils.load(entry["type"])
-                    materializer_class = source_utils.load(
-                        entry["materializer"]
-                    )
-                    materializer = materializer_class(uri=path_)
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                    entry = dict(entry)
+                    entry["type"] = source_utils.load(entry["type"])
+                    if "materializer" in entry:
+                        entry["materializer"] = source_utils.load(
+                            entry["materializer"]
+                        )
+                    entries.append(entry)
 
             else:
                 raise RuntimeError(f"Unknown metadata format: {metadata}.")
 
+            outputs = self._load_elements(entries)
+
         # Cast the data to the correct type.
         if issubclass(data_type, dict) and not isinstance(outputs, dict):
             keys, values = outputs
@@ -335,14 +508,82 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             return set(outputs)
         return outputs
 
+    def _load_elements(self, entries: List[Dict[str, Any]]) -> List[Any]:
+        """Loads the elements of a non-serializable container in parallel.
+
+        Args:
+            entries: The metadata entries of all elements, with resolved
+                types and materializer classes.
+
+        Returns:
+            The loaded elements.
+        """
+        outputs: List[Any] = [None] * len(entries)
+        temp_dir = tempfile.mkdtemp(prefix="zenml-container-")
+        try:
+            with ThreadPoolExecutor(
+                max_workers=ELEMENT_MAX_WORKERS
+            ) as executor:
+                # Download each packed file only once.
+                packed_paths = {
+                    entry["packed"]["path"]
+                    for entry in entries
+                    if "packed" in entry
+                }
+                local_packed_paths = dict(
+                    zip(
+                        packed_paths,
+                        executor.map(
+                            partial(_get_local_path, temp_dir=temp_dir),
+                            packed_paths,
+                        ),
+                    )
+                )
+
+                futures = {}
+                for i, entry in enumerate(entries):
+                    if "value" in entry:
+                        value = entry["value"]
+                        if entry["type"] in (set, tuple):
+                            value = entry["type"](value)
+                        outputs[i] = value
+                        continue
+
+                    if "packed" in entry:
+                        path_ = os.path.join(temp_dir, str(i))
+                        futures[i] = executor.submit(
+                            _load_packed_element,
+                            entry=entry,
+                            local_packed_path=local_packed_paths[
+                                entry["packed"]["path"]
+                            ],
+                            path=path_,
+                        )
+                    else:
+                        materializer = entry["materializer"](uri=entry["path"])
+                        futures[i] = executor.submit(
+                            materializer.load, entry["type"]
+                        )
+
+                for i, future in futures.items():
+                    outputs[i] = future.result()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return outputs
+
     def save(self, data: Any) -> None:
         """Materialize a built-in container object.
 
         If the object can be serialized to JSON, serialize it.
 
         Otherwise, use the `default_materializer_registry` to find the correct
-        materializer for each element and materialize each element into a
-        subdirectory.
+        materializer for each element and materialize the elements in
+        parallel:
+            - JSON-serializable elements are stored in the metadata file.
+            - Small elements are saved to a local directory first and then
+                packed into a single file per element type, together with
+                the offsets of their files in the packed file.
+            - All other elements are saved into their own subdirectory.
 
         Tuples and sets are cast to list before materialization.
 
@@ -367,42 +608,143 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
-        materializers: List[BaseMaterializer] = []
+        # non-serializable list: Materialize the elements.
+        created_paths: List[str] = []
+        staging_dir = tempfile.mkdtemp(prefix="zenml-container-")
         try:
-            for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                fileio.mkdir(element_path)
-                type_ = type(element)
-                materializer_class = materializer_registry[type_]
-                materializer = materializer_class(uri=element_path)
-                materializers.append(materializer)
-                metadata.append(
-                    {
-                        "path": element_path,
-                        "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
-                    }
-                )
+            metadata = self._save_elements(
+                elements=data,
+                staging_dir=staging_dir,
+                created_paths=created_paths,
+            )
             # Write metadata as JSON.
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.validate_type_compatibility(type(element))
-                materializer.save(element)
         # If an error occurs, delete all created files.
         except Exception as e:
             # Delete metadata
             if fileio.exists(self.metadata_path):
                 fileio.remove(self.metadata_path)
-            # Delete all elements that were already saved.
-            for entry in metadata:
-                fileio.rmtree(entry["path"])
+            # Delete all elements and packed files that were already saved.
+            for path_ in created_paths:
+                if fileio.isdir(path_):
+                    fileio.rmtree(path_)
+                elif fileio.exists(path_):
+                    fileio.remove(path_)
             raise e
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _save_elements(
+        self,
+        elements: List[Any],
+        staging_dir: str,
+        created_paths: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Saves the elements of a non-serializable container in parallel.
+
+        Args:
+            elements: The elements to save.
+            staging_dir: Local directory in which to save elements that
+                might be packed.
+            created_paths: List to which the paths of all created element
+                directories and packed files are appended.
+
+        Returns:
+            The metadata entry of each element.
+        """
+        metadata: List[Dict[str, Any]] = []
+        direct_saves: List[Tuple[Any, BaseMaterializer]] = []
+        staged_saves: List[Tuple[int, Any, BaseMaterializer]] = []
+        for i, element in enumerate(elements):
+            type_ = type(element)
+            entry: Dict[str, Any] = {
+                "type": source_utils.resolve(type_).import_path
+            }
+            metadata.append(entry)
+
+            if type_ in JSON_ELEMENT_TYPES and _is_serializable(element):
+                entry["value"] = (
+                    list(element)
+                    if isinstance(element, (set, tuple))
+                    else element
+                )
+                continue
+
+            materializer_class = materializer_registry[type_]
+            entry["materializer"] = source_utils.resolve(
+                materializer_class
+            ).import_path
+
+            # Nested containers store the paths of their elements, so they
+            # can't be saved in a different location first. Elements that are
+            # known to be big are not worth packing.
+            if (
+                issubclass(materializer_class, BuiltInContainerMaterializer)
+                or sys.getsizeof(element) > PACKED_ELEMENT_MAX_SIZE
+            ):
+                element_path = os.path.join(self.uri, str(i))
+                fileio.mkdir(element_path)
+                created_paths.append(element_path)
+                entry["path"] = element_path
+                direct_saves.append(
+                    (element, materializer_class(uri=element_path))
+                )
+            else:
+                staged_path = os.path.join(staging_dir, str(i))
+                os.mkdir(staged_path)
+                staged_saves.append(
+                    (i, element, materializer_class(uri=staged_path))
+                )
+
+        with ThreadPoolExecutor(max_workers=ELEMENT_MAX_WORKERS) as executor:
+            _wait_for_all(
+                [
+                    executor.submit(_save_element, element, materializer)
+                    for element, materializer in direct_saves
+                    + [(element, m) for _, element, m in staged_saves]
+                ]
+            )
+
+            # Pack small elements into one file per element type and upload
+            # the remaining elements into their own subdirectory.
+            packed_groups: Dict[Tuple[str, str], List[int]] = {}
+            futures = []
+            for i, _, materializer in staged_saves:
+                size = _get_directory_size(materializer.uri)
+                if size > PACKED_ELEMENT_MAX_SIZE:
+                    element_path = os.path.join(self.uri, str(i))
+                    created_paths.append(element_path)
+                    metadata[i]["path"] = element_path
+                    futures.append(
+                        executor.submit(
+                            io_utils.copy_dir, materializer.uri, element_path
+                        )
+                    )
+                else:
+                    group_key = (
+                        metadata[i]["type"],
+                        metadata[i]["materializer"],
+                    )
+                    packed_groups.setdefault(group_key, []).append(i)
+
+            for group_index, indices in enumerate(packed_groups.values()):
+                packed_path = os.path.join(
+                    self.uri, PACKED_FILENAME_TEMPLATE.format(group_index)
+                )
+                created_paths.append(packed_path)
+                futures.append(
+                    executor.submit(
+                        _write_packed_file,
+                        packed_path=packed_path,
+                        staged_paths=[
+                            os.path.join(staging_dir, str(i)) for i in indices
+                        ],
+                        entries=[metadata[i] for i in indices],
+                    )
+                )
+            _wait_for_all(futures)
+
+        return metadata
 
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given built-in container object.
@@ -13,9 +13,20 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML NumPy materializer."""
 
+import hashlib
+import math
 import os
 from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 import numpy as np
 
@@ -24,6 +35,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils, statistics_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -37,6 +49,8 @@ DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
+MAX_IMAGE_SIZE = 1024
+
 
 class NumpyMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -47,6 +61,11 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the requested data type is `np.memmap` and the artifact is stored
+        (or cached) locally, the array is memory-mapped instead of being read
+        into memory. The memory map is opened in copy-on-write mode, which
+        means changes to the array are never written back to the artifact.
+
         Args:
             data_type: The type of the data to read.
 
@@ -60,6 +79,11 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if fileio.exists(numpy_file):
+            if issubclass(data_type, np.memmap):
+                memmap = self._load_memmap(numpy_file)
+                if memmap is not None:
+                    return memmap
+
             with fileio.open(numpy_file, "rb") as f:
                 # This function is untyped for numpy versions supporting python
                 # 3.7, but typed for numpy versions installed on python 3.8+.
@@ -101,6 +125,39 @@ class NumpyMaterializer(BaseMaterializer):
                     "You can install `pyarrow` by running `pip install pyarrow`.",
                 )
 
+    @staticmethod
+    def _load_memmap(numpy_file: str) -> Optional["NDArray[Any]"]:
+        """Memory-maps a `.npy` file.
+
+        Args:
+            numpy_file: Path to the `.npy` file.
+
+        Returns:
+            The memory-mapped array or `None` if the file can't be
+            memory-mapped.
+        """
+        if io_utils.is_remote(numpy_file):
+            logger.warning(
+                "Unable to memory-map the numpy array stored at `%s` because "
+                "it is stored in a remote artifact store, loading it into "
+                "memory instead. Set the `local_cache_size` of your artifact "
+                "store to cache artifacts on the local disk.",
+                numpy_file,
+            )
+            return None
+
+        try:
+            return cast(Any, np.load)(numpy_file, mmap_mode="c")
+        except ValueError as e:
+            # Arrays of python objects are pickled and can't be mapped.
+            logger.warning(
+                "Unable to memory-map the numpy array stored at `%s`, "
+                "loading it into memory instead: %s",
+                numpy_file,
+                e,
+            )
+            return None
+
     def save(self, arr: "NDArray[Any]") -> None:
         """Writes a np.ndarray to the artifact store as a `.npy` file.
 
@@ -115,6 +172,26 @@ class NumpyMaterializer(BaseMaterializer):
             # statement
             cast(Any, np.save)(f, arr)
 
+    def compute_content_hash(self, arr: "NDArray[Any]") -> Optional[str]:
+        """Computes a digest of the content of the given numpy array.
+
+        Args:
+            arr: The numpy array to compute the digest of.
+
+        Returns:
+            The content digest, or `None` for arrays of Python objects.
+        """
+        if arr.dtype.hasobject:
+            return None
+
+        hash_ = hashlib.sha256()
+        hash_.update(arr.dtype.str.encode())
+        hash_.update(str(arr.shape).encode())
+        # Hashing a memoryview avoids copying the array data if the array is
+        # already contiguous.
+        hash_.update(memoryview(np.ascontiguousarray(arr)).cast("B"))
+        return hash_.hexdigest()
+
     def save_visualizations(
         self, arr: "NDArray[Any]"
     ) -> Dict[str, VisualizationType]:
@@ -129,20 +206,25 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             A dictionary of visualization URIs and their types.
         """
-        if not np.issubdtype(arr.dtype, np.number):
+        if not np.issubdtype(
+            arr.dtype, np.number
+        ) or statistics_utils.exceeds_metadata_size_limit(arr.size):
             return {}
 
         try:
             # Save histogram for 1D arrays
             if len(arr.shape) == 1:
                 histogram_path = os.path.join(self.uri, "histogram.png")
+                sample_indices = statistics_utils.get_sample_indices(len(arr))
+                if sample_indices is not None:
+                    arr = arr[sample_indices]
                 self._save_histogram(histogram_path, arr)
                 return {histogram_path: VisualizationType.IMAGE}
 
             # Save as image for 2D or 3D arrays with 3 or 4 channels
             if self._array_can_be_saved_as_image(arr):
                 image_path = os.path.join(self.uri, "image.png")
-                self._save_image(image_path, arr)
+                self._save_image(image_path, self._downsample_image(arr))
                 return {image_path: VisualizationType.IMAGE}
 
         except ImportError:
@@ -161,12 +243,14 @@ class NumpyMaterializer(BaseMaterializer):
             output_path: The path to save the histogram to.
             arr: The numpy array of which to save the histogram.
         """
-        import matplotlib.pyplot as plt  # type: ignore
+        # Use a standalone figure instead of the global `pyplot` state, so
+        # histograms of multiple step outputs can be saved concurrently.
+        from matplotlib.figure import Figure  # type: ignore
 
-        plt.hist(arr)
+        figure = Figure()
+        figure.subplots().hist(arr)
         with fileio.open(output_path, "wb") as f:
-            plt.savefig(f)
-        plt.close()
+            figure.savefig(f)
 
     @staticmethod
     def _array_can_be_saved_as_image(arr: "NDArray[Any]") -> bool:
@@ -186,6 +270,21 @@ class NumpyMaterializer(BaseMaterializer):
             return True
         return False
 
+    @staticmethod
+    def _downsample_image(arr: "NDArray[Any]") -> "NDArray[Any]":
+        """Downsamples an array so it can be saved as an image quickly.
+
+        Args:
+            arr: The 2D or 3D numpy array to downsample.
+
+        Returns:
+            A view of the array with at most `MAX_IMAGE_SIZE` pixels in each
+            dimension.
+        """
+        row_step = max(math.ceil(arr.shape[0] / MAX_IMAGE_SIZE), 1)
+        column_step = max(math.ceil(arr.shape[1] / MAX_IMAGE_SIZE), 1)
+        return arr[::row_step, ::column_step]
+
     def _save_image(self, output_path: str, arr: "NDArray[Any]") -> None:
         """Saves a numpy array as an image.
 
@@ -209,6 +308,9 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             The extracted metadata as a dictionary.
         """
+        if statistics_utils.exceeds_metadata_size_limit(arr.size):
+            return {"shape": tuple(arr.shape), "dtype": DType(arr.dtype.type)}
+
         if np.issubdtype(arr.dtype, np.number):
             return self._extract_numeric_metadata(arr)
         elif np.issubdtype(arr.dtype, np.unicode_) or np.issubdtype(
@@ -229,18 +331,29 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             A dictionary of metadata.
         """
-        # These functions are untyped for numpy versions supporting python
-        # 3.7, but typed for numpy versions installed on python 3.8+.
-        # We need to cast them to Any here so that numpy doesn't complain
-        # about either an untyped function call or an unused ignore statement.
-        min_val = cast(Any, np.min)(arr).item()
-        max_val = cast(Any, np.max)(arr).item()
+        if np.issubdtype(arr.dtype, np.complexfloating):
+            # These functions are untyped for numpy versions supporting python
+            # 3.7, but typed for numpy versions installed on python 3.8+.
+            # We need to cast them to Any here so that numpy doesn't complain
+            # about either an untyped function call or an unused ignore
+            # statement.
+            mean = np.mean(arr).item()
+            std = np.std(arr).item()
+            min_val = cast(Any, np.min)(arr).item()
+            max_val = cast(Any, np.max)(arr).item()
+        else:
+            (
+                mean,
+                std,
+                min_val,
+                max_val,
+            ) = statistics_utils.compute_summary_statistics(arr)
 
         numpy_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "mean": np.mean(arr).item(),
-            "std": np.std(arr).item(),
+            "mean": mean,
+            "std": std,
             "min": min_val,
             "max": max_val,
         }
@@ -257,6 +370,13 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             A dictionary of metadata.
         """
+        shape = tuple(arr.shape)
+        dtype = DType(arr.dtype.type)
+
+        sample_indices = statistics_utils.get_sample_indices(arr.size)
+        if sample_indices is not None:
+            arr = arr.ravel()[sample_indices]
+
         text = " ".join(arr)
         words = text.split()
         word_counts = Counter(words)
@@ -265,11 +385,14 @@ class NumpyMaterializer(BaseMaterializer):
         most_common_word, most_common_count = word_counts.most_common(1)[0]
 
         text_metadata: Dict[str, "MetadataType"] = {
-            "shape": tuple(arr.shape),
-            "dtype": DType(arr.dtype.type),
+            "shape": shape,
+            "dtype": dtype,
             "unique_words": unique_words,
             "total_words": total_words,
             "most_common_word": most_common_word,
             "most_common_count": most_common_count,
         }
+        if sample_indices is not None:
+            # The word statistics only describe a sample of the array
+            text_metadata["sample_size"] = len(sample_indices)
         return text_metadata
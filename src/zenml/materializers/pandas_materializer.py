@@ -13,9 +13,22 @@
 #  permissions and limitations under the License.
 """Materializer for Pandas."""
 
+import hashlib
 import os
-from typing import Any, ClassVar, Dict, Tuple, Type, Union
-
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
 import pandas as pd
 
 from zenml.enums import ArtifactType, VisualizationType
@@ -23,17 +36,43 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import statistics_utils, yaml_utils
 
 logger = get_logger(__name__)
 
 PARQUET_FILENAME = "df.parquet.gzip"
 COMPRESSION_TYPE = "gzip"
 
+MANIFEST_FILENAME = "manifest.json"
+SHARDS_DIRECTORY = "shards"
+SHARD_FILENAME_TEMPLATE = "part-{:05d}.parquet"
+# Approximate in-memory size of the rows stored in each shard
+SHARD_SIZE = 128 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 65536
+
 CSV_FILENAME = "df.csv"
 
+Filters = List[Tuple[str, str, Any]]
+
 
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    If `pyarrow` is installed, dataframes are stored as a set of Parquet
+    shards described by a manifest file. Steps that only need parts of a
+    large dataframe can take an `UnmaterializedArtifact` as input and use
+    `read(...)` or `iter_batches(...)` to load only the required columns and
+    rows:
+
+    ```python
+    @step
+    def my_step(data: UnmaterializedArtifact) -> None:
+        materializer = PandasMaterializer(data.uri)
+        df = materializer.read(columns=["a", "b"], filters=[("a", ">", 0)])
+        for batch in materializer.iter_batches(columns=["a"]):
+            ...
+    ```
+    """
 
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
         pd.DataFrame,
@@ -62,6 +101,7 @@ class PandasMaterializer(BaseMaterializer):
                 "to automatically store the data as a `.parquet` file instead."
             )
         finally:
+            self.manifest_path = os.path.join(self.uri, MANIFEST_FILENAME)
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
 
@@ -71,50 +111,154 @@ class PandasMaterializer(BaseMaterializer):
         Args:
             data_type: The type of the data to read.
 
-        Raises:
-            ImportError: If pyarrow or fastparquet is not installed.
-
         Returns:
             The pandas dataframe or series.
         """
-        if fileio.exists(self.parquet_path):
-            if self.pyarrow_exists:
-                with fileio.open(self.parquet_path, mode="rb") as f:
-                    df = pd.read_parquet(f)
-            else:
-                raise ImportError(
-                    "You have an old version of a `PandasMaterializer` "
-                    "data artifact stored in the artifact store "
-                    "as a `.parquet` file, which requires `pyarrow` "
-                    "for reading, You can install `pyarrow` by running "
-                    "'`pip install pyarrow fastparquet`'."
-                )
+        df = self.read()
+
+        if issubclass(data_type, pd.Series):
+            # Taking the first column if its a series as the assumption
+            # is that there will only be one
+            assert len(df.columns) == 1
+            return df[df.columns[0]]
+        return df
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        """Reads the stored data as a dataframe.
+
+        Args:
+            columns: If given, only these columns are read.
+            filters: Row filters in the `pyarrow` format, e.g.
+                `[("year", ">=", 2020)]`. Only rows matching all filters are
+                read. Requires `pyarrow`.
+
+        Returns:
+            The pandas dataframe.
+        """
+        if fileio.exists(self.manifest_path):
+            frames = [
+                self._read_parquet(path, columns=columns, filters=filters)
+                for path in self._get_shard_paths()
+            ]
+            if len(frames) == 1:
+                return frames[0]
+            return pd.concat(frames)
+        elif fileio.exists(self.parquet_path):
+            return self._read_parquet(
+                self.parquet_path, columns=columns, filters=filters
+            )
         else:
+            if filters:
+                self._raise_pyarrow_required("Filtering rows")
             with fileio.open(self.csv_path, mode="rb") as f:
                 df = pd.read_csv(f, index_col=0, parse_dates=True)
+            return df[columns] if columns is not None else df
 
-        # validate the type of the data.
-        def is_dataframe_or_series(
-            df: Union[pd.DataFrame, pd.Series]
-        ) -> Union[pd.DataFrame, pd.Series]:
-            """Checks if the data is a `pd.DataFrame` or `pd.Series`.
-
-            Args:
-                df: The data to check.
-
-            Returns:
-                The data if it is a `pd.DataFrame` or `pd.Series`.
-            """
-            if issubclass(data_type, pd.Series):
-                # Taking the first column if its a series as the assumption
-                # is that there will only be one
-                assert len(df.columns) == 1
-                df = df[df.columns[0]]
-                return df
-            else:
-                return df
-
-        return is_dataframe_or_series(df)
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the stored data in batches.
+
+        At most one shard of the data is held in memory at a time.
+
+        Args:
+            batch_size: The maximum number of rows per batch.
+            columns: If given, only these columns are read.
+            filters: Row filters in the `pyarrow` format, e.g.
+                `[("year", ">=", 2020)]`. Only rows matching all filters are
+                read. Requires `pyarrow`.
+
+        Yields:
+            Dataframes with up to `batch_size` rows.
+        """
+        if fileio.exists(self.manifest_path):
+            paths = self._get_shard_paths()
+        elif fileio.exists(self.parquet_path):
+            paths = [self.parquet_path]
+        else:
+            df = self.read(columns=columns, filters=filters)
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start : start + batch_size]
+            return
+
+        for path in paths:
+            if filters:
+                df = self._read_parquet(path, columns=columns, filters=filters)
+                for start in range(0, len(df), batch_size):
+                    yield df.iloc[start : start + batch_size]
+                continue
+
+            import pyarrow.parquet as pq
+
+            with fileio.open(path, mode="rb") as f:
+                parquet_file = pq.ParquetFile(f)
+                for batch in parquet_file.iter_batches(
+                    batch_size=batch_size,
+                    columns=columns,
+                    use_pandas_metadata=True,
+                ):
+                    yield batch.to_pandas()
+
+    def _get_shard_paths(self) -> List[str]:
+        """Gets the paths of all shards listed in the manifest.
+
+        Returns:
+            The shard paths.
+        """
+        manifest = yaml_utils.read_json(self.manifest_path)
+        return [os.path.join(self.uri, shard) for shard in manifest["shards"]]
+
+    def _read_parquet(
+        self,
+        path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        """Reads a Parquet file.
+
+        Args:
+            path: The path of the Parquet file.
+            columns: If given, only these columns are read.
+            filters: Row filters in the `pyarrow` format.
+
+        Returns:
+            The pandas dataframe.
+        """
+        if not self.pyarrow_exists:
+            self._raise_pyarrow_required("Reading a `.parquet` file")
+
+        import pyarrow.parquet as pq
+
+        with fileio.open(path, mode="rb") as f:
+            table = pq.read_table(
+                f,
+                columns=columns,
+                filters=filters,
+                use_pandas_metadata=True,
+            )
+        return table.to_pandas()
+
+    @staticmethod
+    def _raise_pyarrow_required(operation: str) -> NoReturn:
+        """Raises an error because `pyarrow` is required but not installed.
+
+        Args:
+            operation: The operation that requires `pyarrow`.
+
+        Raises:
+            ImportError: Always.
+        """
+        raise ImportError(
+            f"{operation} requires `pyarrow`. You can install `pyarrow` by "
+            "running '`pip install pyarrow fastparquet`'."
+        )
 
     def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
@@ -125,12 +269,57 @@ class PandasMaterializer(BaseMaterializer):
         if isinstance(df, pd.Series):
             df = df.to_frame(name="series")
 
-        if self.pyarrow_exists:
-            with fileio.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
-        else:
+        if not self.pyarrow_exists:
             with fileio.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
+            return
+
+        row_size = df.memory_usage(index=True, deep=False).sum() / max(
+            len(df), 1
+        )
+        rows_per_shard = max(int(SHARD_SIZE / max(row_size, 1)), 1)
+
+        fileio.makedirs(os.path.join(self.uri, SHARDS_DIRECTORY))
+        shards = []
+        for index, start in enumerate(
+            range(0, max(len(df), 1), rows_per_shard)
+        ):
+            shard = os.path.join(
+                SHARDS_DIRECTORY, SHARD_FILENAME_TEMPLATE.format(index)
+            )
+            with fileio.open(os.path.join(self.uri, shard), mode="wb") as f:
+                df.iloc[start : start + rows_per_shard].to_parquet(
+                    f, compression=COMPRESSION_TYPE
+                )
+            shards.append(shard)
+
+        yaml_utils.write_json(
+            self.manifest_path,
+            {"version": 1, "num_rows": len(df), "shards": shards},
+        )
+
+    def compute_content_hash(
+        self, df: Union[pd.DataFrame, pd.Series]
+    ) -> Optional[str]:
+        """Computes a digest of the content of the given dataframe or series.
+
+        Args:
+            df: The pandas dataframe or series to compute the digest of.
+
+        Returns:
+            The content digest.
+        """
+        hash_ = hashlib.sha256()
+        hash_.update(type(df).__name__.encode())
+        if isinstance(df, pd.DataFrame):
+            hash_.update(str(list(df.columns)).encode())
+            hash_.update(str(list(df.dtypes)).encode())
+        else:
+            hash_.update(str(df.name).encode())
+            hash_.update(str(df.dtype).encode())
+        row_hashes = pd.util.hash_pandas_object(df, index=True).values
+        hash_.update(memoryview(row_hashes).cast("B"))
+        return hash_.hexdigest()
 
     def save_visualizations(
         self, df: Union[pd.DataFrame, pd.Series]
@@ -143,6 +332,15 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             A dictionary of visualization URIs and their types.
         """
+        if statistics_utils.exceeds_metadata_size_limit(len(df)):
+            return {}
+
+        # Computing percentiles requires sorting, so large data is described
+        # based on a sample
+        sample_indices = statistics_utils.get_sample_indices(len(df))
+        if sample_indices is not None:
+            df = df.iloc[sample_indices]
+
         describe_uri = os.path.join(self.uri, "describe.csv")
         with fileio.open(describe_uri, mode="wb") as f:
             df.describe().to_csv(f)
@@ -163,24 +361,48 @@ class PandasMaterializer(BaseMaterializer):
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            if statistics_utils.exceeds_metadata_size_limit(len(df)):
+                return pandas_metadata
+
+            statistics = self._compute_statistics(df)
+            pandas_metadata["mean"] = statistics.mean
+            pandas_metadata["std"] = statistics.std
+            pandas_metadata["min"] = float(statistics.min)
+            pandas_metadata["max"] = float(statistics.max)
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            if statistics_utils.exceeds_metadata_size_limit(len(df)):
+                return pandas_metadata
+
+            column_statistics = {
+                str(key): self._compute_statistics(column)
+                for key, column in df.select_dtypes(
+                    include=["number", "bool"]
+                ).items()
+            }
+            for stat_name in ("mean", "std", "min", "max"):
                 pandas_metadata[stat_name] = {
-                    str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    key: float(getattr(statistics, stat_name))
+                    for key, statistics in column_statistics.items()
                 }
 
         return pandas_metadata
+
+    @staticmethod
+    def _compute_statistics(
+        series: pd.Series,
+    ) -> statistics_utils.SummaryStatistics:
+        """Computes summary statistics of a numeric pandas series.
+
+        Args:
+            series: The series to compute the statistics of.
+
+        Returns:
+            The summary statistics, using the same sample standard deviation
+            as pandas.
+        """
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        return statistics_utils.compute_summary_statistics(values, ddof=1)
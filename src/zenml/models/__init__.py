@@ -93,6 +93,7 @@ from zenml.models.stack_models import (
 )
 from zenml.models.step_run_models import (
     StepRunFilterModel,
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -299,6 +300,7 @@ __all__ = [
     "StackUpdateModel",
     "StackFilterModel",
     "StepRunRequestModel",
+    "StepRunPrepareRequestModel",
     "StepRunResponseModel",
     "StepRunUpdateModel",
     "StepRunFilterModel",
@@ -26,6 +26,7 @@ from zenml.models.base_models import (
 )
 from zenml.models.constants import STR_FIELD_MAX_LENGTH
 from zenml.models.filter_models import WorkspaceScopedFilterModel
+from zenml.models.run_metadata_models import RunMetadataRequestModel
 from zenml.models.visualization_models import VisualizationModel
 
 if TYPE_CHECKING:
@@ -57,6 +58,11 @@ class ArtifactBaseModel(BaseModel):
     visualizations: Optional[List[VisualizationModel]] = Field(
         default=None, title="Visualizations of the artifact."
     )
+    content_hash: Optional[str] = Field(
+        default=None,
+        title="Digest of the content of the artifact.",
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
 
     _convert_source = convert_source_validator("materializer", "data_type")
 
@@ -120,6 +126,9 @@ class ArtifactFilterModel(WorkspaceScopedFilterModel):
     user_id: Optional[Union[UUID, str]] = Field(
         default=None, description="User that produced this artifact"
     )
+    content_hash: Optional[str] = Field(
+        default=None, description="Digest of the content of the artifact"
+    )
     only_unused: Optional[bool] = Field(
         default=False, description="Filter only for unused artifacts"
     )
@@ -132,3 +141,9 @@ class ArtifactFilterModel(WorkspaceScopedFilterModel):
 
 class ArtifactRequestModel(ArtifactBaseModel, WorkspaceScopedRequestModel):
     """Request model for artifacts."""
+
+    run_metadata: List[RunMetadataRequestModel] = Field(
+        default=[],
+        title="Metadata to create together with the artifact. The artifact "
+        "ID of the metadata is set when the artifact is created.",
+    )
@@ -14,8 +14,11 @@
 """Base filter model definitions."""
 from __future__ import annotations
 
+import base64
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
+from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -267,10 +270,12 @@ class BaseFilterModel(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "after",
+        "skip_count",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["after", "skip_count"]
 
     sort_by: str = Field(
         default="created", description="Which column to sort by."
@@ -289,6 +294,18 @@ class BaseFilterModel(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    after: Optional[str] = Field(
+        default=None,
+        description="Cursor returned as `next_cursor` of a previous page. If "
+        "set, the page starts right after the item that the cursor points to "
+        "and the `page` value is ignored.",
+    )
+    skip_count: bool = Field(
+        default=False,
+        description="Skip counting the total amount of items. The `total` "
+        "and `total_pages` values of the returned page are then only lower "
+        "bounds.",
+    )
 
     id: Optional[Union[UUID, str]] = Field(
         default=None, description="Id for this resource"
@@ -348,6 +365,20 @@ class BaseFilterModel(BaseModel):
                 "You can only sort by valid fields of this resource"
             )
 
+    @validator("after")
+    def validate_after(cls, v: Optional[str]) -> Optional[str]:
+        """Validate that the cursor can be decoded.
+
+        Args:
+            v: The cursor value.
+
+        Returns:
+            The validated cursor value.
+        """
+        if v is not None:
+            cls.decode_cursor(v)
+        return v
+
     @root_validator(pre=True)
     def filter_ops(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Parse incoming filters to ensure all filters are legal.
@@ -391,6 +422,66 @@ class BaseFilterModel(BaseModel):
 
         return column, operator
 
+    @property
+    def cursor_params(self) -> Optional[Tuple[Any, UUID]]:
+        """Decodes the `after` cursor of this filter model.
+
+        Returns:
+            A tuple of the sort column value and the ID of the item after
+            which the page starts, or `None` if no cursor was set.
+        """
+        if self.after is None:
+            return None
+        return self.decode_cursor(self.after)
+
+    @staticmethod
+    def encode_cursor(sort_value: Any, id: UUID) -> str:
+        """Encodes a cursor pointing to an item.
+
+        Args:
+            sort_value: The value of the sort column of the item.
+            id: The ID of the item.
+
+        Returns:
+            The encoded cursor.
+        """
+        if isinstance(sort_value, datetime):
+            value = ["datetime", sort_value.isoformat()]
+        elif isinstance(sort_value, UUID):
+            value = ["uuid", str(sort_value)]
+        elif isinstance(sort_value, Enum):
+            value = ["enum", sort_value.value]
+        else:
+            value = ["value", sort_value]
+
+        data = json.dumps([*value, str(id)]).encode()
+        return base64.urlsafe_b64encode(data).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, UUID]:
+        """Decodes a cursor created by `encode_cursor`.
+
+        Enum values are returned as their raw value.
+
+        Args:
+            cursor: The cursor to decode.
+
+        Returns:
+            A tuple of the sort column value and the ID of the item.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        try:
+            type_, value, id = json.loads(base64.urlsafe_b64decode(cursor))
+            if type_ == "datetime":
+                value = datetime.fromisoformat(value)
+            elif type_ == "uuid":
+                value = UUID(value)
+            return value, UUID(id)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid pagination cursor `{cursor}`.") from e
+
     @classmethod
     def _generate_filter_list(cls, values: Dict[str, Any]) -> List[Filter]:
         """Create a list of filters from a (column, value) dictionary.
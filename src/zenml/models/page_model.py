@@ -40,7 +40,7 @@ fastapi-pagination library: https://github.com/uriyyo/fastapi-pagination
 """
 from __future__ import annotations
 
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Optional, Sequence, TypeVar
 
 from pydantic import SecretStr
 from pydantic.generics import GenericModel
@@ -60,6 +60,7 @@ class Page(GenericModel, Generic[B]):
     total_pages: NonNegativeInt
     total: NonNegativeInt
     items: Sequence[B]
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilterModel
 
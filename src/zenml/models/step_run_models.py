@@ -148,6 +148,26 @@ class StepRunRequestModel(StepRunBaseModel, WorkspaceScopedRequestModel):
     output_artifacts: Dict[str, UUID] = {}
 
 
+class StepRunPrepareRequestModel(StepRunRequestModel):
+    """Request model to prepare and register a step run in a single call.
+
+    Instead of specifying the input artifacts, parent steps and cache key of
+    the step run, these get resolved by the store from the other step runs of
+    the pipeline run. If caching is enabled and a cached step run exists, the
+    step run is registered as cached.
+    """
+
+    artifact_store_id: UUID = Field(
+        title="The ID of the artifact store of the stack running the step.",
+    )
+    artifact_store_path: str = Field(
+        title="The path of the artifact store of the stack running the step.",
+    )
+    cache_enabled: bool = Field(
+        title="Whether caching is enabled for the step run.",
+    )
+
+
 # ------ #
 # UPDATE #
 # ------ #
@@ -14,7 +14,10 @@
 """Utilities for caching."""
 
 import hashlib
-from typing import TYPE_CHECKING, Dict, Optional
+import json
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+from pydantic.json import pydantic_encoder
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, SorterOps
@@ -25,6 +28,9 @@ if TYPE_CHECKING:
 
     from zenml.artifact_stores import BaseArtifactStore
     from zenml.config.step_configurations import Step
+    from zenml.models.pipeline_deployment_models import (
+        PipelineDeploymentBaseModel,
+    )
     from zenml.models.step_run_models import StepRunResponseModel
 
 logger = get_logger(__name__)
@@ -35,6 +41,7 @@ def generate_cache_key(
     input_artifact_ids: Dict[str, "UUID"],
     artifact_store: "BaseArtifactStore",
     workspace_id: "UUID",
+    input_artifact_content_hashes: Optional[Dict[str, Optional[str]]] = None,
 ) -> str:
     """Generates a cache key for a step run.
 
@@ -51,23 +58,72 @@ def generate_cache_key(
     - the source codes of the output materializers of the step.
     - additional custom caching parameters of the step.
 
+    If content-addressed caching is enabled for the step, the content hashes
+    of the input artifacts are used instead of their IDs whenever they are
+    available, so that identical data produced by different runs results in
+    the same cache key.
+
     Args:
         step: The step to generate the cache key for.
         input_artifact_ids: The input artifact IDs for the step.
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
+        input_artifact_content_hashes: The content hashes of the input
+            artifacts for the step. Only used if content-addressed caching is
+            enabled for the step.
+
+    Returns:
+        A cache key.
+    """
+    return compute_cache_key(
+        step=step,
+        input_artifact_ids=input_artifact_ids,
+        artifact_store_id=artifact_store.id,
+        artifact_store_path=artifact_store.path,
+        workspace_id=workspace_id,
+        input_artifact_content_hashes=input_artifact_content_hashes,
+    )
+
+
+def compute_cache_key(
+    step: "Step",
+    input_artifact_ids: Dict[str, "UUID"],
+    artifact_store_id: "UUID",
+    artifact_store_path: str,
+    workspace_id: "UUID",
+    input_artifact_content_hashes: Optional[Dict[str, Optional[str]]] = None,
+) -> str:
+    """Computes a cache key for a step run.
+
+    This computes the same key as `generate_cache_key(...)` but only requires
+    the ID and path of the artifact store instead of an artifact store
+    instance, which allows the ZenML server to compute cache keys without
+    instantiating stack components.
+
+    Args:
+        step: The step to compute the cache key for.
+        input_artifact_ids: The input artifact IDs for the step.
+        artifact_store_id: The ID of the artifact store of the active stack.
+        artifact_store_path: The path of the artifact store of the active
+            stack.
+        workspace_id: The ID of the active workspace.
+        input_artifact_content_hashes: The content hashes of the input
+            artifacts for the step. Only used if content-addressed caching is
+            enabled for the step.
 
     Returns:
         A cache key.
     """
+    content_addressed = bool(step.config.content_addressed_cache)
+    content_hashes = input_artifact_content_hashes or {}
     hash_ = hashlib.md5()
 
     # Workspace ID
     hash_.update(workspace_id.bytes)
 
     # Artifact store ID and path
-    hash_.update(artifact_store.id.bytes)
-    hash_.update(artifact_store.path.encode())
+    hash_.update(artifact_store_id.bytes)
+    hash_.update(artifact_store_path.encode())
 
     # Step source. This currently only uses the string representation of the
     # source (e.g. my_module.step_class) instead of the full source to keep
@@ -78,12 +134,20 @@ def generate_cache_key(
     # Step parameters
     for key, value in sorted(step.config.parameters.items()):
         hash_.update(key.encode())
+        if content_addressed:
+            # Serialize the value deterministically, `str(...)` depends on
+            # the insertion order of dictionaries
+            value = json.dumps(value, sort_keys=True, default=pydantic_encoder)
         hash_.update(str(value).encode())
 
     # Input artifacts
     for name, artifact_id in input_artifact_ids.items():
         hash_.update(name.encode())
-        hash_.update(artifact_id.bytes)
+        content_hash = content_hashes.get(name)
+        if content_addressed and content_hash:
+            hash_.update(content_hash.encode())
+        else:
+            hash_.update(artifact_id.bytes)
 
     # Output artifacts and materializers
     for name, output in step.config.outputs.items():
@@ -98,12 +162,41 @@ def generate_cache_key(
     return hash_.hexdigest()
 
 
+def get_content_addressed_outputs(
+    step_name: str, deployment: "PipelineDeploymentBaseModel"
+) -> Set[str]:
+    """Gets the outputs of a step that are used for content-addressed caching.
+
+    Steps with content-addressed caching compute their cache key from the
+    content hashes of their inputs, so these need to be computed for the
+    outputs of the upstream steps.
+
+    Args:
+        step_name: The name of the step.
+        deployment: The deployment of the pipeline run.
+
+    Returns:
+        The names of the outputs of the step which are inputs of steps with
+        content-addressed caching.
+    """
+    return {
+        input_.output_name
+        for step in deployment.step_configurations.values()
+        if step.config.content_addressed_cache
+        for input_ in step.spec.inputs.values()
+        if input_.step_name == step_name
+    }
+
+
 def get_cached_step_run(cache_key: str) -> Optional["StepRunResponseModel"]:
     """If a given step can be cached, get the corresponding existing step run.
 
     A step run can be cached if there is an existing step run in the same
     workspace which has the same cache key and was successfully executed.
 
+    The step launcher doesn't use this anymore, as cached step runs are now
+    looked up by the zen store when preparing a step run.
+
     Args:
         cache_key: The cache key of the step.
 
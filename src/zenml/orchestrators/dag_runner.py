@@ -13,15 +13,35 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
-import threading
+import heapq
+import os
+import time
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Same default as the `ThreadPoolExecutor` uses, as nodes usually wait for
+# work that happens outside of the runner process.
+DEFAULT_MAX_PARALLELISM = min(32, (os.cpu_count() or 1) + 4)
+
 
 def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """Reverse a DAG.
@@ -47,12 +67,97 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     return reversed_dag
 
 
+def get_critical_path_lengths(dag: Dict[str, List[str]]) -> Dict[str, int]:
+    """Computes the critical path length of each node in a DAG.
+
+    The critical path length of a node is the number of nodes on the longest
+    path starting at the node and ending at any node without downstream
+    nodes. Nodes that are part of a cycle (and can therefore never run) get a
+    length of `0`.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        The critical path length of each node.
+    """
+    reversed_dag = reverse_dag(dag)
+    remaining_downstream = {
+        node: len(downstream_nodes)
+        for node, downstream_nodes in reversed_dag.items()
+    }
+    lengths: Dict[str, int] = {node: 0 for node in reversed_dag}
+
+    # Traverse the DAG starting at the sink nodes, so that the lengths of all
+    # downstream nodes are known when processing a node.
+    stack = [node for node, count in remaining_downstream.items() if not count]
+    while stack:
+        node = stack.pop()
+        lengths[node] = 1 + max(
+            (lengths[downstream] for downstream in reversed_dag[node]),
+            default=0,
+        )
+        for upstream_node in dag.get(node, []):
+            remaining_downstream[upstream_node] -= 1
+            if remaining_downstream[upstream_node] == 0:
+                stack.append(upstream_node)
+
+    return lengths
+
+
 class NodeStatus(Enum):
     """Status of the execution of a node."""
 
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
+
+
+class FailurePolicy(Enum):
+    """Policy that defines how a DAG runner reacts to failing nodes.
+
+    Regardless of the policy, nodes downstream of a failed node never run.
+    """
+
+    # Don't start any new nodes once a node failed. Nodes which are already
+    # running will be waited for.
+    FAIL_FAST = "fail_fast"
+    # Keep running all nodes that don't depend on the failed node.
+    CONTINUE = "continue"
+
+
+class NodeTimings(NamedTuple):
+    """Timing statistics of a single node run.
+
+    Attributes:
+        ready_time: Time at which all upstream nodes of the node had finished.
+        start_time: Time at which the node started running.
+        end_time: Time at which the node finished running.
+    """
+
+    ready_time: float
+    start_time: float
+    end_time: float
+
+    @property
+    def wait_duration(self) -> float:
+        """Time the node spent waiting for a free worker.
+
+        Returns:
+            The wait duration in seconds.
+        """
+        return self.start_time - self.ready_time
+
+    @property
+    def run_duration(self) -> float:
+        """Time the node spent running.
+
+        Returns:
+            The run duration in seconds.
+        """
+        return self.end_time - self.start_time
 
 
 class ThreadedDagRunner:
@@ -62,11 +167,18 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes that can be executed in parallel are run on a thread pool of at most
+    `max_parallelism` workers. Whenever more nodes are ready to run than there
+    are free workers, the nodes with the longest critical path (the longest
+    chain of nodes depending on them) are started first.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        failure_policy: FailurePolicy = FailurePolicy.CONTINUE,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -75,13 +187,33 @@ class ThreadedDagRunner:
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
             run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: Maximum number of nodes to run concurrently. If
+                not set, at most `DEFAULT_MAX_PARALLELISM` nodes, which
+                depends on the number of CPUs, are run concurrently.
+            failure_policy: Defines how to proceed once a node failed.
+
+        Raises:
+            ValueError: If the maximum parallelism is smaller than 1.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Invalid maximum parallelism {max_parallelism}, the value "
+                "needs to be at least 1."
+            )
+
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
+        self.max_parallelism = max_parallelism
+        self.failure_policy = failure_policy
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.node_timings: Dict[str, NodeTimings] = {}
+        self.node_errors: Dict[str, BaseException] = {}
+        self._critical_path_lengths = get_critical_path_lengths(dag)
+        self._ready_queue: List[Tuple[int, int, str]] = []
+        self._ready_times: Dict[str, float] = {}
+        self._start_times: Dict[str, float] = {}
 
     def _can_run(self, node: str) -> bool:
         """Determine whether a node is ready to be run.
@@ -106,82 +238,128 @@ class ThreadedDagRunner:
 
         return True
 
+    def _enqueue(self, node: str) -> None:
+        """Adds a node to the queue of nodes that are ready to run.
+
+        Args:
+            node: The node.
+        """
+        self._ready_times[node] = time.time()
+        heapq.heappush(
+            self._ready_queue,
+            (
+                -self._critical_path_lengths.get(node, 0),
+                len(self._ready_times),
+                node,
+            ),
+        )
+
     def _run_node(self, node: str) -> None:
         """Run a single node.
 
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+        This method gets called in a worker thread.
 
         Args:
             node: The node.
         """
+        self._start_times[node] = time.time()
         self.run_fn(node)
-        self._finish_node(node)
 
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
-
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+    def _skip_downstream_nodes(self, node: str) -> None:
+        """Marks all nodes downstream of a node as skipped.
 
         Args:
             node: The node.
-
-        Returns:
-            The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
-
-    def _finish_node(self, node: str) -> None:
+        nodes_to_skip = list(self.reversed_dag[node])
+        while nodes_to_skip:
+            downstream_node = nodes_to_skip.pop()
+            if self.node_states[downstream_node] == NodeStatus.WAITING:
+                self.node_states[downstream_node] = NodeStatus.SKIPPED
+                nodes_to_skip.extend(self.reversed_dag[downstream_node])
+
+    def _finish_node(self, node: str, future: "Future[None]") -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status and timings, then either enqueues all
+        downstream nodes that can now be run or, if the node failed, skips
+        all of them.
 
         Args:
             node: The node.
+            future: The future of the finished node run.
         """
-        # Update node status to completed.
         assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        self.node_timings[node] = NodeTimings(
+            ready_time=self._ready_times[node],
+            start_time=self._start_times[node],
+            end_time=time.time(),
+        )
+
+        error = future.exception()
+        if error:
+            self.node_states[node] = NodeStatus.FAILED
+            self.node_errors[node] = error
+            logger.error(f"Node `{node}` failed: {error}")
+            self._skip_downstream_nodes(node)
+            return
+
+        self.node_states[node] = NodeStatus.COMPLETED
+        logger.debug(
+            "Node `%s` finished in %.2fs after waiting %.2fs for a worker.",
+            node,
+            self.node_timings[node].run_duration,
+            self.node_timings[node].wait_duration,
+        )
+        for downstream_node in self.reversed_dag[node]:
+            if self._can_run(downstream_node):
+                self._enqueue(downstream_node)
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
-        The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        The order of execution is determined by the dependencies between the
+        nodes. Nodes that are ready to run are started on a bounded thread
+        pool, prioritized by the length of their critical path.
+
+        Raises:
+            RuntimeError: If any of the nodes failed.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
         for node in self.nodes:
             if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+                self._enqueue(node)
+
+        max_workers = self.max_parallelism or DEFAULT_MAX_PARALLELISM
+        running: Dict["Future[None]", str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while self._ready_queue or running:
+                stop_scheduling = (
+                    self.failure_policy == FailurePolicy.FAIL_FAST
+                    and bool(self.node_errors)
+                )
+                while (
+                    self._ready_queue
+                    and len(running) < max_workers
+                    and not stop_scheduling
+                ):
+                    _, _, node = heapq.heappop(self._ready_queue)
+                    self.node_states[node] = NodeStatus.RUNNING
+                    future = executor.submit(self._run_node, node)
+                    running[future] = node
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish_node(running.pop(future), future)
+
+        if self.node_errors and self.failure_policy == FailurePolicy.FAIL_FAST:
+            # Nodes which were never started because of a failure.
+            for node in self.nodes:
+                if self.node_states[node] == NodeStatus.WAITING:
+                    self.node_states[node] = NodeStatus.SKIPPED
+            self._ready_queue.clear()
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
@@ -191,3 +369,15 @@ class ThreadedDagRunner:
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+
+        if self.node_errors:
+            skipped_nodes = [
+                node
+                for node, state in self.node_states.items()
+                if state == NodeStatus.SKIPPED
+            ]
+            first_error = next(iter(self.node_errors.values()))
+            raise RuntimeError(
+                f"Failed to run nodes `{list(self.node_errors)}`. The "
+                f"following nodes were skipped: `{skipped_nodes}`."
+            ) from first_error
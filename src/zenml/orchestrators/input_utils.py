@@ -30,6 +30,9 @@ def resolve_step_inputs(
 ) -> Tuple[Dict[str, "ArtifactResponseModel"], List[UUID]]:
     """Resolves inputs for the current step.
 
+    The step launcher doesn't use this anymore, as step inputs are now
+    resolved by the zen store when preparing a step run.
+
     Args:
         step: The step for which to resolve the inputs.
         run_id: The ID of the current pipeline run.
@@ -13,11 +13,21 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import os
+import subprocess
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
 from zenml.client import Client
+from zenml.config.base_settings import BaseSettings
+from zenml.constants import (
+    ENV_ZENML_ACTIVE_STACK_ID,
+    ENV_ZENML_ACTIVE_WORKSPACE_ID,
+)
+from zenml.entrypoints import StepEntrypointConfiguration
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators import utils as orchestrator_utils
@@ -25,8 +35,9 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import FailurePolicy, ThreadedDagRunner
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import source_utils, string_utils
 
 if TYPE_CHECKING:
     from zenml.models.pipeline_deployment_models import (
@@ -35,23 +46,37 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID = "ZENML_LOCAL_ORCHESTRATOR_RUN_ID"
+
 
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially inside the
+    orchestrator process. If the `max_workers` setting is larger than one,
+    steps whose upstream steps have all finished are run concurrently in
+    separate Python processes. This orchestrator does not support running on a
+    schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def settings_class(self) -> Optional[Type["BaseSettings"]]:
+        """Settings class for the local orchestrator.
+
+        Returns:
+            The settings class.
+        """
+        return LocalOrchestratorSettings
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponseModel",
         stack: "Stack",
         environment: Dict[str, str],
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -69,7 +94,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step in deployment.step_configurations.values():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -79,9 +103,22 @@ class LocalOrchestrator(BaseOrchestrator):
                     step.config.name,
                 )
 
-            self.run_step(
-                step=step,
+        settings = cast(
+            LocalOrchestratorSettings, self.get_settings(deployment)
+        )
+        if settings.max_workers > 1:
+            self._run_steps_in_parallel(
+                deployment=deployment,
+                stack=stack,
+                environment=environment,
+                max_workers=settings.max_workers,
             )
+        else:
+            # Run each step
+            for step in deployment.step_configurations.values():
+                self.run_step(
+                    step=step,
+                )
 
         run_duration = time.time() - start_time
         run_id = orchestrator_utils.get_run_id_for_orchestrator_run_id(
@@ -95,6 +132,79 @@ class LocalOrchestrator(BaseOrchestrator):
         )
         self._orchestrator_run_id = None
 
+    def _run_steps_in_parallel(
+        self,
+        deployment: "PipelineDeploymentResponseModel",
+        stack: "Stack",
+        environment: Dict[str, str],
+        max_workers: int,
+    ) -> None:
+        """Runs the steps of a deployment concurrently in separate processes.
+
+        Steps are scheduled on the DAG defined by their upstream steps and
+        each step is executed using the `StepEntrypointConfiguration` in a
+        subprocess, so that the global state of concurrently running steps
+        (e.g. the active step environment) stays isolated.
+
+        As in the sequential mode, no new steps are started once a step
+        failed.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            stack: The stack on which the pipeline is deployed.
+            environment: Environment variables to set in the step processes.
+            max_workers: Maximum number of steps to run concurrently.
+        """
+        assert self._orchestrator_run_id
+        step_environment = os.environ.copy()
+        step_environment.update(environment)
+        step_environment[
+            ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID
+        ] = self._orchestrator_run_id
+        step_environment[ENV_ZENML_ACTIVE_STACK_ID] = str(stack.id)
+        step_environment[ENV_ZENML_ACTIVE_WORKSPACE_ID] = str(
+            Client().active_workspace.id
+        )
+        entrypoint = StepEntrypointConfiguration.get_entrypoint_command()
+        # Run the step processes from the source root so the user code can be
+        # imported in the same way as in the orchestrator process
+        source_root = source_utils.get_source_root()
+
+        def run_step_in_subprocess(step_name: str) -> None:
+            """Runs a single step in a subprocess.
+
+            Args:
+                step_name: Name of the step to run.
+
+            Raises:
+                RuntimeError: If the step subprocess failed.
+            """
+            arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
+                step_name=step_name, deployment_id=deployment.id
+            )
+            logger.info("Running step `%s` in a subprocess.", step_name)
+            return_code = subprocess.call(
+                entrypoint + arguments,
+                env=step_environment,
+                cwd=source_root,
+            )
+
+            if return_code != 0:
+                raise RuntimeError(
+                    f"Step `{step_name}` failed with exit code {return_code}."
+                )
+
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in deployment.step_configurations.items()
+        }
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=run_step_in_subprocess,
+            max_parallelism=max_workers,
+            failure_policy=FailurePolicy.FAIL_FAST,
+        ).run()
+
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
 
@@ -105,13 +215,34 @@ class LocalOrchestrator(BaseOrchestrator):
         Returns:
             The orchestrator run id.
         """
-        if not self._orchestrator_run_id:
-            raise RuntimeError("No run id set.")
+        if self._orchestrator_run_id:
+            return self._orchestrator_run_id
+
+        # Steps that run in a separate process in parallel mode get the run id
+        # of the parent orchestrator process passed in an environment variable
+        if ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID in os.environ:
+            return os.environ[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID]
+
+        raise RuntimeError("No run id set.")
+
+
+class LocalOrchestratorSettings(BaseSettings):
+    """Local orchestrator settings.
+
+    Attributes:
+        max_workers: Maximum number of steps to run concurrently. With the
+            default value of `1`, all steps run sequentially inside the
+            orchestrator process. Higher values enable a parallel mode in
+            which every step whose upstream steps have finished is started
+            in a separate Python process.
+    """
 
-        return self._orchestrator_run_id
+    max_workers: PositiveInt = 1
 
 
-class LocalOrchestratorConfig(BaseOrchestratorConfig):
+class LocalOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
+    BaseOrchestratorConfig, LocalOrchestratorSettings
+):
     """Local orchestrator config."""
 
     @property
@@ -14,14 +14,19 @@
 """Utilities for outputs."""
 
 import os
-from typing import TYPE_CHECKING, Dict, Sequence
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
 
+from zenml.client import Client
 from zenml.io import fileio
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from zenml.artifact_stores import BaseArtifactStore
+    from zenml.config.source import Source
     from zenml.config.step_configurations import Step
+    from zenml.models.artifact_models import ArtifactResponseModel
     from zenml.models.step_run_models import StepRunResponseModel
     from zenml.stack import Stack
 
@@ -91,3 +96,38 @@ def remove_artifact_dirs(artifact_uris: Sequence[str]) -> None:
     for artifact_uri in artifact_uris:
         if fileio.isdir(artifact_uri):
             fileio.rmtree(artifact_uri)
+
+
+def find_duplicate_artifact(
+    artifact_store_id: "UUID",
+    content_hash: str,
+    materializer: "Source",
+    data_type: "Source",
+) -> Optional["ArtifactResponseModel"]:
+    """Finds an existing artifact with the same content.
+
+    Args:
+        artifact_store_id: The ID of the artifact store in which to look for
+            the artifact.
+        content_hash: The content hash of the artifact.
+        materializer: The materializer used to save the artifact.
+        data_type: The data type of the artifact.
+
+    Returns:
+        An artifact of the artifact store with the same content, materializer
+        and data type whose data still exists, or `None` if no such artifact
+        exists.
+    """
+    client = Client()
+    for artifact in client.iter_items(
+        client.list_artifacts,
+        artifact_store_id=artifact_store_id,
+        content_hash=content_hash,
+    ):
+        if (
+            artifact.materializer.import_path == materializer.import_path
+            and artifact.data_type.import_path == data_type.import_path
+            and fileio.exists(artifact.uri)
+        ):
+            return artifact
+    return None
@@ -15,7 +15,7 @@
 
 from datetime import datetime
 from functools import partial
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus
@@ -37,40 +37,45 @@ if TYPE_CHECKING:
 
 
 def publish_output_artifacts(
-    output_artifacts: Dict[str, "ArtifactRequestModel"]
+    output_artifacts: Dict[str, "ArtifactRequestModel"],
+    output_artifact_metadata: Optional[
+        Dict[str, Dict[str, "MetadataType"]]
+    ] = None,
 ) -> Dict[str, "UUID"]:
-    """Publishes the given output artifacts.
+    """Publishes the given output artifacts and their metadata.
+
+    All artifacts and their metadata are registered in a single store call.
 
     Args:
         output_artifacts: The output artifacts to register.
+        output_artifact_metadata: An optional mapping from output names to
+            metadata of the artifacts.
 
     Returns:
         The IDs of the registered output artifacts.
     """
-    output_artifact_ids = {}
-    client = Client()
-    for name, artifact_model in output_artifacts.items():
-        artifact_response = client.zen_store.create_artifact(artifact_model)
-        output_artifact_ids[name] = artifact_response.id
-    return output_artifact_ids
-
-
-def publish_output_artifact_metadata(
-    output_artifact_ids: Dict[str, "UUID"],
-    output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]],
-) -> None:
-    """Publishes the given output artifact metadata.
-
-    Args:
-        output_artifact_ids: The IDs of the output artifacts.
-        output_artifact_metadata: A mapping from output names to metadata.
-    """
     client = Client()
-    for output_name, artifact_metadata in output_artifact_metadata.items():
-        artifact_id = output_artifact_ids[output_name]
-        client.create_run_metadata(
-            metadata=artifact_metadata, artifact_id=artifact_id
-        )
+    output_artifact_metadata = output_artifact_metadata or {}
+    names = list(output_artifacts)
+    artifact_requests = []
+    for name in names:
+        artifact_request = output_artifacts[name]
+        artifact_metadata = output_artifact_metadata.get(name)
+        if artifact_metadata:
+            artifact_request = artifact_request.copy(
+                update={
+                    "run_metadata": client.build_run_metadata_requests(
+                        metadata=artifact_metadata
+                    )
+                }
+            )
+        artifact_requests.append(artifact_request)
+
+    artifact_responses = client.zen_store.create_artifacts(artifact_requests)
+    return {
+        name: artifact_response.id
+        for name, artifact_response in zip(names, artifact_responses)
+    }
 
 
 def publish_successful_step_run(
@@ -28,15 +28,11 @@ from zenml.models.pipeline_run_models import (
     PipelineRunResponseModel,
 )
 from zenml.models.step_run_models import (
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
 )
-from zenml.orchestrators import (
-    cache_utils,
-    input_utils,
-    output_utils,
-    publish_utils,
-)
+from zenml.orchestrators import cache_utils, output_utils, publish_utils
 from zenml.orchestrators import utils as orchestrator_utils
 from zenml.orchestrators.step_runner import StepRunner
 from zenml.orchestrators.utils import is_setting_enabled
@@ -181,17 +177,17 @@ class StepLauncher:
                 workspace=client.active_workspace.id,
             )
             try:
-                execution_needed, step_run = self._prepare(step_run=step_run)
+                step_run_response = self._prepare(step_run=step_run)
             except:  # noqa: E722
                 logger.error(f"Failed preparing run step `{self._step_name}`.")
                 step_run.status = ExecutionStatus.FAILED
                 step_run.end_time = datetime.utcnow()
+                Client().zen_store.create_run_step(step_run)
                 raise
-            finally:
-                step_run_response = Client().zen_store.create_run_step(
-                    step_run
-                )
 
+            execution_needed = (
+                step_run_response.status != ExecutionStatus.CACHED
+            )
             if execution_needed:
                 try:
                     self._run_step(
@@ -283,60 +279,40 @@ class StepLauncher:
         )
         return client.zen_store.get_or_create_run(pipeline_run)
 
-    def _prepare(
-        self, step_run: StepRunRequestModel
-    ) -> Tuple[bool, StepRunRequestModel]:
-        """Prepares running the step.
+    def _prepare(self, step_run: StepRunRequestModel) -> StepRunResponseModel:
+        """Prepares and registers the step run.
+
+        Resolving the step inputs, computing the cache key, checking for a
+        cached version of the step and registering the step run all happen
+        in a single call to the ZenStore.
 
         Args:
-            step_run: The step to run.
+            step_run: The step run to prepare.
 
         Returns:
-            Tuple that specifies whether the step needs to be executed as
-            well as the response model of the registered step run.
+            The response model of the registered step run. If a cached version
+            of the step exists, the status of the step run will be
+            `ExecutionStatus.CACHED`.
         """
-        input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
-            step=self._step, run_id=step_run.pipeline_run_id
-        )
-        input_artifact_ids = {
-            input_name: artifact.id
-            for input_name, artifact in input_artifacts.items()
-        }
-
-        cache_key = cache_utils.generate_cache_key(
-            step=self._step,
-            input_artifact_ids=input_artifact_ids,
-            artifact_store=self._stack.artifact_store,
-            workspace_id=Client().active_workspace.id,
-        )
-
-        step_run.input_artifacts = input_artifact_ids
-        step_run.parent_step_ids = parent_step_ids
-        step_run.cache_key = cache_key
-
         cache_enabled = is_setting_enabled(
             is_enabled_on_step=self._step.config.enable_cache,
             is_enabled_on_pipeline=self._deployment.pipeline_configuration.enable_cache,
         )
+        artifact_store = self._stack.artifact_store
+        prepare_request = StepRunPrepareRequestModel(
+            **step_run.dict(),
+            artifact_store_id=artifact_store.id,
+            artifact_store_path=artifact_store.path,
+            cache_enabled=cache_enabled,
+        )
+        step_run_response = Client().zen_store.prepare_run_step(
+            prepare_request
+        )
 
-        execution_needed = True
-        if cache_enabled:
-            cached_step_run = cache_utils.get_cached_step_run(
-                cache_key=cache_key
-            )
-            if cached_step_run:
-                logger.info(f"Using cached version of `{self._step_name}`.")
-                execution_needed = False
-                cached_outputs = cached_step_run.output_artifacts
-                step_run.original_step_run_id = cached_step_run.id
-                step_run.output_artifacts = {
-                    output_name: artifact.id
-                    for output_name, artifact in cached_outputs.items()
-                }
-                step_run.status = ExecutionStatus.CACHED
-                step_run.end_time = step_run.start_time
-
-        return execution_needed, step_run
+        if step_run_response.status == ExecutionStatus.CACHED:
+            logger.info(f"Using cached version of `{self._step_name}`.")
+
+        return step_run_response
 
     def _run_step(
         self,
@@ -441,7 +417,14 @@ class StepLauncher:
             input_artifacts: The input artifacts of the current step.
             output_artifact_uris: The output artifact URIs of the current step.
         """
-        runner = StepRunner(step=self._step, stack=self._stack)
+        content_addressed_outputs = cache_utils.get_content_addressed_outputs(
+            step_name=self._step.config.name, deployment=self._deployment
+        )
+        runner = StepRunner(
+            step=self._step,
+            stack=self._stack,
+            content_addressed_outputs=content_addressed_outputs,
+        )
         runner.run(
             input_artifacts=input_artifacts,
             output_artifact_uris=output_artifact_uris,
@@ -15,10 +15,15 @@
 """Class to run steps."""
 
 import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
+    ContextManager,
     Dict,
     List,
     Optional,
@@ -29,8 +34,10 @@ from typing import (
 from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import COMPUTE_CONTENT_HASH, STEP_OUTPUT_MAX_WORKERS
 from zenml.enums import StackComponentType
 from zenml.exceptions import StepInterfaceError
+from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
@@ -39,8 +46,8 @@ from zenml.models.artifact_models import (
     ArtifactResponseModel,
 )
 from zenml.models.visualization_models import VisualizationModel
+from zenml.orchestrators.output_utils import find_duplicate_artifact
 from zenml.orchestrators.publish_utils import (
-    publish_output_artifact_metadata,
     publish_output_artifacts,
     publish_step_run_metadata,
     publish_successful_step_run,
@@ -55,11 +62,16 @@ from zenml.steps.utils import (
 from zenml.utils import source_utils
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
     from zenml.metadata.metadata_types import MetadataType
     from zenml.stack import Stack
 
+    # Future of the custom metadata and content hash of an output
+    AnalysisFuture = Future[Tuple[Dict[str, MetadataType], Optional[str]]]
+
 
 logger = get_logger(__name__)
 
@@ -67,15 +79,25 @@ logger = get_logger(__name__)
 class StepRunner:
     """Class to run steps."""
 
-    def __init__(self, step: "Step", stack: "Stack"):
+    def __init__(
+        self,
+        step: "Step",
+        stack: "Stack",
+        content_addressed_outputs: Collection[str] = (),
+    ):
         """Initializes the step runner.
 
         Args:
             step: The step to run.
             stack: The stack on which the step should run.
+            content_addressed_outputs: The names of the outputs which are
+                inputs of steps with content-addressed caching. The content
+                hash is only computed for these outputs and for deduplicated
+                outputs.
         """
         self._step = step
         self._stack = stack
+        self._content_addressed_outputs = set(content_addressed_outputs)
 
     @property
     def configuration(self) -> StepConfiguration:
@@ -192,11 +214,14 @@ class StepRunner:
 
         output_artifact_ids = publish_output_artifacts(
             output_artifacts=output_artifacts,
-        )
-        publish_output_artifact_metadata(
-            output_artifact_ids=output_artifact_ids,
             output_artifact_metadata=artifact_metadata,
         )
+        self._restore_deduplicated_output_artifacts(
+            output_data=output_data,
+            output_materializers=output_materializers,
+            output_artifact_uris=output_artifact_uris,
+            output_artifacts=output_artifacts,
+        )
 
         # Update the status and output artifacts of the step run.
         publish_successful_step_run(
@@ -369,9 +394,15 @@ class StepRunner:
         ] = source_utils.load_and_validate_class(
             artifact.materializer, expected_class=BaseMaterializer
         )
-        materializer: BaseMaterializer = materializer_class(artifact.uri)
-        materializer.validate_type_compatibility(data_type)
-        return materializer.load(data_type=data_type)
+        artifact_store = self._stack.artifact_store
+        cached_uri: ContextManager[str] = nullcontext(artifact.uri)
+        if artifact.artifact_store_id == artifact_store.id:
+            cached_uri = artifact_store.cached_uri(artifact.uri)
+
+        with cached_uri as uri:
+            materializer: BaseMaterializer = materializer_class(uri)
+            materializer.validate_type_compatibility(data_type)
+            return materializer.load(data_type=data_type)
 
     def _validate_outputs(
         self,
@@ -479,63 +510,296 @@ class StepRunner:
         )
         assert artifact_stores  # Every stack has an artifact store.
         artifact_store_id = artifact_stores[0].id
-        output_artifacts: Dict[str, ArtifactRequestModel] = {}
-        output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]] = {}
+
+        materializers: Dict[str, BaseMaterializer] = {}
         for output_name, return_value in output_data.items():
             materializer_class = output_materializers[output_name]
-            materializer_source = self.configuration.outputs[
-                output_name
-            ].materializer_source
-            uri = output_artifact_uris[output_name]
-            materializer = materializer_class(uri)
+            materializer = materializer_class(
+                output_artifact_uris[output_name]
+            )
             materializer.validate_type_compatibility(type(return_value))
-            materializer.save(return_value)
-
-            # Save artifact visualizations.
-            visualizations: List[VisualizationModel] = []
-            if artifact_visualization_enabled:
-                try:
-                    vis_data = materializer.save_visualizations(return_value)
-                    for vis_uri, vis_type in vis_data.items():
-                        vis_model = VisualizationModel(
-                            type=vis_type,
-                            uri=vis_uri,
-                        )
-                        visualizations.append(vis_model)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to save visualization for output artifact "
-                        f"'{output_name}' of step '{self.configuration.name}': "
-                        f"{e}"
+            materializers[output_name] = materializer
+
+        # The outputs are saved concurrently if more than one worker is
+        # configured using `ZENML_STEP_OUTPUT_MAX_WORKERS`. The metadata and
+        # content hash of an output only depend on the in-memory data, so they
+        # can be computed while the output is being saved.
+        deduplicate = self._stack.artifact_store.config.deduplicate_artifacts
+        save_futures: Dict[
+            str, "Future[Tuple[str, List[VisualizationModel]]]"
+        ] = {}
+        analysis_futures: Dict[str, "AnalysisFuture"] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(STEP_OUTPUT_MAX_WORKERS, 1),
+            thread_name_prefix="zenml-step-output",
+        ) as executor:
+            for output_name, return_value in output_data.items():
+                # The analysis is submitted first: Deduplicating saves wait
+                # for the content hash, which must not be queued behind them.
+                analysis_futures[output_name] = executor.submit(
+                    self._analyze_output_artifact,
+                    output_name=output_name,
+                    materializer=materializers[output_name],
+                    data=return_value,
+                    artifact_metadata_enabled=artifact_metadata_enabled,
+                    compute_content_hash=COMPUTE_CONTENT_HASH
+                    or deduplicate
+                    or output_name in self._content_addressed_outputs,
+                )
+                find_duplicate = None
+                if deduplicate:
+                    find_duplicate = partial(
+                        self._find_duplicate_output_artifact,
+                        output_name=output_name,
+                        data_type=type(return_value),
+                        artifact_store_id=artifact_store_id,
+                        analysis_future=analysis_futures[output_name],
                     )
+                save_futures[output_name] = executor.submit(
+                    self._save_output_artifact,
+                    output_name=output_name,
+                    materializer=materializers[output_name],
+                    data=return_value,
+                    artifact_visualization_enabled=artifact_visualization_enabled,
+                    find_duplicate=find_duplicate,
+                )
+
+        output_artifacts: Dict[str, ArtifactRequestModel] = {}
+        output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]] = {}
+        for output_name, return_value in output_data.items():
+            materializer = materializers[output_name]
+            uri, visualizations = save_futures[output_name].result()
+            custom_metadata, content_hash = analysis_futures[
+                output_name
+            ].result()
+            if uri != materializer.uri:
+                # The output references the data of an existing artifact.
+                materializer = type(materializer)(uri)
 
-            # Get artifact metadata.
             if artifact_metadata_enabled:
                 try:
-                    artifact_metadata = materializer.extract_full_metadata(
+                    # The storage size is only known once the data is saved.
+                    base_metadata = materializer._extract_base_metadata(
                         return_value
                     )
-                    output_artifact_metadata[output_name] = artifact_metadata
+                    output_artifact_metadata[output_name] = {
+                        **base_metadata,
+                        **custom_metadata,
+                    }
                 except Exception as e:
                     logger.warning(
                         f"Failed to extract metadata for output artifact "
                         f"'{output_name}' of step '{self.configuration.name}': "
                         f"{e}"
                     )
+
             output_artifact = ArtifactRequestModel(
                 name=output_name,
-                type=materializer_class.ASSOCIATED_ARTIFACT_TYPE,
-                uri=uri,
-                materializer=materializer_source,
+                type=materializer.ASSOCIATED_ARTIFACT_TYPE,
+                uri=materializer.uri,
+                materializer=self.configuration.outputs[
+                    output_name
+                ].materializer_source,
                 data_type=source_utils.resolve(type(return_value)),
                 user=active_user_id,
                 workspace=active_workspace_id,
                 artifact_store_id=artifact_store_id,
                 visualizations=visualizations,
+                content_hash=content_hash,
             )
             output_artifacts[output_name] = output_artifact
         return output_artifacts, output_artifact_metadata
 
+    def _save_output_artifact(
+        self,
+        output_name: str,
+        materializer: BaseMaterializer,
+        data: Any,
+        artifact_visualization_enabled: bool,
+        find_duplicate: Optional[
+            Callable[[], Optional[ArtifactResponseModel]]
+        ] = None,
+    ) -> Tuple[str, List[VisualizationModel]]:
+        """Saves an output artifact and its visualizations.
+
+        Args:
+            output_name: The name of the output.
+            materializer: The materializer to save the output with.
+            data: The output data.
+            artifact_visualization_enabled: Whether artifact visualization is
+                enabled.
+            find_duplicate: Optional function that finds an existing artifact
+                with the same content. If such an artifact exists, the output
+                is not saved and references the data of the existing artifact
+                instead.
+
+        Returns:
+            The URI and the visualizations of the output artifact.
+        """
+        duplicate = find_duplicate() if find_duplicate else None
+        if duplicate:
+            logger.info(
+                "Output artifact '%s' of step '%s' has the same content as "
+                "the existing artifact `%s`, skipping saving it again.",
+                output_name,
+                self.configuration.name,
+                duplicate.uri,
+            )
+            if fileio.isdir(materializer.uri):
+                fileio.rmtree(materializer.uri)
+            return duplicate.uri, duplicate.visualizations or []
+
+        materializer.save(data)
+
+        # Save artifact visualizations.
+        visualizations: List[VisualizationModel] = []
+        if artifact_visualization_enabled:
+            try:
+                vis_data = materializer.save_visualizations(data)
+                for vis_uri, vis_type in vis_data.items():
+                    vis_model = VisualizationModel(
+                        type=vis_type,
+                        uri=vis_uri,
+                    )
+                    visualizations.append(vis_model)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to save visualization for output artifact "
+                    f"'{output_name}' of step '{self.configuration.name}': "
+                    f"{e}"
+                )
+        return materializer.uri, visualizations
+
+    def _restore_deduplicated_output_artifacts(
+        self,
+        output_data: Dict[str, Any],
+        output_materializers: Dict[str, Type[BaseMaterializer]],
+        output_artifact_uris: Dict[str, str],
+        output_artifacts: Dict[str, ArtifactRequestModel],
+    ) -> None:
+        """Saves deduplicated outputs whose referenced data was deleted.
+
+        The existing artifact referenced by a deduplicated output might get
+        deleted together with its data after it was found, but before the
+        output artifact was registered. The artifact garbage collection checks
+        the references of deduplicated data again right before deleting it,
+        so data that is registered as an output is usually kept. This doesn't
+        fully close the race: If the garbage collection checked the
+        references just before the output artifact was registered, the data
+        might still be deleted after the check below. Such outputs need to be
+        recomputed, e.g. by running the step again without caching.
+
+        Args:
+            output_data: The output data of the step function, mapping output
+                names to return values.
+            output_materializers: The output materializers of the step.
+            output_artifact_uris: The output artifact URIs of the step.
+            output_artifacts: The registered output artifacts of the step.
+        """
+        for output_name, output_artifact in output_artifacts.items():
+            uri = output_artifact.uri
+            if uri == output_artifact_uris[output_name] or fileio.exists(uri):
+                # The output is not deduplicated or its data still exists.
+                continue
+
+            logger.warning(
+                "The data of output artifact '%s' of step '%s' was deleted "
+                "while deduplicating it, saving it again.",
+                output_name,
+                self.configuration.name,
+            )
+            fileio.makedirs(uri)
+            materializer = output_materializers[output_name](uri)
+            materializer.save(output_data[output_name])
+
+    def _find_duplicate_output_artifact(
+        self,
+        output_name: str,
+        data_type: Type[Any],
+        artifact_store_id: "UUID",
+        analysis_future: "AnalysisFuture",
+    ) -> Optional[ArtifactResponseModel]:
+        """Finds an existing artifact with the same content as an output.
+
+        Args:
+            output_name: The name of the output.
+            data_type: The type of the output data.
+            artifact_store_id: The ID of the artifact store of the output.
+            analysis_future: Future of the analysis that computes the content
+                hash of the output.
+
+        Returns:
+            The existing artifact or `None` if the content hash of the output
+            is unknown or no artifact with the same content exists.
+        """
+        _, content_hash = analysis_future.result()
+        if not content_hash:
+            return None
+
+        try:
+            return find_duplicate_artifact(
+                artifact_store_id=artifact_store_id,
+                content_hash=content_hash,
+                materializer=self.configuration.outputs[
+                    output_name
+                ].materializer_source,
+                data_type=source_utils.resolve(data_type),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to look up duplicates of output artifact "
+                f"'{output_name}' of step '{self.configuration.name}': {e}"
+            )
+            return None
+
+    def _analyze_output_artifact(
+        self,
+        output_name: str,
+        materializer: BaseMaterializer,
+        data: Any,
+        artifact_metadata_enabled: bool,
+        compute_content_hash: bool,
+    ) -> Tuple[Dict[str, "MetadataType"], Optional[str]]:
+        """Extracts the custom metadata and content hash of an output.
+
+        Args:
+            output_name: The name of the output.
+            materializer: The materializer of the output.
+            data: The output data.
+            artifact_metadata_enabled: Whether artifact metadata collection is
+                enabled.
+            compute_content_hash: Whether to compute the content hash of the
+                output.
+
+        Returns:
+            The custom metadata and the content hash of the output.
+        """
+        # Get artifact metadata.
+        artifact_metadata: Dict[str, "MetadataType"] = {}
+        if artifact_metadata_enabled:
+            try:
+                artifact_metadata = materializer.extract_metadata(data)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to extract metadata for output artifact "
+                    f"'{output_name}' of step '{self.configuration.name}': "
+                    f"{e}"
+                )
+
+        # Compute the content hash used for content-addressed caching and
+        # deduplication.
+        content_hash = None
+        if compute_content_hash:
+            try:
+                content_hash = materializer.compute_content_hash(data)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to compute content hash for output artifact "
+                    f"'{output_name}' of step '{self.configuration.name}': "
+                    f"{e}"
+                )
+        return artifact_metadata, content_hash
+
     def load_and_run_hook(
         self,
         hook_source: "Source",
@@ -40,7 +40,7 @@ from zenml.exceptions import ProvisioningError, StackValidationError
 from zenml.logger import get_logger
 from zenml.metadata.metadata_types import MetadataType
 from zenml.models import StackResponseModel
-from zenml.utils import settings_utils
+from zenml.utils import secret_utils, settings_utils
 
 if TYPE_CHECKING:
     from zenml.alerter import BaseAlerter
@@ -66,7 +66,6 @@ if TYPE_CHECKING:
     from zenml.secrets_managers import BaseSecretsManager
     from zenml.stack import StackComponent
     from zenml.step_operators import BaseStepOperator
-    from zenml.utils import secret_utils
 
 
 logger = get_logger(__name__)
@@ -207,11 +206,15 @@ class Stack:
             type_: StackComponent.from_model(model[0])
             for type_, model in stack_model.components.items()
         }
-        return Stack.from_components(
+        stack = Stack.from_components(
             id=stack_model.id,
             name=stack_model.name,
             components=stack_components,
         )
+        # Fetch all referenced secrets at once instead of one by one when
+        # the component attributes get accessed
+        secret_utils.prefetch_secrets(stack.required_secrets)
+        return stack
 
     @classmethod
     def from_components(
@@ -696,22 +699,21 @@ class Stack:
 
             missing = []
 
-            client = Client()
-
             # First, attempt to resolve secrets through the secrets store
+            secret_utils.prefetch_secrets(required_secrets)
             for secret_ref in required_secrets.copy():
-                try:
-                    store_secret = client.get_secret(secret_ref.name)
-                    if (
-                        secret_validation_level
-                        == SecretValidationLevel.SECRET_AND_KEY_EXISTS
-                    ):
-                        _ = store_secret.values[secret_ref.key]
-                except (KeyError, NotImplementedError):
-                    pass
-                else:
-                    # Drop this secret from the list of required secrets
-                    required_secrets.remove(secret_ref)
+                store_secret_values = secret_utils.get_store_secret_values(
+                    secret_ref.name
+                )
+                if store_secret_values is None or (
+                    secret_validation_level
+                    == SecretValidationLevel.SECRET_AND_KEY_EXISTS
+                    and secret_ref.key not in store_secret_values
+                ):
+                    continue
+
+                # Drop this secret from the list of required secrets
+                required_secrets.remove(secret_ref)
 
             # If there are still required secrets, continue with the secrets
             # manager
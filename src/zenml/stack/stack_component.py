@@ -34,6 +34,7 @@ if TYPE_CHECKING:
         PipelineDeploymentBaseModel,
         PipelineDeploymentResponseModel,
     )
+    from zenml.secrets_managers import BaseSecretsManager
     from zenml.stack import Stack, StackValidator
 
 logger = get_logger(__name__)
@@ -189,50 +190,62 @@ class StackComponentConfig(BaseModel, ABC):
         secret_ref = secret_utils.parse_secret_reference(value)
 
         # Try to resolve the secret using the secret store first
-        try:
-            store_secret = Client().get_secret_by_name_and_scope(
-                name=secret_ref.name,
-            )
-        except (KeyError, NotImplementedError):
-            pass
-        else:
-            if secret_ref.key in store_secret.values:
-                return store_secret.secret_values[secret_ref.key]
+        store_secret_values = secret_utils.get_store_secret_values(
+            secret_ref.name
+        )
+        if store_secret_values is not None:
+            if secret_ref.key in store_secret_values:
+                return store_secret_values[secret_ref.key]
             else:
                 raise KeyError(
                     f"Failed to resolve secret reference for attribute {key} "
                     f"of stack component `{self}`. "
                     f"The secret {secret_ref.name} does not contain a value "
                     f"for key {secret_ref.key}. Available keys: "
-                    f"{set(store_secret.values)}."
+                    f"{set(store_secret_values)}."
                 )
 
-        # A stack component can be part of many stacks, and currently a
-        # secrets manager is associated with a stack. This means we're
-        # not able to identify the 'correct' secrets manager that the user
-        # wanted to resolve the secrets in a general way. We therefore
-        # limit secret resolving to components of the active stack.
-        if not self._is_part_of_active_stack():
-            raise RuntimeError(
-                f"Failed to resolve secret reference for attribute {key} "
-                f"of stack component `{self}`: The stack component is not "
-                "part of the active stack and therefore can't have it's "
-                "secret references resolved. If you want to access attributes "
-                "of this stack component which reference secrets, set a stack "
-                "which includes both this component and a secrets manager as "
-                "your active stack: `zenml stack set <STACK_NAME>`."
-            )
+        def _get_secrets_manager() -> "BaseSecretsManager":
+            """Gets the secrets manager of the active stack.
+
+            Returns:
+                The secrets manager.
+
+            Raises:
+                RuntimeError: If the stack component is not part of the
+                    active stack, or the active stack is missing a secrets
+                    manager.
+            """
+            # A stack component can be part of many stacks, and currently a
+            # secrets manager is associated with a stack. This means we're
+            # not able to identify the 'correct' secrets manager that the user
+            # wanted to resolve the secrets in a general way. We therefore
+            # limit secret resolving to components of the active stack.
+            if not self._is_part_of_active_stack():
+                raise RuntimeError(
+                    f"Failed to resolve secret reference for attribute {key} "
+                    f"of stack component `{self}`: The stack component is "
+                    "not part of the active stack and therefore can't have "
+                    "it's secret references resolved. If you want to access "
+                    "attributes of this stack component which reference "
+                    "secrets, set a stack which includes both this component "
+                    "and a secrets manager as your active stack: `zenml "
+                    "stack set <STACK_NAME>`."
+                )
 
-        secrets_manager = Client().active_stack.secrets_manager
-        if not secrets_manager:
-            raise RuntimeError(
-                f"Failed to resolve secret reference for attribute {key} "
-                f"of stack component `{self}`: The active stack does not "
-                "have a secrets manager."
-            )
+            secrets_manager = Client().active_stack.secrets_manager
+            if not secrets_manager:
+                raise RuntimeError(
+                    f"Failed to resolve secret reference for attribute {key} "
+                    f"of stack component `{self}`: The active stack does not "
+                    "have a secrets manager."
+                )
+            return secrets_manager
 
         try:
-            secret = secrets_manager.get_secret(secret_ref.name)
+            secret_values = secret_utils.get_secrets_manager_secret_values(
+                secret_ref.name, get_secrets_manager=_get_secrets_manager
+            )
         except KeyError:
             raise KeyError(
                 f"Failed to resolve secret reference for attribute {key} "
@@ -241,13 +254,13 @@ class StackComponentConfig(BaseModel, ABC):
             )
 
         try:
-            secret_value = secret.content[secret_ref.key]
+            secret_value = secret_values[secret_ref.key]
         except KeyError:
             raise KeyError(
                 f"Failed to resolve secret reference for attribute {key} "
                 f"of stack component `{self}`: The secret "
                 f"{secret_ref.name} does not contain a value for key "
-                f"{secret_ref.key}. Available keys: {set(secret.content)}."
+                f"{secret_ref.key}. Available keys: {set(secret_values)}."
             )
 
         return str(secret_value)
@@ -22,7 +22,7 @@ from zenml.entrypoints.step_entrypoint_configuration import (
     STEP_NAME_OPTION,
     StepEntrypointConfiguration,
 )
-from zenml.orchestrators import input_utils, output_utils
+from zenml.orchestrators import cache_utils, output_utils
 from zenml.orchestrators.step_runner import StepRunner
 
 if TYPE_CHECKING:
@@ -91,14 +91,20 @@ class StepOperatorEntrypointConfiguration(StepEntrypointConfiguration):
         )
 
         stack = Client().active_stack
-        input_artifacts, _ = input_utils.resolve_step_inputs(
-            step=step, run_id=pipeline_run.id
-        )
+        # The input artifacts were resolved when the step run was registered
+        input_artifacts = step_run.input_artifacts
         output_artifact_uris = output_utils.prepare_output_artifact_uris(
             step_run=step_run, stack=stack, step=step
         )
 
-        step_runner = StepRunner(step=step, stack=stack)
+        content_addressed_outputs = cache_utils.get_content_addressed_outputs(
+            step_name=step.config.name, deployment=deployment
+        )
+        step_runner = StepRunner(
+            step=step,
+            stack=stack,
+            content_addressed_outputs=content_addressed_outputs,
+        )
         step_runner.run(
             input_artifacts=input_artifacts,
             output_artifact_uris=output_artifact_uris,
@@ -464,7 +464,10 @@ class BaseStep(metaclass=BaseStepMeta):
         parameters = {}
         parameters[
             STEP_SOURCE_PARAMETER_NAME
-        ] = source_code_utils.get_hashed_source_code(self.source_object)
+        ] = source_code_utils.get_hashed_source_code(
+            self.source_object,
+            normalize=bool(self.configuration.content_addressed_cache),
+        )
 
         for name, output in self.configuration.outputs.items():
             if output.materializer_source:
@@ -723,6 +726,7 @@ class BaseStep(metaclass=BaseStepMeta):
         self: T,
         name: Optional[str] = None,
         enable_cache: Optional[bool] = None,
+        content_addressed_cache: Optional[bool] = None,
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
         experiment_tracker: Optional[str] = None,
@@ -752,6 +756,10 @@ class BaseStep(metaclass=BaseStepMeta):
         Args:
             name: The name of the step.
             enable_cache: If caching should be enabled for this step.
+            content_addressed_cache: If the cache key of this step should be
+                computed from the content of the input artifacts and the
+                normalized step source code instead of the input artifact IDs
+                and the raw source code.
             enable_artifact_metadata: If artifact metadata should be enabled
                 for this step.
             enable_artifact_visualization: If artifact visualization should be
@@ -826,6 +834,7 @@ class BaseStep(metaclass=BaseStepMeta):
             {
                 "name": name,
                 "enable_cache": enable_cache,
+                "content_addressed_cache": content_addressed_cache,
                 "enable_artifact_metadata": enable_artifact_metadata,
                 "enable_artifact_visualization": enable_artifact_visualization,
                 "experiment_tracker": experiment_tracker,
@@ -13,23 +13,59 @@
 #  permissions and limitations under the License.
 """Analytics code for ZenML."""
 
+import atexit
+import contextvars
+import os
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache, partial
 from types import TracebackType
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from zenml import __version__
 from zenml.analytics.context import AnalyticsContext as AnalyticsContextV2
-from zenml.constants import IS_DEBUG_ENV, SEGMENT_KEY_DEV, SEGMENT_KEY_PROD
+from zenml.constants import (
+    ANALYTICS_QUEUE_SIZE,
+    IS_DEBUG_ENV,
+    SEGMENT_KEY_DEV,
+    SEGMENT_KEY_PROD,
+)
 from zenml.enums import StoreType
 from zenml.environment import Environment, get_environment
 from zenml.logger import get_logger
 
+if TYPE_CHECKING:
+    from zenml.models.server_models import ServerModel
+    from zenml.zen_stores.base_zen_store import BaseZenStore
+
 logger = get_logger(__name__)
 
+# Maximum number of queued analytics calls that the background worker
+# processes at once
+ANALYTICS_BATCH_SIZE = 100
+# Number of seconds after which an idle background worker stops
+ANALYTICS_WORKER_IDLE_TIMEOUT = 1.0
+ANALYTICS_WORKER_POLL_INTERVAL = 0.1
+# Maximum number of seconds to wait for queued analytics calls on exit
+ANALYTICS_WORKER_FLUSH_TIMEOUT = 2.0
+
 
 class AnalyticsEvent(str, Enum):
     """Enum of events to track in segment."""
@@ -166,6 +202,88 @@ def get_segment_key() -> str:
         return SEGMENT_KEY_PROD
 
 
+@lru_cache()
+def get_system_properties() -> Dict[str, Any]:
+    """Gets the properties of the environment that are tracked with events.
+
+    The properties are computed once per process and must not be modified.
+
+    Returns:
+        The environment properties.
+    """
+    properties: Dict[str, Any] = dict(Environment.get_system_info())
+    properties.update(
+        {
+            "environment": get_environment(),
+            "python_version": Environment.python_version(),
+            "version": __version__,
+        }
+    )
+    return properties
+
+
+# Properties of the store for which they were last fetched
+_store_properties: Tuple[Optional["BaseZenStore"], Dict[str, Any]] = (
+    None,
+    {},
+)
+
+
+def _get_store_properties(zen_store: "BaseZenStore") -> Dict[str, Any]:
+    """Gets the cached analytics properties of a store.
+
+    Args:
+        zen_store: The store.
+
+    Returns:
+        The cached properties, which are reset whenever a different store is
+        used.
+    """
+    global _store_properties
+
+    store, properties = _store_properties
+    if store is not zen_store:
+        properties = {}
+        _store_properties = (zen_store, properties)
+    return properties
+
+
+def get_analytics_user_id(zen_store: "BaseZenStore") -> UUID:
+    """Gets the ID of the active user of a store to track events for.
+
+    The user is only fetched once for each store.
+
+    Args:
+        zen_store: The store.
+
+    Returns:
+        The ID of the active user.
+    """
+    properties = _get_store_properties(zen_store)
+    if "user_id" not in properties:
+        properties["user_id"] = zen_store.get_user().id
+    user_id: UUID = properties["user_id"]
+    return user_id
+
+
+def get_analytics_store_info(zen_store: "BaseZenStore") -> "ServerModel":
+    """Gets the information about a store to track events with.
+
+    The information is only fetched once for each store.
+
+    Args:
+        zen_store: The store.
+
+    Returns:
+        The store information.
+    """
+    properties = _get_store_properties(zen_store)
+    if "store_info" not in properties:
+        properties["store_info"] = zen_store.get_store_info()
+    store_info: "ServerModel" = properties["store_info"]
+    return store_info
+
+
 class AnalyticsContext:
     """Context manager for analytics."""
 
@@ -339,35 +457,28 @@ class AnalyticsContext:
             return False
 
         # add basics
-        properties.update(Environment.get_system_info())
-        properties.update(
-            {
-                "environment": get_environment(),
-                "python_version": Environment.python_version(),
-                "version": __version__,
-            }
-        )
+        properties.update(get_system_properties())
 
         gc = GlobalConfiguration()
         # avoid initializing the store in the analytics, to not create an
         # infinite loop
         if gc._zen_store is not None:
             zen_store = gc.zen_store
-            user = zen_store.get_user()
+            user_id = get_analytics_user_id(zen_store)
 
             if "client_id" not in properties:
                 properties["client_id"] = self.user_id
             if "user_id" not in properties:
-                properties["user_id"] = str(user.id)
+                properties["user_id"] = str(user_id)
 
             if (
                 zen_store.type == StoreType.REST
                 and "server_id" not in properties
             ):
-                server_info = zen_store.get_store_info()
+                server_info = get_analytics_store_info(zen_store)
                 properties.update(
                     {
-                        "user_id": str(user.id),
+                        "user_id": str(user_id),
                         "server_id": str(server_info.id),
                         "server_deployment": str(server_info.deployment_type),
                         "database_type": str(server_info.database_type),
@@ -391,6 +502,186 @@ class AnalyticsContext:
         return True
 
 
+class _AnalyticsWorker:
+    """Background worker that sends analytics events.
+
+    Analytics calls are put into a bounded queue and processed in batches by
+    a worker thread, so callers never wait for the event properties to be
+    collected or the events to be sent. The worker thread stops once it is
+    idle and is restarted for new calls. It is a daemon thread, so a slow or
+    unreachable analytics server never keeps the process alive. Queued events
+    are flushed for a limited time when the interpreter exits instead.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the worker."""
+        self._queue: "queue.Queue[Callable[[], Any]]" = queue.Queue(
+            maxsize=max(ANALYTICS_QUEUE_SIZE, 0)
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._flushing = threading.Event()
+
+    def submit(self, call: Callable[[], Any]) -> bool:
+        """Submits an analytics call to be run in the background.
+
+        Args:
+            call: The analytics call.
+
+        Returns:
+            True if the call was queued, False if the queue is full.
+        """
+        try:
+            self._queue.put_nowait(call)
+        except queue.Full:
+            logger.debug("Analytics queue is full, dropping analytics call.")
+            return False
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="zenml-analytics", daemon=True
+                )
+                self._thread.start()
+        return True
+
+    def flush(self, timeout: float) -> None:
+        """Waits until all queued calls are processed.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+        """
+        self._flushing.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _stop_if_idle(self) -> bool:
+        """Stops the worker thread if there are no queued calls.
+
+        Returns:
+            True if the worker thread should stop, False otherwise.
+        """
+        with self._lock:
+            if not self._queue.empty():
+                return False
+            self._thread = None
+            return True
+
+    def _run(self) -> None:
+        """Processes queued analytics calls until the worker is idle."""
+        idle_since = time.monotonic()
+        while True:
+            try:
+                calls = [
+                    self._queue.get(timeout=ANALYTICS_WORKER_POLL_INTERVAL)
+                ]
+            except queue.Empty:
+                if (
+                    self._flushing.is_set()
+                    or time.monotonic() - idle_since
+                    > ANALYTICS_WORKER_IDLE_TIMEOUT
+                ) and self._stop_if_idle():
+                    return
+                continue
+
+            while len(calls) < ANALYTICS_BATCH_SIZE:
+                try:
+                    calls.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for call in calls:
+                try:
+                    call()
+                except Exception as e:
+                    logger.debug(f"Sending analytics data failed: {e}")
+
+            idle_since = time.monotonic()
+
+
+_analytics_worker = _AnalyticsWorker()
+
+
+def _flush_analytics_worker() -> None:
+    """Sends the queued analytics calls before the interpreter exits."""
+    _analytics_worker.flush(timeout=ANALYTICS_WORKER_FLUSH_TIMEOUT)
+
+
+atexit.register(_flush_analytics_worker)
+
+
+def _reset_analytics_worker() -> None:
+    """Replaces the analytics worker in a forked child process.
+
+    The worker thread doesn't exist in the child process, and its lock might
+    have been held by another thread at the time of the fork.
+    """
+    global _analytics_worker
+    _analytics_worker = _AnalyticsWorker()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_analytics_worker)
+
+
+def _is_analytics_enabled(event: Optional[str] = None) -> bool:
+    """Checks whether analytics calls should be sent.
+
+    Args:
+        event: The event to send, if any.
+
+    Returns:
+        True if the user opted in to analytics or the event is about opting
+        in or out, False otherwise.
+    """
+    from zenml.config.global_config import GlobalConfiguration
+
+    if event in (
+        AnalyticsEvent.OPT_OUT_ANALYTICS,
+        AnalyticsEvent.OPT_IN_ANALYTICS,
+    ):
+        return True
+
+    try:
+        return GlobalConfiguration().analytics_opt_in
+    except Exception as e:
+        logger.debug(f"Analytics initialization failed: {e}")
+        return False
+
+
+def _send_in_background(
+    send: Callable[..., bool],
+    kwargs: Dict[str, Any],
+    event: Optional[str] = None,
+) -> bool:
+    """Sends analytics data in the background.
+
+    The call runs in the context variables of the caller, which e.g. contain
+    the authenticated user when running inside the ZenML server. If the
+    `ZENML_ANALYTICS_QUEUE_SIZE` environment variable is set to 0, the data
+    is sent synchronously instead.
+
+    Args:
+        send: The function sending the data.
+        kwargs: Keyword arguments for the function.
+        event: The event that gets sent, if any.
+
+    Returns:
+        The result of the function if it was called synchronously, otherwise
+        whether the call was queued.
+    """
+    if ANALYTICS_QUEUE_SIZE <= 0:
+        return send(**kwargs)
+
+    if not _is_analytics_enabled(event):
+        return False
+
+    context = contextvars.copy_context()
+    return _analytics_worker.submit(partial(context.run, send, **kwargs))
+
+
 def identify_user(
     user_metadata: Optional[Dict[str, Any]] = None,
     v1: Optional[bool] = True,
@@ -398,19 +689,42 @@ def identify_user(
 ) -> bool:
     """Attach metadata to user directly.
 
+    The metadata is sent in the background.
+
     Args:
         user_metadata: Dict of metadata to attach to the user.
         v1: Flag to determine whether analytics v1 is included.
         v2: Flag to determine whether analytics v2 is included.
 
     Returns:
-        True if event is sent successfully, False is not.
+        True if event is sent or queued successfully, False is not.
     """
-    success = True
-
     if user_metadata is None:
         return False
 
+    return _send_in_background(
+        _identify_user,
+        kwargs={"user_metadata": dict(user_metadata), "v1": v1, "v2": v2},
+    )
+
+
+def _identify_user(
+    user_metadata: Dict[str, Any],
+    v1: Optional[bool] = True,
+    v2: Optional[bool] = False,
+) -> bool:
+    """Attach metadata to user directly.
+
+    Args:
+        user_metadata: Dict of metadata to attach to the user.
+        v1: Flag to determine whether analytics v1 is included.
+        v2: Flag to determine whether analytics v2 is included.
+
+    Returns:
+        True if event is sent successfully, False is not.
+    """
+    success = True
+
     if v1:
         with AnalyticsContext() as analytics:
             success_v1 = analytics.identify(traits=user_metadata)
@@ -433,6 +747,39 @@ def identify_group(
 ) -> bool:
     """Attach metadata to a segment group.
 
+    The metadata is sent in the background.
+
+    Args:
+        group: Group to track.
+        group_id: ID of the group.
+        group_metadata: Metadata to attach to the group.
+        v1: Flag to determine whether analytics v1 is included.
+        v2: Flag to determine whether analytics v2 is included.
+
+    Returns:
+        True if event is sent or queued successfully, False is not.
+    """
+    return _send_in_background(
+        _identify_group,
+        kwargs={
+            "group": group,
+            "group_id": group_id,
+            "group_metadata": dict(group_metadata or {}),
+            "v1": v1,
+            "v2": v2,
+        },
+    )
+
+
+def _identify_group(
+    group: Union[str, AnalyticsGroup],
+    group_id: UUID,
+    group_metadata: Optional[Dict[str, Any]] = None,
+    v1: Optional[bool] = True,
+    v2: Optional[bool] = False,
+) -> bool:
+    """Attach metadata to a segment group.
+
     Args:
         group: Group to track.
         group_id: ID of the group.
@@ -470,6 +817,8 @@ def track_event(
 ) -> bool:
     """Track segment event if user opted-in.
 
+    The event is sent in the background.
+
     Args:
         event: Name of event to track in segment.
         metadata: Dict of metadata to track.
@@ -477,14 +826,36 @@ def track_event(
         v2: Flag to determine whether analytics v2 is included.
 
     Returns:
-        True if event is sent successfully, False is not.
+        True if event is sent or queued successfully, False is not.
     """
-    success = True
+    metadata = dict(metadata) if metadata else {}
+    metadata.setdefault("event_success", True)
 
-    if metadata is None:
-        metadata = {}
+    return _send_in_background(
+        _track_event,
+        kwargs={"event": event, "metadata": metadata, "v1": v1, "v2": v2},
+        event=event,
+    )
 
-    metadata.setdefault("event_success", True)
+
+def _track_event(
+    event: AnalyticsEvent,
+    metadata: Dict[str, Any],
+    v1: Optional[bool] = True,
+    v2: Optional[bool] = False,
+) -> bool:
+    """Track segment event if user opted-in.
+
+    Args:
+        event: Name of event to track in segment.
+        metadata: Dict of metadata to track.
+        v1: Flag to determine whether analytics v1 is included.
+        v2: Flag to determine whether analytics v2 is included.
+
+    Returns:
+        True if event is sent successfully, False is not.
+    """
+    success = True
 
     if v1:
         with AnalyticsContext() as analytics:
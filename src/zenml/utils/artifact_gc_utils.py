@@ -0,0 +1,525 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Garbage collection of unused artifacts."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from zenml.constants import FILTERING_DATETIME_FORMAT
+from zenml.enums import (
+    ExecutionStatus,
+    GenericFilterOps,
+    StackComponentType,
+)
+from zenml.logger import get_logger
+from zenml.models import ArtifactFilterModel, ArtifactResponseModel
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores import BaseArtifactStore
+    from zenml.client import Client
+    from zenml.models.page_model import Page
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 500
+MAX_WORKERS = 16
+
+
+class ArtifactGarbageCollectionReport(BaseModel):
+    """Report of an artifact garbage collection.
+
+    Attributes:
+        dry_run: Whether the garbage collection only reported what would be
+            deleted without deleting anything.
+        unused_artifact_ids: IDs of the collected artifacts that are not
+            used in any step runs.
+        uris: URIs of the directories deleted from the artifact stores.
+        orphaned_uris: URIs of the directories in the artifact store which
+            don't belong to any artifact.
+        failed_uris: URIs of the directories which could not be deleted.
+    """
+
+    dry_run: bool = False
+    unused_artifact_ids: List[UUID] = []
+    uris: List[str] = []
+    orphaned_uris: List[str] = []
+    failed_uris: List[str] = []
+
+
+def collect_artifact_garbage(
+    older_than: Optional[timedelta] = None,
+    delete_metadata: bool = True,
+    delete_from_artifact_store: bool = True,
+    include_orphaned: bool = False,
+    dry_run: bool = False,
+    client: Optional["Client"] = None,
+) -> ArtifactGarbageCollectionReport:
+    """Deletes all artifacts that are not used in any step runs.
+
+    Unused artifacts are found with a single paginated query and deleted in
+    batches: The metadata of each batch is deleted in one store call, which
+    only deletes artifacts that are still unused at that point. Afterwards,
+    the data of the deleted artifacts is removed from the artifact stores
+    concurrently. Data that is shared with other artifacts because of
+    deduplication is kept.
+
+    Args:
+        older_than: Retention period of unused artifacts. If given, only
+            artifacts that were created longer ago are deleted.
+        delete_metadata: Whether to delete the metadata of the artifacts.
+        delete_from_artifact_store: Whether to delete the data of the
+            artifacts from the artifact stores.
+        include_orphaned: Whether to also delete directories of the artifact
+            store of the active stack that don't belong to any artifact,
+            e.g. outputs of failed steps. See `find_orphaned_artifact_uris`.
+        dry_run: If True, only report what would be deleted.
+        client: The client to use. Defaults to the global client.
+
+    Returns:
+        A report of the (to be) deleted artifacts.
+    """
+    from zenml.client import Client
+
+    client = client or Client()
+    report = ArtifactGarbageCollectionReport(dry_run=dry_run)
+
+    batch: List[ArtifactResponseModel] = []
+    for artifact in _iter_unused_artifacts(client, older_than=older_than):
+        batch.append(artifact)
+        if len(batch) >= BATCH_SIZE:
+            _collect_batch(
+                client,
+                batch,
+                report=report,
+                delete_metadata=delete_metadata,
+                delete_from_artifact_store=delete_from_artifact_store,
+            )
+            batch = []
+    if batch:
+        _collect_batch(
+            client,
+            batch,
+            report=report,
+            delete_metadata=delete_metadata,
+            delete_from_artifact_store=delete_from_artifact_store,
+        )
+
+    if include_orphaned and delete_from_artifact_store:
+        artifact_store = client.active_stack.artifact_store
+        orphaned_uris = find_orphaned_artifact_uris(
+            artifact_store, client=client
+        )
+        report.orphaned_uris.extend(orphaned_uris)
+        if dry_run:
+            report.uris.extend(orphaned_uris)
+        else:
+            _delete_uris(artifact_store, orphaned_uris, report=report)
+
+    return report
+
+
+def _iter_unused_artifacts(
+    client: "Client", older_than: Optional[timedelta]
+) -> Iterator[ArtifactResponseModel]:
+    """Iterates over all unused artifacts of the active workspace.
+
+    Args:
+        client: The client to use.
+        older_than: If given, only artifacts that were created longer ago
+            are returned.
+
+    Returns:
+        An iterator over the unused artifacts.
+    """
+    created = None
+    if older_than is not None:
+        cutoff = datetime.utcnow() - older_than
+        created = (
+            f"{GenericFilterOps.LT.value}:"
+            f"{cutoff.strftime(FILTERING_DATETIME_FORMAT)}"
+        )
+
+    # The pages are walked by cursor, so deleting the artifacts of a page
+    # while iterating doesn't shift the following pages.
+    return client.iter_items(
+        client.list_artifacts, only_unused=True, created=created
+    )
+
+
+def _collect_batch(
+    client: "Client",
+    artifacts: List[ArtifactResponseModel],
+    report: ArtifactGarbageCollectionReport,
+    delete_metadata: bool,
+    delete_from_artifact_store: bool,
+) -> None:
+    """Deletes a batch of unused artifacts.
+
+    Args:
+        client: The client to use.
+        artifacts: The unused artifacts to delete.
+        report: The report to which to add the deleted artifacts.
+        delete_metadata: Whether to delete the metadata of the artifacts.
+        delete_from_artifact_store: Whether to delete the data of the
+            artifacts from the artifact stores.
+    """
+    if delete_metadata and not report.dry_run:
+        deleted_ids = set(
+            client.zen_store.delete_unused_artifacts(
+                [artifact.id for artifact in artifacts]
+            )
+        )
+        # Artifacts that got reused since they were listed are kept.
+        artifacts = [
+            artifact for artifact in artifacts if artifact.id in deleted_ids
+        ]
+    report.unused_artifact_ids.extend(artifact.id for artifact in artifacts)
+
+    if not delete_from_artifact_store:
+        return
+
+    ignored_artifact_ids = {artifact.id for artifact in artifacts}
+    shared_uris = _find_shared_uris(
+        client, artifacts, ignored_artifact_ids=ignored_artifact_ids
+    )
+    uris_by_store: Dict[UUID, Set[str]] = {}
+    for artifact in artifacts:
+        if not artifact.artifact_store_id:
+            logger.warning(
+                "Artifact '%s' does not have an artifact store associated "
+                "with it. Skipping deletion from artifact store.",
+                artifact.uri,
+            )
+        elif artifact.uri not in shared_uris:
+            uris_by_store.setdefault(artifact.artifact_store_id, set()).add(
+                artifact.uri
+            )
+
+    # Deduplicated data might get referenced by a new artifact while the
+    # batch is deleted, so the references are checked again right before the
+    # data is deleted.
+    deduplicated_artifacts = {
+        artifact.uri: artifact
+        for artifact in artifacts
+        if artifact.content_hash
+    }
+
+    def _is_referenced(uri: str) -> bool:
+        artifact = deduplicated_artifacts.get(uri)
+        return artifact is not None and _is_shared(
+            client, artifact, ignored_artifact_ids=ignored_artifact_ids
+        )
+
+    for artifact_store_id, uris in uris_by_store.items():
+        if report.dry_run:
+            report.uris.extend(sorted(uris))
+            continue
+        try:
+            artifact_store = _get_artifact_store(client, artifact_store_id)
+        except Exception as e:
+            logger.error(
+                "Failed to access artifact store '%s'. This might happen if "
+                "your local client does not have access to the artifact "
+                "store or does not have the required integrations "
+                "installed. Full error: %s",
+                artifact_store_id,
+                e,
+            )
+            report.failed_uris.extend(sorted(uris))
+        else:
+            _delete_uris(
+                artifact_store,
+                sorted(uris),
+                report=report,
+                is_referenced=_is_referenced,
+            )
+
+
+def _find_shared_uris(
+    client: "Client",
+    artifacts: List[ArtifactResponseModel],
+    ignored_artifact_ids: Collection[UUID],
+) -> Set[str]:
+    """Finds the URIs of artifacts that are shared with other artifacts.
+
+    Artifact stores that deduplicate artifacts store the data of artifacts
+    with the same content only once, so all these artifacts share the same
+    URI.
+
+    Args:
+        client: The client to use.
+        artifacts: The artifacts to check.
+        ignored_artifact_ids: IDs of artifacts that don't count as references
+            of the data, e.g. because they get deleted as well.
+
+    Returns:
+        The URIs which are still referenced by other artifacts.
+    """
+    # Only artifacts with a content hash are deduplicated. Each shared URI
+    # only needs to be checked once.
+    deduplicated_artifacts = {
+        artifact.uri: artifact
+        for artifact in artifacts
+        if artifact.content_hash
+    }
+    if not deduplicated_artifacts:
+        return set()
+
+    def _is_uri_shared(artifact: ArtifactResponseModel) -> bool:
+        return _is_shared(
+            client, artifact, ignored_artifact_ids=ignored_artifact_ids
+        )
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return {
+            uri
+            for uri, is_shared in zip(
+                deduplicated_artifacts,
+                executor.map(_is_uri_shared, deduplicated_artifacts.values()),
+            )
+            if is_shared
+        }
+
+
+def _is_shared(
+    client: "Client",
+    artifact: ArtifactResponseModel,
+    ignored_artifact_ids: Collection[UUID],
+) -> bool:
+    """Checks whether the data of an artifact is shared with other artifacts.
+
+    Args:
+        client: The client to use.
+        artifact: The artifact to check.
+        ignored_artifact_ids: IDs of artifacts that don't count as references
+            of the data, e.g. because they get deleted as well.
+
+    Returns:
+        Whether the data is referenced by any artifact that isn't ignored.
+    """
+
+    def _list_references(
+        after: Optional[str] = None, skip_count: bool = False
+    ) -> "Page[ArtifactResponseModel]":
+        return client.zen_store.list_artifacts(
+            ArtifactFilterModel(
+                artifact_store_id=artifact.artifact_store_id,
+                content_hash=artifact.content_hash,
+                uri=f"{GenericFilterOps.EQUALS.value}:{artifact.uri}",
+                after=after,
+                skip_count=skip_count,
+            )
+        )
+
+    # The ignored artifacts might fill more than one page, so the pages are
+    # fetched until a reference which isn't ignored is found.
+    return any(
+        reference.id not in ignored_artifact_ids
+        for reference in client.iter_items(_list_references)
+    )
+
+
+def _get_artifact_store(
+    client: "Client", artifact_store_id: UUID
+) -> "BaseArtifactStore":
+    """Instantiates a registered artifact store.
+
+    Args:
+        client: The client to use.
+        artifact_store_id: The ID of the artifact store.
+
+    Returns:
+        The artifact store.
+    """
+    from zenml.artifact_stores import BaseArtifactStore
+    from zenml.stack.stack_component import StackComponent
+
+    artifact_store_model = client.get_stack_component(
+        component_type=StackComponentType.ARTIFACT_STORE,
+        name_id_or_prefix=artifact_store_id,
+    )
+    artifact_store = StackComponent.from_model(artifact_store_model)
+    assert isinstance(artifact_store, BaseArtifactStore)
+    return artifact_store
+
+
+def _delete_uris(
+    artifact_store: "BaseArtifactStore",
+    uris: List[str],
+    report: ArtifactGarbageCollectionReport,
+    is_referenced: Optional[Callable[[str], bool]] = None,
+) -> None:
+    """Deletes directories from an artifact store concurrently.
+
+    Args:
+        artifact_store: The artifact store.
+        uris: The URIs of the directories to delete.
+        report: The report to which to add the deleted URIs.
+        is_referenced: Optional function which is called right before a
+            directory is deleted. Directories for which it returns True are
+            kept.
+    """
+
+    def _delete(uri: str) -> Tuple[bool, Optional[Exception]]:
+        try:
+            if is_referenced and is_referenced(uri):
+                return False, None
+            artifact_store.rmtree(uri)
+        except Exception as e:
+            return False, e
+        return True, None
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for uri, (deleted, error) in zip(uris, executor.map(_delete, uris)):
+            if not deleted and not error:
+                logger.debug(
+                    "Keeping '%s' as it is referenced by a new artifact.", uri
+                )
+            elif error:
+                logger.error(
+                    "Failed to delete '%s' from the artifact store: %s",
+                    uri,
+                    error,
+                )
+                report.failed_uris.append(uri)
+            else:
+                logger.debug("Deleted '%s' from the artifact store.", uri)
+                report.uris.append(uri)
+
+
+def _list_subdirectories(
+    artifact_store: "BaseArtifactStore", path: str
+) -> List[str]:
+    """Lists the paths of all entries of an artifact store directory.
+
+    Args:
+        artifact_store: The artifact store.
+        path: The path of the directory.
+
+    Returns:
+        The paths of all entries, or an empty list if the path is not a
+        directory.
+    """
+    try:
+        names = artifact_store.listdir(path)
+    except Exception:
+        return []
+    return [os.path.join(path, str(name)) for name in names]
+
+
+def _is_step_run_id(name: str) -> bool:
+    """Checks whether a path segment is the ID of a step run.
+
+    Args:
+        name: The path segment.
+
+    Returns:
+        Whether the segment is a UUID in its canonical string form.
+    """
+    try:
+        return str(UUID(name)) == name
+    except ValueError:
+        return False
+
+
+def find_orphaned_artifact_uris(
+    artifact_store: "BaseArtifactStore",
+    client: Optional["Client"] = None,
+) -> List[str]:
+    """Finds artifact directories that don't belong to any artifact.
+
+    Artifacts are stored in directories with the layout
+    `<artifact_store_path>/<step>/<output>/<step_run_id>`. Such directories
+    are orphaned if no artifact (of any workspace or artifact store) has them
+    as URI and their step run either doesn't exist anymore or failed, e.g. the
+    outputs of failed steps or the data of artifacts whose runs and metadata
+    were deleted. Directories of running, completed or cached step runs are
+    never orphaned. The levels of the artifact store are listed concurrently.
+
+    Args:
+        artifact_store: The artifact store to scan.
+        client: The client to use. Defaults to the global client.
+
+    Returns:
+        The sorted URIs of all orphaned directories.
+    """
+    from zenml.client import Client
+
+    client = client or Client()
+
+    def _list_artifacts(
+        after: Optional[str] = None, skip_count: bool = False
+    ) -> "Page[ArtifactResponseModel]":
+        return client.zen_store.list_artifacts(
+            ArtifactFilterModel(after=after, skip_count=skip_count)
+        )
+
+    # Artifacts of all artifact stores are considered, as the artifact store
+    # ID of an artifact might be missing or differ for artifact stores that
+    # share a path.
+    known_uris = {
+        os.path.normpath(artifact.uri)
+        for artifact in client.iter_items(_list_artifacts)
+    }
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        paths = [artifact_store.path]
+        for _ in range(3):
+            paths = [
+                path
+                for subdirectories in executor.map(
+                    lambda path: _list_subdirectories(artifact_store, path),
+                    paths,
+                )
+                for path in subdirectories
+            ]
+
+        candidates = [
+            path
+            for path in paths
+            if _is_step_run_id(os.path.basename(path))
+            and os.path.normpath(path) not in known_uris
+        ]
+
+        def _is_step_run_orphaned(path: str) -> bool:
+            try:
+                step_run = client.zen_store.get_run_step(
+                    UUID(os.path.basename(path))
+                )
+            except KeyError:
+                return True
+            return step_run.status == ExecutionStatus.FAILED
+
+        return sorted(
+            path
+            for path, is_orphaned in zip(
+                candidates, executor.map(_is_step_run_orphaned, candidates)
+            )
+            if is_orphaned
+        )
@@ -16,7 +16,8 @@
 import base64
 import os
 import tempfile
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager, Optional, Union, cast
 
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
@@ -115,19 +116,24 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
     Returns:
         The artifact loaded into memory.
     """
-    artifact_store_loaded = False
+    artifact_store: Optional["BaseArtifactStore"] = None
     if artifact.artifact_store_id:
         try:
             artifact_store_model = Client().get_stack_component(
                 component_type=StackComponentType.ARTIFACT_STORE,
                 name_id_or_prefix=artifact.artifact_store_id,
             )
-            _ = StackComponent.from_model(artifact_store_model)
-            artifact_store_loaded = True
+            artifact_store = cast(
+                "BaseArtifactStore",
+                StackComponent.from_model(artifact_store_model),
+            )
         except KeyError:
             pass
 
-    if not artifact_store_loaded:
+    cached_uri: ContextManager[str] = nullcontext(artifact.uri)
+    if artifact_store is not None:
+        cached_uri = artifact_store.cached_uri(artifact.uri)
+    else:
         logger.warning(
             "Unable to restore artifact store while trying to load artifact "
             "`%s`. If this artifact is stored in a remote artifact store, "
@@ -135,11 +141,12 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
             artifact.id,
         )
 
-    return _load_artifact(
-        materializer=artifact.materializer,
-        data_type=artifact.data_type,
-        uri=artifact.uri,
-    )
+    with cached_uri as uri:
+        return _load_artifact(
+            materializer=artifact.materializer,
+            data_type=artifact.data_type,
+            uri=uri,
+        )
 
 
 def _load_artifact(
@@ -15,8 +15,9 @@
 
 import fnmatch
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
 import click
 
@@ -97,7 +98,10 @@ def read_file_contents_as_string(file_path: str) -> str:
 
 
 def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: Optional[int] = 1,
 ) -> None:
     """Copies dir from source to destination.
 
@@ -105,7 +109,43 @@ def copy_dir(
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: Maximum number of files to copy in parallel. If `None`,
+            the default number of workers of a `ThreadPoolExecutor` is used.
     """
+    file_pairs = _collect_files_to_copy(source_dir, destination_dir)
+
+    if max_workers == 1 or len(file_pairs) <= 1:
+        for source_path, destination_path in file_pairs:
+            copy(source_path, destination_path, overwrite)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy, source_path, destination_path, overwrite)
+            for source_path, destination_path in file_pairs
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _collect_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> List[Tuple[str, str]]:
+    """Creates the destination directories and collects the files to copy.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+
+    Returns:
+        Tuples of source and destination path for each file to copy.
+    """
+    file_pairs = []
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
         destination_path = os.path.join(
@@ -116,12 +156,15 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
+            file_pairs.extend(
+                _collect_files_to_copy(source_path, destination_path)
+            )
         else:
             create_dir_recursive_if_not_exists(
                 os.path.dirname(destination_path)
             )
-            copy(str(source_path), str(destination_path), overwrite)
+            file_pairs.append((str(source_path), str(destination_path)))
+    return file_pairs
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
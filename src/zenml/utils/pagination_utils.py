@@ -13,7 +13,10 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Callable, List, TypeVar
+import inspect
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, Optional, TypeVar
 
 from zenml.models import (
     BaseResponseModel,
@@ -23,21 +26,198 @@ from zenml.models import (
 AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
 
 
+def _supports_cursor(
+    list_method: Callable[..., Page[AnyResponseModel]]
+) -> bool:
+    """Checks whether a list method supports cursor-based pagination.
+
+    Args:
+        list_method: The list method to check.
+
+    Returns:
+        Whether the list method accepts the `after` and `skip_count`
+        arguments.
+    """
+    try:
+        parameters = inspect.signature(list_method).parameters
+    except (TypeError, ValueError):
+        return False
+    return "after" in parameters and "skip_count" in parameters
+
+
+def _iter_pages_by_cursor(
+    list_method: Callable[..., Page[AnyResponseModel]],
+    page: Page[AnyResponseModel],
+    prefetch: bool,
+) -> Iterator[Page[AnyResponseModel]]:
+    """Iterate over all pages of a list method using cursors.
+
+    Args:
+        list_method: The list method to wrap around. Must support cursor-based
+            pagination.
+        page: The first page, which was fetched without counting.
+        prefetch: Whether to fetch the next page in a background thread while
+            the current page is processed.
+
+    Yields:
+        The pages in order.
+    """
+    if not prefetch:
+        yield page
+        while page.next_cursor:
+            page = list_method(after=page.next_cursor, skip_count=True)
+            yield page
+        return
+
+    future: Optional["Future[Page[AnyResponseModel]]"] = None
+    executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="zenml-page-prefetch"
+    )
+    try:
+        while True:
+            future = None
+            if page.next_cursor:
+                future = executor.submit(
+                    list_method, after=page.next_cursor, skip_count=True
+                )
+            yield page
+            if future is None:
+                return
+            page = future.result()
+    finally:
+        # Don't wait for a page that was requested but won't be consumed
+        # anymore if the iteration is stopped early.
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _iter_pages_by_number(
+    list_method: Callable[..., Page[AnyResponseModel]],
+    page: Page[AnyResponseModel],
+    prefetch: int,
+) -> Iterator[Page[AnyResponseModel]]:
+    """Iterate over all pages of a list method using page numbers.
+
+    Args:
+        list_method: The list method to wrap around.
+        page: The first page.
+        prefetch: The number of pages to fetch concurrently ahead of the page
+            that is currently being processed.
+
+    Yields:
+        The pages in order.
+    """
+    yield page
+
+    if prefetch == 0:
+        while page.index < page.total_pages:
+            page = list_method(page=page.index + 1)
+            yield page
+        return
+
+    total_pages = page.total_pages
+    next_index = page.index + 1
+    futures: Deque["Future[Page[AnyResponseModel]]"] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="zenml-page-prefetch"
+    )
+    try:
+        while next_index <= total_pages or futures:
+            while next_index <= total_pages and len(futures) < prefetch:
+                futures.append(executor.submit(list_method, page=next_index))
+                next_index += 1
+            yield futures.popleft().result()
+    finally:
+        # Don't wait for pages that were requested but won't be consumed
+        # anymore if the iteration is stopped early.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_pages(
+    list_method: Callable[..., Page[AnyResponseModel]],
+    prefetch: int = 0,
+) -> Iterator[Page[AnyResponseModel]]:
+    """Iterate over all pages of a client or store method that returns pages.
+
+    Pages are fetched lazily while iterating. List methods that support
+    cursor-based pagination are walked using the cursor of the previous page
+    and without counting the total amount of items. As each request needs the
+    cursor of the previous page, prefetching only requests the next page in a
+    background thread while the current page is processed. For other list
+    methods, and for servers that ignore the cursor arguments and don't
+    return a cursor, the pages following the first one are requested by their
+    page number in background threads so that up to `prefetch` requests are
+    in flight while the current page is processed.
+
+    Args:
+        list_method: The list method to wrap around.
+        prefetch: The number of pages to fetch concurrently ahead of the page
+            that is currently being processed.
+
+    Yields:
+        The pages in order.
+
+    Raises:
+        ValueError: If the prefetch value is negative.
+    """
+    if prefetch < 0:
+        raise ValueError(
+            f"Invalid prefetch value {prefetch}. The number of pages to "
+            "prefetch must not be negative."
+        )
+
+    if _supports_cursor(list_method):
+        page = list_method(skip_count=True)
+        if page.next_cursor:
+            yield from _iter_pages_by_cursor(
+                list_method, page=page, prefetch=prefetch > 0
+            )
+            return
+        # Either this is the only page, or the list method is backed by an
+        # older server which ignores the cursor arguments. In the latter case
+        # the items were counted, so the remaining pages can be requested by
+        # their page number.
+    else:
+        page = list_method()
+
+    yield from _iter_pages_by_number(list_method, page=page, prefetch=prefetch)
+
+
+def iter_items(
+    list_method: Callable[..., Page[AnyResponseModel]],
+    prefetch: int = 0,
+) -> Iterator[AnyResponseModel]:
+    """Iterate over all items of a client or store method that returns pages.
+
+    Args:
+        list_method: The list method to wrap around.
+        prefetch: The number of pages to fetch concurrently ahead of the page
+            that is currently being processed.
+
+    Yields:
+        The items of all pages in order.
+    """
+    for page in iter_pages(list_method, prefetch=prefetch):
+        yield from page.items
+
+
 def depaginate(
     list_method: Callable[..., Page[AnyResponseModel]],
 ) -> List[AnyResponseModel]:
     """Depaginate the results from a client or store method that returns pages.
 
+    If the list method supports cursor-based pagination and returns cursors,
+    the pages are fetched using the cursor of the previous page and without
+    counting the total amount of items, which keeps the cost of each page
+    request constant.
+
     Args:
         list_method: The list method to wrap around.
 
     Returns:
         A list of the corresponding Response Models.
     """
-    page = list_method()
-    items = list(page.items)
-    while page.index < page.total_pages:
-        page = list_method(page=page.index + 1)
-        items += list(page.items)
-
-    return items
+    return list(iter_items(list_method))
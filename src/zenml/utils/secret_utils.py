@@ -13,13 +13,33 @@
 #  permissions and limitations under the License.
 """Utility functions for secrets and secret references."""
 import re
-from typing import TYPE_CHECKING, Any, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from pydantic import Field
 
+from zenml.constants import SECRET_CACHE_SIZE, SECRET_CACHE_TTL
+from zenml.enums import StackComponentType
+from zenml.logger import get_logger
+from zenml.zen_stores.store_cache import TTLStoreCache
+
 if TYPE_CHECKING:
     from pydantic.fields import ModelField
 
+    from zenml.secrets_managers import BaseSecretsManager
+
+logger = get_logger(__name__)
+
 _secret_reference_expression = re.compile(r"\{\{\S+?\.\S+\}\}")
 
 PYDANTIC_SENSITIVE_FIELD_MARKER = "sensitive"
@@ -127,3 +147,162 @@ def is_clear_text_field(field: "ModelField") -> bool:
         `True` if the field prevents secret references, `False` otherwise.
     """
     return field.field_info.extra.get(PYDANTIC_CLEAR_TEXT_FIELD_MARKER, False)
+
+
+STORE_SECRET_CACHE_KIND = "store_secret"
+SECRETS_MANAGER_SECRET_CACHE_KIND = "secrets_manager_secret"
+PREFETCH_MAX_WORKERS = 8
+
+# Marks secrets that don't exist in the secrets store, so resolving them
+# through a secrets manager doesn't query the secrets store every time
+_MISSING_SECRET: Dict[str, Any] = {}
+
+_secret_cache = TTLStoreCache(ttl=SECRET_CACHE_TTL, max_size=SECRET_CACHE_SIZE)
+
+
+def _get_cache_scope() -> Tuple[Hashable, ...]:
+    """Gets the scope of the secret cache entries of the active client.
+
+    The same secret name can refer to different secrets depending on the
+    store, user and workspace of the client, which can all change during the
+    lifetime of a process.
+
+    Returns:
+        The URL of the store and the IDs of the active user and workspace.
+    """
+    from zenml.client import Client
+
+    client = Client()
+    return (
+        client.zen_store.url,
+        client.active_user.id,
+        client.active_workspace.id,
+    )
+
+
+def _get_store_secret_cache_key(name: str) -> Tuple[str, Hashable]:
+    """Gets the cache key of a secret of the secrets store.
+
+    Args:
+        name: The name of the secret.
+
+    Returns:
+        The cache key.
+    """
+    return STORE_SECRET_CACHE_KIND, (*_get_cache_scope(), name)
+
+
+def get_store_secret_values(name: str) -> Optional[Dict[str, str]]:
+    """Gets the values of a secret of the secrets store.
+
+    The values are cached for `ZENML_SECRET_CACHE_TTL` seconds.
+
+    Args:
+        name: The name of the secret.
+
+    Returns:
+        The secret values, or `None` if the secret doesn't exist or the
+        secrets store is not supported by the ZenML deployment.
+    """
+    from zenml.client import Client
+
+    key = _get_store_secret_cache_key(name)
+    values = _secret_cache.get(key)
+    if values is None:
+        try:
+            values = Client().get_secret_by_name_and_scope(name).secret_values
+        except (KeyError, NotImplementedError):
+            values = _MISSING_SECRET
+        _secret_cache.set(key, values)
+
+    return None if values is _MISSING_SECRET else values
+
+
+def get_secrets_manager_secret_values(
+    name: str, get_secrets_manager: Callable[[], "BaseSecretsManager"]
+) -> Dict[str, Any]:
+    """Gets the values of a secret of the secrets manager of the active stack.
+
+    The values are cached for `ZENML_SECRET_CACHE_TTL` seconds.
+
+    Args:
+        name: The name of the secret.
+        get_secrets_manager: Function returning the secrets manager. It only
+            gets called if the secret is not cached.
+
+    Returns:
+        The secret values.
+
+    Raises:
+        KeyError: If the secret doesn't exist.
+    """
+    from zenml.client import Client
+
+    secrets_managers = Client().active_stack_model.components.get(
+        StackComponentType.SECRETS_MANAGER
+    )
+    if not secrets_managers:
+        # Raises an error describing the missing secrets manager
+        return dict(get_secrets_manager().get_secret(name).content)
+
+    key = (
+        SECRETS_MANAGER_SECRET_CACHE_KIND,
+        (*_get_cache_scope(), secrets_managers[0].id, name),
+    )
+    values = _secret_cache.get(key)
+    if values is None:
+        values = dict(get_secrets_manager().get_secret(name).content)
+        _secret_cache.set(key, values)
+    return values
+
+
+def prefetch_secrets(secret_references: Iterable[SecretReference]) -> None:
+    """Fetches the secrets of secret references into the cache.
+
+    Secrets are fetched concurrently, so resolving all secret references of a
+    stack takes about as long as resolving a single one. Failures are ignored
+    here and reported once the secret reference gets resolved.
+
+    Args:
+        secret_references: The secret references to prefetch.
+    """
+    if SECRET_CACHE_TTL <= 0 or SECRET_CACHE_SIZE <= 0:
+        return
+
+    names = {
+        reference.name
+        for reference in secret_references
+        if _secret_cache.get(_get_store_secret_cache_key(reference.name))
+        is None
+    }
+    if not names:
+        return
+
+    def _prefetch(name: str) -> None:
+        try:
+            get_store_secret_values(name)
+        except Exception as e:
+            logger.debug("Failed to prefetch secret `%s`: %s", name, e)
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(names), PREFETCH_MAX_WORKERS)
+    ) as executor:
+        list(executor.map(_prefetch, names))
+
+
+def refresh_secret_cache(name: Optional[str] = None) -> None:
+    """Removes secrets from the secret cache.
+
+    Call this if secrets were changed by another process and the changes
+    need to take effect before the cache entries expire.
+
+    Args:
+        name: The name of the secret to refresh. If not given, all secrets
+            are refreshed.
+    """
+    if name is None:
+        _secret_cache.invalidate(STORE_SECRET_CACHE_KIND)
+        _secret_cache.invalidate(SECRETS_MANAGER_SECRET_CACHE_KIND)
+    else:
+        _secret_cache.invalidate(*_get_store_secret_cache_key(name))
+        _secret_cache.invalidate(SECRETS_MANAGER_SECRET_CACHE_KIND, name)
@@ -12,9 +12,11 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Utilities for getting the source code of objects."""
+import ast
 import hashlib
 import inspect
 import sys
+import textwrap
 from types import (
     CodeType,
     FrameType,
@@ -99,11 +101,45 @@ def get_source_code(value: Any) -> str:
     return src
 
 
-def get_hashed_source_code(value: Any) -> str:
+def normalize_source_code(source_code: str) -> str:
+    """Normalizes source code so it only depends on its syntax tree.
+
+    Comments, docstrings, indentation and formatting do not influence the
+    normalized source code. If the source code can't be parsed, it is
+    returned unchanged.
+
+    Args:
+        source_code: The source code to normalize.
+
+    Returns:
+        The normalized source code.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(source_code))
+    except SyntaxError:
+        return source_code
+
+    for node in ast.walk(tree):
+        if not isinstance(
+            node,
+            (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef),
+        ):
+            continue
+
+        if ast.get_docstring(node, clean=False) is not None:
+            node.body = node.body[1:] or [ast.Pass()]
+
+    return ast.dump(tree, annotate_fields=False)
+
+
+def get_hashed_source_code(value: Any, normalize: bool = False) -> str:
     """Returns a hash of the objects source code.
 
     Args:
         value: object to get source from.
+        normalize: If `True`, the source code gets normalized before hashing
+            so that changes to comments, docstrings or formatting don't
+            change the hash.
 
     Returns:
         Hash of source code.
@@ -117,4 +153,6 @@ def get_hashed_source_code(value: Any) -> str:
         raise TypeError(
             f"Unable to compute the hash of source code of object: {value}."
         )
+    if normalize:
+        source_code = normalize_source_code(source_code)
     return hashlib.sha256(source_code.encode("utf-8")).hexdigest()
@@ -24,7 +24,10 @@ from types import FunctionType, ModuleType
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterator,
+    List,
+    Mapping,
     Optional,
     Type,
     Union,
@@ -45,6 +48,15 @@ logger = get_logger(__name__)
 
 _CUSTOM_SOURCE_ROOT: Optional[str] = None
 
+# Index of the installed distribution packages. The entries are computed on
+# first use and reset whenever `sys.path` changes, as the path determines which
+# distribution packages are found.
+_DISTRIBUTION_INDEX_PATH: Optional[List[str]] = None
+_SITE_PACKAGES_DIRS: Optional[List[Path]] = None
+_PACKAGES_DISTRIBUTIONS: Optional[Mapping[str, List[str]]] = None
+_PACKAGE_VERSIONS: Dict[str, Optional[str]] = {}
+_STANDARD_LIB_ROOT: Optional[Path] = None
+
 
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
@@ -266,8 +278,12 @@ def is_standard_lib_file(file_path: str) -> bool:
         True if the file belongs to the Python standard library, False
         otherwise.
     """
-    stdlib_root = get_python_lib(standard_lib=True)
-    return Path(stdlib_root).resolve() in Path(file_path).resolve().parents
+    global _STANDARD_LIB_ROOT
+
+    if _STANDARD_LIB_ROOT is None:
+        _STANDARD_LIB_ROOT = Path(get_python_lib(standard_lib=True)).resolve()
+
+    return _STANDARD_LIB_ROOT in Path(file_path).resolve().parents
 
 
 def is_distribution_package_file(file_path: str, module_name: str) -> bool:
@@ -283,8 +299,8 @@ def is_distribution_package_file(file_path: str, module_name: str) -> bool:
     """
     absolute_file_path = Path(file_path).resolve()
 
-    for path in site.getsitepackages() + [site.getusersitepackages()]:
-        if Path(path).resolve() in absolute_file_path.parents:
+    for path in _get_site_packages_dirs():
+        if path in absolute_file_path.parents:
             return True
 
     if _get_package_for_module(module_name=module_name):
@@ -486,13 +502,8 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     Returns:
         The package name or None if no package was found.
     """
-    if sys.version_info < (3, 10):
-        from importlib_metadata import packages_distributions
-    else:
-        from importlib.metadata import packages_distributions
-
     top_level_module = module_name.split(".", maxsplit=1)[0]
-    package_names = packages_distributions().get(top_level_module, [])
+    package_names = _get_packages_distributions().get(top_level_module, [])
 
     if len(package_names) == 1:
         return package_names[0]
@@ -510,6 +521,12 @@ def _get_package_version(package_name: str) -> Optional[str]:
     Returns:
         The package version or None if fetching the version failed.
     """
+    _refresh_distribution_index()
+    try:
+        return _PACKAGE_VERSIONS[package_name]
+    except KeyError:
+        pass
+
     if sys.version_info < (3, 10):
         from importlib_metadata import PackageNotFoundError, version
 
@@ -517,10 +534,81 @@ def _get_package_version(package_name: str) -> Optional[str]:
     else:
         from importlib.metadata import PackageNotFoundError, version
 
+    package_version: Optional[str]
     try:
-        return version(distribution_name=package_name)
+        package_version = version(distribution_name=package_name)
     except (ValueError, PackageNotFoundError):
-        return None
+        package_version = None
+
+    _PACKAGE_VERSIONS[package_name] = package_version
+    return package_version
+
+
+def invalidate_distribution_index() -> None:
+    """Resets the index of installed distribution packages.
+
+    The index gets reset automatically whenever `sys.path` changes. Call this
+    after installing or uninstalling packages in the running process.
+    """
+    global _DISTRIBUTION_INDEX_PATH, _SITE_PACKAGES_DIRS
+    global _PACKAGES_DISTRIBUTIONS
+
+    _DISTRIBUTION_INDEX_PATH = None
+    _SITE_PACKAGES_DIRS = None
+    _PACKAGES_DISTRIBUTIONS = None
+    _PACKAGE_VERSIONS.clear()
+
+
+def _refresh_distribution_index() -> None:
+    """Resets the index of distribution packages if `sys.path` changed."""
+    global _DISTRIBUTION_INDEX_PATH
+
+    if _DISTRIBUTION_INDEX_PATH != sys.path:
+        invalidate_distribution_index()
+        _DISTRIBUTION_INDEX_PATH = list(sys.path)
+
+
+def _get_site_packages_dirs() -> List[Path]:
+    """Gets the resolved site packages directories.
+
+    Returns:
+        The resolved site packages directories.
+    """
+    global _SITE_PACKAGES_DIRS
+
+    _refresh_distribution_index()
+    site_packages_dirs = _SITE_PACKAGES_DIRS
+    if site_packages_dirs is None:
+        site_packages_dirs = [
+            Path(path).resolve()
+            for path in site.getsitepackages() + [site.getusersitepackages()]
+        ]
+        _SITE_PACKAGES_DIRS = site_packages_dirs
+
+    return site_packages_dirs
+
+
+def _get_packages_distributions() -> Mapping[str, List[str]]:
+    """Gets the distribution packages for all top-level modules.
+
+    Returns:
+        A mapping from top-level module names to the names of the distribution
+        packages that provide them.
+    """
+    global _PACKAGES_DISTRIBUTIONS
+
+    _refresh_distribution_index()
+    packages_distributions_ = _PACKAGES_DISTRIBUTIONS
+    if packages_distributions_ is None:
+        if sys.version_info < (3, 10):
+            from importlib_metadata import packages_distributions
+        else:
+            from importlib.metadata import packages_distributions
+
+        packages_distributions_ = packages_distributions()
+        _PACKAGES_DISTRIBUTIONS = packages_distributions_
+
+    return packages_distributions_
 
 
 # Ideally both the expected_class and return type should be annotated with a
@@ -0,0 +1,145 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to compute statistics of large arrays."""
+
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+import numpy as np
+
+from zenml.constants import (
+    ARTIFACT_METADATA_MAX_SIZE,
+    ARTIFACT_METADATA_SAMPLE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+CHUNK_SIZE = 1 << 20
+SAMPLE_SEED = 0
+
+
+class SummaryStatistics(NamedTuple):
+    """Summary statistics of an array."""
+
+    mean: float
+    std: float
+    min: Any
+    max: Any
+
+
+def compute_summary_statistics(
+    arr: "NDArray[Any]", ddof: int = 0
+) -> SummaryStatistics:
+    """Computes mean, standard deviation, minimum and maximum of an array.
+
+    All statistics are computed in a single pass over the array, which is
+    processed in chunks that fit into the CPU caches. The partial results of
+    the chunks are combined using the parallel algorithm by Chan et al.
+    NaN values are ignored.
+
+    Args:
+        arr: The array of real numbers to compute the statistics of.
+        ddof: Delta degrees of freedom used to compute the standard
+            deviation.
+
+    Returns:
+        The summary statistics. All values are NaN if the array does not
+        contain any non-NaN values.
+    """
+    values = arr.ravel(order="K")
+    is_float = np.issubdtype(values.dtype, np.floating)
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    min_value: Any = None
+    max_value: Any = None
+
+    for start in range(0, values.size, CHUNK_SIZE):
+        chunk = values[start : start + CHUNK_SIZE]
+        if is_float:
+            chunk = chunk[~np.isnan(chunk)]
+        if chunk.size == 0:
+            continue
+
+        chunk_min = chunk.min()
+        chunk_max = chunk.max()
+        if min_value is None or chunk_min < min_value:
+            min_value = chunk_min
+        if max_value is None or chunk_max > max_value:
+            max_value = chunk_max
+
+        chunk_values = chunk.astype(np.float64, copy=False)
+        chunk_count = chunk_values.size
+        chunk_mean = float(chunk_values.mean())
+        chunk_m2 = float(np.square(chunk_values - chunk_mean).sum())
+
+        if count == 0:
+            count, mean, m2 = chunk_count, chunk_mean, chunk_m2
+        else:
+            total = count + chunk_count
+            delta = chunk_mean - mean
+            mean += delta * chunk_count / total
+            m2 += chunk_m2 + delta * delta * count * chunk_count / total
+            count = total
+
+    if count == 0:
+        return SummaryStatistics(
+            mean=math.nan, std=math.nan, min=math.nan, max=math.nan
+        )
+
+    std = math.sqrt(m2 / (count - ddof)) if count > ddof else math.nan
+    return SummaryStatistics(
+        mean=mean, std=std, min=min_value.item(), max=max_value.item()
+    )
+
+
+def get_sample_indices(
+    length: int, sample_size: Optional[int] = None
+) -> Optional["NDArray[Any]"]:
+    """Gets the indices of a random sample of a sequence.
+
+    Sampling is deterministic, so the statistics of the same artifact don't
+    change between runs.
+
+    Args:
+        length: The length of the sequence to sample.
+        sample_size: The number of elements to sample. Defaults to the
+            `ZENML_ARTIFACT_METADATA_SAMPLE_SIZE` environment variable.
+
+    Returns:
+        The sorted indices of the sample, or `None` if the sequence is not
+        longer than the sample size.
+    """
+    if sample_size is None:
+        sample_size = ARTIFACT_METADATA_SAMPLE_SIZE
+    if sample_size <= 0 or length <= sample_size:
+        return None
+
+    rng = np.random.default_rng(SAMPLE_SEED)
+    return np.sort(rng.choice(length, size=sample_size, replace=False))
+
+
+def exceeds_metadata_size_limit(size: int) -> bool:
+    """Checks if an artifact is too big for expensive metadata extraction.
+
+    Args:
+        size: The number of rows or elements of the artifact.
+
+    Returns:
+        Whether the size exceeds the `ZENML_ARTIFACT_METADATA_MAX_SIZE`
+        environment variable.
+    """
+    return 0 < ARTIFACT_METADATA_MAX_SIZE < size
@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """Authentication module for ZenML server."""
 
+import hashlib
 import os
 from contextvars import ContextVar
-from typing import Callable, List, Optional, Set, Union
+from typing import Callable, Optional, Set, Union
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -25,9 +26,16 @@ from fastapi.security import (
     OAuth2PasswordBearer,
     SecurityScopes,
 )
-from pydantic import BaseModel
-
-from zenml.constants import API, ENV_ZENML_AUTH_TYPE, LOGIN, VERSION_1
+from pydantic import BaseModel, PrivateAttr
+
+from zenml.constants import (
+    API,
+    ENV_ZENML_AUTH_TYPE,
+    LOGIN,
+    SERVER_AUTH_CACHE_SIZE,
+    SERVER_AUTH_CACHE_TTL,
+    VERSION_1,
+)
 from zenml.enums import PermissionType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
@@ -36,9 +44,18 @@ from zenml.models.user_models import JWTToken, JWTTokenType, UserAuthModel
 from zenml.utils.enum_utils import StrEnum
 from zenml.zen_server.utils import ROOT_URL_PATH, zen_store
 from zenml.zen_stores.base_zen_store import DEFAULT_USERNAME
+from zenml.zen_stores.store_cache import TTLStoreCache
 
 logger = get_logger(__name__)
 
+ACCESS_TOKEN_CACHE_KIND = "access_token"
+
+# Short-lived cache of the authentication contexts of access tokens, so
+# clients sending many requests don't cause database queries for each of them
+_auth_cache = TTLStoreCache(
+    ttl=SERVER_AUTH_CACHE_TTL, max_size=SERVER_AUTH_CACHE_SIZE
+)
+
 # create a context variable to store the authentication context
 _auth_context: ContextVar[Optional["AuthContext"]] = ContextVar(
     "auth_context", default=None
@@ -81,6 +98,8 @@ class AuthContext(BaseModel):
 
     user: UserResponseModel
 
+    _permissions: Optional[Set[PermissionType]] = PrivateAttr(default=None)
+
     @property
     def permissions(self) -> Set[PermissionType]:
         """Returns the permissions of the user.
@@ -88,16 +107,24 @@ class AuthContext(BaseModel):
         Returns:
             The permissions of the user.
         """
-        if self.user.roles:
+        if self._permissions is None:
             # Merge permissions from all roles
-            permissions: List[PermissionType] = []
-            for role in self.user.roles:
-                permissions.extend(role.permissions)
+            self._permissions = {
+                permission
+                for role in self.user.roles or []
+                for permission in role.permissions
+            }
+        return self._permissions
+
 
-            # Remove duplicates
-            return set(permissions)
+def invalidate_auth_cache() -> None:
+    """Invalidates the cached authentication contexts of all access tokens.
 
-        return set()
+    This needs to be called whenever users, roles or role assignments change
+    so the changes take effect immediately. Other replicas of the server pick
+    up the changes once their cache entries expire.
+    """
+    _auth_cache.invalidate(ACCESS_TOKEN_CACHE_KIND)
 
 
 def authentication_scheme() -> AuthScheme:
@@ -226,18 +253,29 @@ def oauth2_password_bearer_authentication(
         authenticate_value = f'Bearer scope="{security_scopes.scope_str}"'
     else:
         authenticate_value = "Bearer"
-    auth_context = authenticate_credentials(access_token=token)
 
-    try:
-        access_token = JWTToken.decode(
-            token_type=JWTTokenType.ACCESS_TOKEN, token=token
-        )
-    except AuthorizationException:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    cache_key = (
+        ACCESS_TOKEN_CACHE_KIND,
+        hashlib.sha256(token.encode()).hexdigest(),
+    )
+    cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        access_token, auth_context = cached
+    else:
+        try:
+            access_token = JWTToken.decode(
+                token_type=JWTTokenType.ACCESS_TOKEN, token=token
+            )
+        except AuthorizationException:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        auth_context = _get_access_token_auth_context(access_token)
+        if auth_context is not None:
+            _auth_cache.set(cache_key, (access_token, auth_context))
+
     for scope in security_scopes.scopes:
         if scope not in access_token.permissions:
             raise HTTPException(
@@ -256,6 +294,29 @@ def oauth2_password_bearer_authentication(
     return auth_context
 
 
+def _get_access_token_auth_context(
+    access_token: JWTToken,
+) -> Optional[AuthContext]:
+    """Gets the authentication context of a decoded access token.
+
+    Args:
+        access_token: The decoded access token.
+
+    Returns:
+        The authentication context of the user of the token, or None if the
+        user doesn't exist or is not active.
+    """
+    try:
+        user_model = zen_store().get_user(
+            user_name_or_id=access_token.user_id, include_private=True
+        )
+    except KeyError:
+        return None
+    if not user_model.active:
+        return None
+    return AuthContext(user=user_model)
+
+
 def no_authentication(security_scopes: SecurityScopes) -> AuthContext:
     """Doesn't authenticate requests to the ZenML server.
 
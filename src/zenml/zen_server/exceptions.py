@@ -24,6 +24,7 @@ from zenml.exceptions import (
     DuplicateRunNameError,
     EntityExistsError,
     IllegalOperationError,
+    InputResolutionError,
     SecretExistsError,
     StackComponentExistsError,
     StackExistsError,
@@ -79,6 +80,7 @@ REST_API_EXCEPTIONS: List[Tuple[Type[Exception], int]] = [
     (AuthorizationException, 401),
     # 404 Not Found
     (DoesNotExistException, 404),
+    (InputResolutionError, 404),
     (ZenKeyError, 404),
     (KeyError, 404),
     # 400 Bad Request
@@ -13,11 +13,12 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Body, Depends, Security
 
-from zenml.constants import API, ARTIFACTS, VERSION_1, VISUALIZE
+from zenml.constants import API, ARTIFACTS, BATCH, VERSION_1, VISUALIZE
 from zenml.enums import PermissionType
 from zenml.models import (
     ArtifactFilterModel,
@@ -91,6 +92,48 @@ def create_artifact(
     return zen_store().create_artifact(artifact)
 
 
+@router.post(
+    BATCH,
+    response_model=List[ArtifactResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_artifacts(
+    artifacts: List[ArtifactRequestModel],
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> List[ArtifactResponseModel]:
+    """Create multiple artifacts at once.
+
+    Args:
+        artifacts: The artifacts to create.
+
+    Returns:
+        The created artifacts, in the same order as the requests.
+    """
+    return zen_store().create_artifacts(artifacts)
+
+
+@router.delete(
+    BATCH,
+    response_model=List[UUID],
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def delete_unused_artifacts(
+    artifact_ids: List[UUID] = Body(...),
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> List[UUID]:
+    """Delete multiple artifacts that are not used in any step runs.
+
+    Args:
+        artifact_ids: The IDs of the artifacts to delete.
+
+    Returns:
+        The IDs of the deleted artifacts.
+    """
+    return zen_store().delete_unused_artifacts(artifact_ids)
+
+
 @router.get(
     "/{artifact_id}",
     response_model=ArtifactResponseModel,
@@ -18,10 +18,18 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
-from zenml.constants import API, STATUS, STEP_CONFIGURATION, STEPS, VERSION_1
+from zenml.constants import (
+    API,
+    PREPARE,
+    STATUS,
+    STEP_CONFIGURATION,
+    STEPS,
+    VERSION_1,
+)
 from zenml.enums import ExecutionStatus, PermissionType
 from zenml.models import (
     StepRunFilterModel,
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -89,6 +97,30 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.post(
+    PREPARE,
+    response_model=StepRunResponseModel,
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def prepare_run_step(
+    step: StepRunPrepareRequestModel,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> StepRunResponseModel:
+    """Prepare and create a run step.
+
+    Resolves the inputs of the step, checks whether a cached version of the
+    step exists and creates the run step in a single request.
+
+    Args:
+        step: The run step to prepare and create.
+
+    Returns:
+        The created run step.
+    """
+    return zen_store().prepare_run_step(step_run=step)
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponseModel,
@@ -43,6 +43,7 @@ from zenml.zen_server.auth import (
     AuthContext,
     authenticate_credentials,
     authorize,
+    invalidate_auth_cache,
 )
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
@@ -180,10 +181,12 @@ def update_user(
     """
     user = zen_store().get_user(user_name_or_id)
 
-    return zen_store().update_user(
+    updated_user = zen_store().update_user(
         user_id=user.id,
         user_update=user_update,
     )
+    invalidate_auth_cache()
+    return updated_user
 
 
 @activation_router.put(
@@ -221,7 +224,11 @@ def activate_user(
         )
     user_update.active = True
     user_update.activation_token = None
-    return zen_store().update_user(user_id=user.id, user_update=user_update)
+    updated_user = zen_store().update_user(
+        user_id=user.id, user_update=user_update
+    )
+    invalidate_auth_cache()
+    return updated_user
 
 
 @router.put(
@@ -250,6 +257,7 @@ def deactivate_user(
     )
     token = user_update.generate_activation_token()
     user = zen_store().update_user(user_id=user.id, user_update=user_update)
+    invalidate_auth_cache()
     # add back the original unhashed activation token
     user.activation_token = token
     return user
@@ -285,6 +293,7 @@ def delete_user(
             "administrator."
         )
     zen_store().delete_user(user_name_or_id=user_name_or_id)
+    invalidate_auth_cache()
 
 
 @router.put(
@@ -323,9 +332,11 @@ def email_opt_in_response(
             email_opted_in=user_response.email_opted_in,
         )
 
-        return zen_store().update_user(
+        updated_user = zen_store().update_user(
             user_id=user.id, user_update=user_update
         )
+        invalidate_auth_cache()
+        return updated_user
     else:
         raise AuthorizationException(
             "Users can not opt in on behalf of another " "user."
@@ -400,6 +411,8 @@ def update_myself(
     Returns:
         The updated user.
     """
-    return zen_store().update_user(
+    updated_user = zen_store().update_user(
         user_id=auth_context.user.id, user_update=user
     )
+    invalidate_auth_cache()
+    return updated_user
@@ -13,7 +13,9 @@
 #  permissions and limitations under the License.
 """Zen Server API."""
 import os
+import zlib
 from asyncio.log import logger
+from genericpath import isfile
 from typing import Any, List
 
 from fastapi import FastAPI, HTTPException, Request
@@ -21,12 +23,18 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from genericpath import isfile
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import zenml
-from zenml.constants import API, HEALTH
+from zenml.constants import (
+    API,
+    HEALTH,
+    SERVER_MAX_DECOMPRESSED_REQUEST_SIZE,
+)
 from zenml.zen_server.exceptions import error_detail
 from zenml.zen_server.routers import (
     artifacts_endpoints,
@@ -93,6 +101,107 @@ def validation_exception_handler(
     return ORJSONResponse(error_detail(exc, ValueError), status_code=422)
 
 
+class RequestDecompressionMiddleware:
+    """Middleware that decompresses gzip-encoded request bodies."""
+
+    def __init__(self, app: ASGIApp, max_size: int) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            max_size: The maximum size in bytes of a decompressed request
+                body. Requests with larger bodies are rejected.
+        """
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompresses the request body if it is gzip-encoded.
+
+        The body is decompressed while it is received and the request is
+        rejected as soon as the decompressed body exceeds the maximum size,
+        so small compressed requests can't exhaust the server memory.
+
+        Args:
+            scope: The request scope.
+            receive: Callable to receive request messages.
+            send: Callable to send response messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("content-encoding", "").lower() != "gzip":
+            await self.app(scope, receive, send)
+            return
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                more_body = message.get("more_body", False)
+                data = message.get("body", b"")
+                while data:
+                    # Never decompress more than one byte above the maximum
+                    # size, the remaining input is kept as unconsumed tail.
+                    chunk = decompressor.decompress(
+                        data, self.max_size + 1 - size
+                    )
+                    size += len(chunk)
+                    if size > self.max_size:
+                        response = PlainTextResponse(
+                            "Decompressed request body is too large.",
+                            status_code=413,
+                        )
+                        await response(scope, receive, send)
+                        return
+                    chunks.append(chunk)
+                    data = decompressor.unconsumed_tail
+        except zlib.error:
+            is_valid = False
+        else:
+            # Trailing data after the end of the gzip stream is rejected
+            is_valid = decompressor.eof and not decompressor.unused_data
+
+        if not is_valid:
+            response = PlainTextResponse(
+                "Invalid gzip-encoded request body.", status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        body = b"".join(chunks)
+        scope = dict(scope)
+        scope["headers"] = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+
+        body_sent = False
+
+        async def receive_decompressed() -> Message:
+            """Returns the decompressed request body.
+
+            Returns:
+                The request message with the decompressed body, followed by
+                the original messages (e.g. a disconnect).
+            """
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -100,6 +209,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(
+    RequestDecompressionMiddleware,
+    max_size=SERVER_MAX_DECOMPRESSED_REQUEST_SIZE,
+)
 
 
 @app.on_event("startup")
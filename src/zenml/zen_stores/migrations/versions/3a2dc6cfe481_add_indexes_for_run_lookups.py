@@ -0,0 +1,56 @@
+"""Add indexes for run lookups [3a2dc6cfe481].
+
+Revision ID: 3a2dc6cfe481
+Revises: 9971237fa937
+Create Date: 2023-04-20 10:12:31.482135
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3a2dc6cfe481"
+down_revision = "9971237fa937"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_key_status_workspace_id_created",
+            ["cache_key", "status", "workspace_id", "created"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_pipeline_run_pipeline_id_created",
+            ["pipeline_id", "created"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_pipeline_run_orchestrator_run_id",
+            ["orchestrator_run_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("pipeline_build", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_pipeline_build_checksum", ["checksum"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_build", schema=None) as batch_op:
+        batch_op.drop_index("ix_pipeline_build_checksum")
+
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_pipeline_run_orchestrator_run_id")
+        batch_op.drop_index("ix_pipeline_run_pipeline_id_created")
+
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index(
+            "ix_step_run_cache_key_status_workspace_id_created"
+        )
@@ -0,0 +1,48 @@
+"""Add step run artifact indices [3b9a1c5e2f47].
+
+Revision ID: 3b9a1c5e2f47
+Revises: a8116e92c7ed
+Create Date: 2023-04-27 10:21:08.153894
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b9a1c5e2f47"
+down_revision = "a8116e92c7ed"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table(
+        "step_run_input_artifact", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_input_artifact_artifact_id",
+            ["artifact_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table(
+        "step_run_output_artifact", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_output_artifact_artifact_id",
+            ["artifact_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table(
+        "step_run_output_artifact", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_step_run_output_artifact_artifact_id")
+
+    with op.batch_alter_table(
+        "step_run_input_artifact", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_step_run_input_artifact_artifact_id")
@@ -0,0 +1,34 @@
+"""Add artifact content hash [6115570b6b26].
+
+Revision ID: 6115570b6b26
+Revises: 3a2dc6cfe481
+Create Date: 2023-04-24 09:41:12.209874
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6115570b6b26"
+down_revision = "3a2dc6cfe481"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "content_hash",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.drop_column("content_hash")
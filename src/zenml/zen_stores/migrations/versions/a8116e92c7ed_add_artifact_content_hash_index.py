@@ -0,0 +1,28 @@
+"""Add artifact content hash index [a8116e92c7ed].
+
+Revision ID: a8116e92c7ed
+Revises: 6115570b6b26
+Create Date: 2023-04-26 14:03:52.718391
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a8116e92c7ed"
+down_revision = "6115570b6b26"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_artifact_content_hash", ["content_hash"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.drop_index("ix_artifact_content_hash")
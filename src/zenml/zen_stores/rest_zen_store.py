@@ -12,12 +12,17 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
+import gzip
+import json
 import os
+import random
 import re
+import socket
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -32,7 +37,17 @@ from uuid import UUID
 
 import requests
 import urllib3
-from pydantic import BaseModel, root_validator, validator
+from pydantic import (
+    BaseModel,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
+    root_validator,
+    validator,
+)
+from pydantic.json import pydantic_encoder
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
@@ -41,6 +56,7 @@ from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
     CODE_REPOSITORIES,
     CURRENT_USER,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
@@ -52,6 +68,7 @@ from zenml.constants import (
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
+    PREPARE,
     ROLES,
     RUN_METADATA,
     RUNS,
@@ -117,6 +134,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -156,6 +174,11 @@ from zenml.zen_stores.base_zen_store import BaseZenStore
 from zenml.zen_stores.secrets_stores.rest_secrets_store import (
     RestSecretsStoreConfiguration,
 )
+from zenml.zen_stores.store_cache import (
+    BaseStoreCache,
+    CacheKey,
+    TTLStoreCache,
+)
 
 logger = get_logger(__name__)
 
@@ -167,9 +190,20 @@ Json = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
 AnyRequestModel = TypeVar("AnyRequestModel", bound=BaseRequestModel)
 AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
+AnyModel = TypeVar("AnyModel", bound=BaseModel)
 
 
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_SIZE = 20
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.5
+DEFAULT_HTTP_KEEPALIVE_IDLE = 60
+DEFAULT_HTTP_COMPRESSION_MIN_SIZE = 1024
+DEFAULT_CACHE_TTL = 30
+DEFAULT_CACHE_SIZE = 512
+# Status codes of transient server errors for which idempotent requests are
+# retried.
+HTTP_RETRY_STATUS_CODES = [502, 503, 504]
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -186,7 +220,33 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
-
+        http_pool_size: The maximum number of connections to keep open to
+            the server. This should be at least the number of threads that
+            concurrently send requests to the server.
+        http_retries: How often idempotent requests (GET, PUT, DELETE, ...)
+            are retried after connection errors or transient server errors.
+            Set to 0 to disable retries.
+        http_retry_backoff_factor: Factor for the exponential backoff between
+            retries. A random jitter of up to the same amount of time is
+            added to each backoff so that concurrent clients don't retry in
+            lockstep.
+        http_keepalive_idle: Number of seconds a pooled connection may be
+            idle before TCP keep-alive probes are sent on it. This keeps
+            connections alive through proxies and load balancers that drop
+            idle connections. Set to `None` to disable TCP keep-alive probes.
+        http_compression: Whether to gzip-compress request bodies. This
+            requires a server that is able to decompress requests and
+            therefore is disabled by default. Responses are always compressed
+            if the server supports it.
+        http_compression_min_size: Minimum size in bytes of a request body
+            for it to be compressed.
+        cache_ttl: Number of seconds for which rarely changing entities like
+            flavors, stack components, stacks, builds, deployments and the
+            server info are cached by the client. Changes made through this
+            client invalidate the cache immediately, changes made by other
+            clients become visible after at most this time. Set to 0 to
+            disable caching.
+        cache_size: The maximum number of cached entities.
     """
 
     type: StoreType = StoreType.REST
@@ -198,6 +258,18 @@ class RestZenStoreConfiguration(StoreConfiguration):
     api_token: Optional[str] = None
     verify_ssl: Union[bool, str] = True
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    http_pool_size: PositiveInt = DEFAULT_HTTP_POOL_SIZE
+    http_retries: NonNegativeInt = DEFAULT_HTTP_RETRIES
+    http_retry_backoff_factor: NonNegativeFloat = (
+        DEFAULT_HTTP_RETRY_BACKOFF_FACTOR
+    )
+    http_keepalive_idle: Optional[PositiveInt] = DEFAULT_HTTP_KEEPALIVE_IDLE
+    http_compression: bool = False
+    http_compression_min_size: NonNegativeInt = (
+        DEFAULT_HTTP_COMPRESSION_MIN_SIZE
+    )
+    cache_ttl: NonNegativeFloat = DEFAULT_CACHE_TTL
+    cache_size: NonNegativeInt = DEFAULT_CACHE_SIZE
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -379,6 +451,68 @@ class RestZenStoreConfiguration(StoreConfiguration):
         extra = "forbid"
 
 
+class _JitteredRetry(Retry):
+    """Retry configuration that adds a random jitter to the backoff time."""
+
+    def get_backoff_time(self) -> float:
+        """Computes the time to sleep before the next retry.
+
+        Returns:
+            The exponential backoff time plus a random jitter of up to the
+            same amount.
+        """
+        backoff_time = float(super().get_backoff_time())
+        return backoff_time + random.uniform(0, backoff_time)
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keep-alive probes on its connections."""
+
+    def __init__(self, keepalive_idle: Optional[int], **kwargs: Any) -> None:
+        """Initializes the adapter.
+
+        Args:
+            keepalive_idle: Number of seconds a connection may be idle before
+                keep-alive probes are sent. If `None`, no keep-alive probes
+                are sent.
+            **kwargs: Keyword arguments passed to the `HTTPAdapter`.
+        """
+        self._keepalive_idle = keepalive_idle
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the connection pool manager.
+
+        Args:
+            *args: Positional arguments passed to the pool manager.
+            **kwargs: Keyword arguments passed to the pool manager.
+        """
+        if self._keepalive_idle is not None:
+            socket_options = list(
+                urllib3.connection.HTTPConnection.default_socket_options
+            )
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # These options are not available on all platforms
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                socket_options.append(
+                    (
+                        socket.IPPROTO_TCP,
+                        socket.TCP_KEEPIDLE,
+                        self._keepalive_idle,
+                    )
+                )
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                socket_options.append(
+                    (
+                        socket.IPPROTO_TCP,
+                        socket.TCP_KEEPINTVL,
+                        max(self._keepalive_idle // 4, 1),
+                    )
+                )
+            kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RestZenStore(BaseZenStore):
     """Store implementation for accessing data from a REST API."""
 
@@ -387,6 +521,7 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    _cache: Optional[BaseStoreCache] = None
 
     def _initialize_database(self) -> None:
         """Initialize the database."""
@@ -424,8 +559,10 @@ class RestZenStore(BaseZenStore):
         Returns:
             Information about the server.
         """
-        body = self.get(INFO)
-        return ServerModel.parse_obj(body)
+        return self._get_cached(
+            key=("store_info", INFO),
+            fetch=lambda: ServerModel.parse_obj(self.get(INFO)),
+        )
 
     # ------
     # Stacks
@@ -456,10 +593,13 @@ class RestZenStore(BaseZenStore):
         Returns:
             The stack with the given ID.
         """
-        return self._get_resource(
-            resource_id=stack_id,
-            route=STACKS,
-            response_model=StackResponseModel,
+        return self._get_cached(
+            key=("stack", stack_id),
+            fetch=lambda: self._get_resource(
+                resource_id=stack_id,
+                route=STACKS,
+                response_model=StackResponseModel,
+            ),
         )
 
     def list_stacks(
@@ -493,12 +633,14 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated stack.
         """
-        return self._update_resource(
+        updated = self._update_resource(
             resource_id=stack_id,
             resource_update=stack_update,
             route=STACKS,
             response_model=StackResponseModel,
         )
+        self.cache.invalidate("stack", stack_id)
+        return updated
 
     @track(AnalyticsEvent.DELETED_STACK)
     def delete_stack(self, stack_id: UUID) -> None:
@@ -511,6 +653,7 @@ class RestZenStore(BaseZenStore):
             resource_id=stack_id,
             route=STACKS,
         )
+        self.cache.invalidate("stack", stack_id)
 
     # ----------------
     # Stack components
@@ -546,10 +689,13 @@ class RestZenStore(BaseZenStore):
         Returns:
             The stack component.
         """
-        return self._get_resource(
-            resource_id=component_id,
-            route=STACK_COMPONENTS,
-            response_model=ComponentResponseModel,
+        return self._get_cached(
+            key=("component", component_id),
+            fetch=lambda: self._get_resource(
+                resource_id=component_id,
+                route=STACK_COMPONENTS,
+                response_model=ComponentResponseModel,
+            ),
         )
 
     def list_stack_components(
@@ -585,12 +731,16 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated stack component.
         """
-        return self._update_resource(
+        updated = self._update_resource(
             resource_id=component_id,
             resource_update=component_update,
             route=STACK_COMPONENTS,
             response_model=ComponentResponseModel,
         )
+        self.cache.invalidate("component", component_id)
+        # Stacks contain the models of their components
+        self.cache.invalidate("stack")
+        return updated
 
     @track(AnalyticsEvent.DELETED_STACK_COMPONENT)
     def delete_stack_component(self, component_id: UUID) -> None:
@@ -603,6 +753,9 @@ class RestZenStore(BaseZenStore):
             resource_id=component_id,
             route=STACK_COMPONENTS,
         )
+        self.cache.invalidate("component", component_id)
+        # Stacks contain the models of their components
+        self.cache.invalidate("stack")
 
     # -----------------------
     # Stack component flavors
@@ -636,12 +789,14 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated flavor.
         """
-        return self._update_resource(
+        updated = self._update_resource(
             resource_id=flavor_id,
             resource_update=flavor_update,
             route=FLAVORS,
             response_model=FlavorResponseModel,
         )
+        self.cache.invalidate("flavor", flavor_id)
+        return updated
 
     def get_flavor(self, flavor_id: UUID) -> FlavorResponseModel:
         """Get a stack component flavor by ID.
@@ -652,10 +807,13 @@ class RestZenStore(BaseZenStore):
         Returns:
             The stack component flavor.
         """
-        return self._get_resource(
-            resource_id=flavor_id,
-            route=FLAVORS,
-            response_model=FlavorResponseModel,
+        return self._get_cached(
+            key=("flavor", flavor_id),
+            fetch=lambda: self._get_resource(
+                resource_id=flavor_id,
+                route=FLAVORS,
+                response_model=FlavorResponseModel,
+            ),
         )
 
     def list_flavors(
@@ -687,6 +845,7 @@ class RestZenStore(BaseZenStore):
             resource_id=flavor_id,
             route=FLAVORS,
         )
+        self.cache.invalidate("flavor", flavor_id)
 
     # -----
     # Users
@@ -1320,10 +1479,13 @@ class RestZenStore(BaseZenStore):
         Returns:
             The build.
         """
-        return self._get_resource(
-            resource_id=build_id,
-            route=PIPELINE_BUILDS,
-            response_model=PipelineBuildResponseModel,
+        return self._get_cached(
+            key=("build", build_id),
+            fetch=lambda: self._get_resource(
+                resource_id=build_id,
+                route=PIPELINE_BUILDS,
+                response_model=PipelineBuildResponseModel,
+            ),
         )
 
     def list_builds(
@@ -1354,6 +1516,7 @@ class RestZenStore(BaseZenStore):
             resource_id=build_id,
             route=PIPELINE_BUILDS,
         )
+        self.cache.invalidate("build", build_id)
 
     # ----------------------
     # Pipeline Deployments
@@ -1388,10 +1551,13 @@ class RestZenStore(BaseZenStore):
         Returns:
             The deployment.
         """
-        return self._get_resource(
-            resource_id=deployment_id,
-            route=PIPELINE_DEPLOYMENTS,
-            response_model=PipelineDeploymentResponseModel,
+        return self._get_cached(
+            key=("deployment", deployment_id),
+            fetch=lambda: self._get_resource(
+                resource_id=deployment_id,
+                route=PIPELINE_DEPLOYMENTS,
+                response_model=PipelineDeploymentResponseModel,
+            ),
         )
 
     def list_deployments(
@@ -1422,6 +1588,7 @@ class RestZenStore(BaseZenStore):
             resource_id=deployment_id,
             route=PIPELINE_DEPLOYMENTS,
         )
+        self.cache.invalidate("deployment", deployment_id)
 
     # ---------
     # Schedules
@@ -1638,6 +1805,23 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def prepare_run_step(
+        self, step_run: StepRunPrepareRequestModel
+    ) -> StepRunResponseModel:
+        """Prepares and creates a step run.
+
+        Args:
+            step_run: The step run to prepare and create.
+
+        Returns:
+            The created step run.
+        """
+        return self._create_resource(
+            resource=step_run,
+            response_model=StepRunResponseModel,
+            route=f"{STEPS}{PREPARE}",
+        )
+
     def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
         """Get a step run by ID.
 
@@ -1713,6 +1897,38 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACTS,
         )
 
+    def create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single request.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+
+        Raises:
+            ValueError: If the server returned an invalid response.
+        """
+        if not artifacts:
+            return []
+
+        logger.debug(f"Sending POST request to {ARTIFACTS + BATCH}...")
+        body = self._request(
+            "POST",
+            self.url + API + VERSION_1 + ARTIFACTS + BATCH,
+            data=json.dumps(
+                [artifact.dict() for artifact in artifacts],
+                default=pydantic_encoder,
+            ),
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [ArtifactResponseModel.parse_obj(entry) for entry in body]
+
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
 
@@ -1754,6 +1970,36 @@ class RestZenStore(BaseZenStore):
         """
         self._delete_resource(resource_id=artifact_id, route=ARTIFACTS)
 
+    def delete_unused_artifacts(self, artifact_ids: List[UUID]) -> List[UUID]:
+        """Deletes multiple artifacts that are not used in any step runs.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to delete.
+
+        Returns:
+            The IDs of the deleted artifacts. Artifacts that don't exist or
+            are used in step runs are skipped.
+
+        Raises:
+            ValueError: If the server returned an invalid response.
+        """
+        if not artifact_ids:
+            return []
+
+        logger.debug(f"Sending DELETE request to {ARTIFACTS + BATCH}...")
+        body = self._request(
+            "DELETE",
+            self.url + API + VERSION_1 + ARTIFACTS + BATCH,
+            data=json.dumps(
+                [str(artifact_id) for artifact_id in artifact_ids]
+            ),
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [UUID(artifact_id) for artifact_id in body]
+
     # ------------
     # Run Metadata
     # ------------
@@ -1945,12 +2191,69 @@ class RestZenStore(BaseZenStore):
                 )
 
             self._session = requests.Session()
+            retries = _JitteredRetry(
+                total=self.config.http_retries,
+                backoff_factor=self.config.http_retry_backoff_factor,
+                status_forcelist=HTTP_RETRY_STATUS_CODES,
+                # Only idempotent methods are retried.
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                # Return the last response instead of raising an exception
+                # so the error response of the server can be handled.
+                raise_on_status=False,
+            )
+            adapter = _KeepAliveHTTPAdapter(
+                keepalive_idle=self.config.http_keepalive_idle,
+                pool_connections=self.config.http_pool_size,
+                pool_maxsize=self.config.http_pool_size,
+                max_retries=retries,
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             self._session.verify = self.config.verify_ssl
             token = self._get_auth_token()
             self._session.headers.update({"Authorization": "Bearer " + token})
             logger.debug("Authenticated to ZenML server.")
         return self._session
 
+    @property
+    def cache(self) -> BaseStoreCache:
+        """The cache for rarely changing entities fetched from the server.
+
+        Returns:
+            The cache.
+        """
+        if self._cache is None:
+            self._cache = TTLStoreCache(
+                ttl=self.config.cache_ttl, max_size=self.config.cache_size
+            )
+        return self._cache
+
+    def set_cache(self, cache: BaseStoreCache) -> None:
+        """Replaces the cache for rarely changing entities.
+
+        Args:
+            cache: The new cache.
+        """
+        self._cache = cache
+
+    def _get_cached(
+        self, key: CacheKey, fetch: Callable[[], AnyModel]
+    ) -> AnyModel:
+        """Gets a model from the cache or fetches and caches it on a miss.
+
+        Args:
+            key: The cache key of the model.
+            fetch: Callable to fetch the model from the server.
+
+        Returns:
+            A copy of the cached model, so callers can't modify the cache.
+        """
+        model: Optional[AnyModel] = self.cache.get(key)
+        if model is None:
+            model = fetch()
+            self.cache.set(key, model)
+        return model.copy(deep=True)
+
     @staticmethod
     def _handle_response(response: requests.Response) -> Json:
         """Handle API response, translating http status codes to Exception.
@@ -2011,6 +2314,7 @@ class RestZenStore(BaseZenStore):
             The parsed response.
         """
         params = {k: str(v) for k, v in params.items()} if params else {}
+        self._compress_request_body(kwargs)
         try:
             return self._handle_response(
                 self.session.request(
@@ -2037,6 +2341,29 @@ class RestZenStore(BaseZenStore):
                 )
             )
 
+    def _compress_request_body(self, request_kwargs: Dict[str, Any]) -> None:
+        """Compresses the body of a request if enabled in the configuration.
+
+        Args:
+            request_kwargs: Keyword arguments for the request. The body and
+                headers in here are updated in-place.
+        """
+        data = request_kwargs.get("data")
+        if not self.config.http_compression or not isinstance(
+            data, (str, bytes)
+        ):
+            return
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if len(data) < self.config.http_compression_min_size:
+            return
+
+        request_kwargs["data"] = gzip.compress(data)
+        headers = dict(request_kwargs.get("headers") or {})
+        headers["Content-Encoding"] = "gzip"
+        request_kwargs["headers"] = headers
+
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Json:
@@ -27,7 +27,10 @@ from zenml.models import ArtifactRequestModel, ArtifactResponseModel
 from zenml.models.visualization_models import VisualizationModel
 from zenml.zen_stores.schemas.base_schemas import BaseSchema, NamedSchema
 from zenml.zen_stores.schemas.component_schemas import StackComponentSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    build_index,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
@@ -43,6 +46,9 @@ class ArtifactSchema(NamedSchema, table=True):
     """SQL Model for artifacts."""
 
     __tablename__ = "artifact"
+    __table_args__ = (
+        build_index(table_name=__tablename__, column_names=["content_hash"]),
+    )
 
     artifact_store_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
@@ -77,6 +83,7 @@ class ArtifactSchema(NamedSchema, table=True):
     uri: str = Field(sa_column=Column(TEXT, nullable=False))
     materializer: str = Field(sa_column=Column(TEXT, nullable=False))
     data_type: str = Field(sa_column=Column(TEXT, nullable=False))
+    content_hash: Optional[str] = Field(nullable=True)
 
     run_metadata: List["RunMetadataSchema"] = Relationship(
         back_populates="artifact",
@@ -116,6 +123,7 @@ class ArtifactSchema(NamedSchema, table=True):
             uri=artifact_request.uri,
             materializer=artifact_request.materializer.json(),
             data_type=artifact_request.data_type.json(),
+            content_hash=artifact_request.content_hash,
         )
 
     def to_model(
@@ -162,6 +170,7 @@ class ArtifactSchema(NamedSchema, table=True):
             producer_step_run_id=producer_step_run_id,
             metadata=metadata,
             visualizations=[vis.to_model() for vis in self.visualizations],
+            content_hash=self.content_hash,
         )
 
 
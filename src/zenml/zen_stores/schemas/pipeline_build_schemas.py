@@ -25,7 +25,10 @@ from sqlmodel import Field, Relationship
 from zenml.models import PipelineBuildRequestModel, PipelineBuildResponseModel
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    build_index,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
@@ -41,6 +44,9 @@ class PipelineBuildSchema(BaseSchema, table=True):
     """SQL Model for pipeline builds."""
 
     __tablename__ = "pipeline_build"
+    __table_args__ = (
+        build_index(table_name=__tablename__, column_names=["checksum"]),
+    )
 
     user_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
@@ -35,7 +35,10 @@ from zenml.zen_stores.schemas.pipeline_deployment_schemas import (
 )
 from zenml.zen_stores.schemas.pipeline_schemas import PipelineSchema
 from zenml.zen_stores.schemas.schedule_schema import ScheduleSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    build_index,
+)
 from zenml.zen_stores.schemas.stack_schemas import StackSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
@@ -49,6 +52,16 @@ class PipelineRunSchema(NamedSchema, table=True):
     """SQL Model for pipeline runs."""
 
     __tablename__ = "pipeline_run"
+    __table_args__ = (
+        build_index(
+            table_name=__tablename__,
+            column_names=["pipeline_id", "created"],
+        ),
+        build_index(
+            table_name=__tablename__,
+            column_names=["orchestrator_run_id"],
+        ),
+    )
 
     stack_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
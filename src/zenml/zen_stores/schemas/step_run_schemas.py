@@ -35,7 +35,10 @@ from zenml.models.step_run_models import (
 from zenml.zen_stores.schemas.artifact_schemas import ArtifactSchema
 from zenml.zen_stores.schemas.base_schemas import NamedSchema
 from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
-from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
+from zenml.zen_stores.schemas.schema_utils import (
+    build_foreign_key_field,
+    build_index,
+)
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
@@ -48,6 +51,13 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        # Used to find cached step runs with a matching cache key.
+        build_index(
+            table_name=__tablename__,
+            column_names=["cache_key", "status", "workspace_id", "created"],
+        ),
+    )
 
     pipeline_run_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -292,6 +302,9 @@ class StepRunInputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are inputs to which step."""
 
     __tablename__ = "step_run_input_artifact"
+    __table_args__ = (
+        build_index(table_name=__tablename__, column_names=["artifact_id"]),
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -322,6 +335,9 @@ class StepRunOutputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are outputs of which step."""
 
     __tablename__ = "step_run_output_artifact"
+    __table_args__ = (
+        build_index(table_name=__tablename__, column_names=["artifact_id"]),
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
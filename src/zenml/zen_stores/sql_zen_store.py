@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
 from pathlib import Path, PurePath
 from typing import (
@@ -28,6 +29,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -38,7 +40,7 @@ from uuid import UUID
 
 import pymysql
 from pydantic import root_validator, validator
-from sqlalchemy import asc, desc, func, text
+from sqlalchemy import and_, asc, desc, func, text
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
@@ -46,7 +48,7 @@ from sqlalchemy.exc import (
     NoResultFound,
     OperationalError,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import noload, selectinload
 from sqlmodel import Session, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -67,6 +69,7 @@ from zenml.enums import (
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
+    InputResolutionError,
     StackComponentExistsError,
     StackExistsError,
 )
@@ -118,6 +121,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -691,6 +695,9 @@ class SqlZenStore(BaseZenStore):
         custom_schema_to_model_conversion: Optional[
             Callable[[AnySchema], B]
         ] = None,
+        custom_schemas_to_models_conversion: Optional[
+            Callable[[List[AnySchema]], List[B]]
+        ] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -703,6 +710,11 @@ class SqlZenStore(BaseZenStore):
                 into a model. This is used if the Model contains additional
                 data that is not explicitly stored as a field or relationship
                 on the model.
+            custom_schemas_to_models_conversion: Callable to convert the
+                whole page of schemas into models at once. This takes
+                precedence over `custom_schema_to_model_conversion` and
+                allows loading additional data for all items of the page with
+                a constant number of queries.
 
         Returns:
             The Domain Model representation of the DB resource
@@ -714,44 +726,95 @@ class SqlZenStore(BaseZenStore):
         query = filter_model.apply_filter(query=query, table=table)
 
         # Get the total amount of items in the database for a given query
-        total = session.scalar(
-            select([func.count("*")]).select_from(
-                query.options(noload("*")).subquery()
+        total: Optional[int] = None
+        if not filter_model.skip_count:
+            total = session.scalar(
+                select([func.count("*")]).select_from(
+                    query.options(noload("*")).subquery()
+                )
             )
-        )
 
-        # Sorting
+        # Sorting. The ID is used as a tie-breaker to guarantee a stable
+        # order of items that share the same sort value.
         column, operand = filter_model.sorting_params
+        sort_column = getattr(table, column)
         if operand == SorterOps.DESCENDING:
-            query = query.order_by(desc(getattr(table, column)))
+            query = query.order_by(desc(sort_column), desc(table.id))
         else:
-            query = query.order_by(asc(getattr(table, column)))
-
-        # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
+            query = query.order_by(asc(sort_column), asc(table.id))
+
+        cursor_params = filter_model.cursor_params
+        if cursor_params:
+            # Keyset pagination: Start right after the item the cursor points
+            # to instead of skipping all previous rows with an offset.
+            sort_value, last_id = cursor_params
+            enum_class = getattr(sort_column.type, "enum_class", None)
+            if enum_class and sort_value is not None:
+                sort_value = enum_class(sort_value)
+            query = query.where(
+                cls._keyset_condition(
+                    sort_column=sort_column,
+                    id_column=table.id,
+                    sort_value=sort_value,
+                    last_id=last_id,
+                    descending=operand == SorterOps.DESCENDING,
+                )
+            )
+            offset = 0
         else:
-            total_pages = math.ceil(total / filter_model.size)
+            offset = filter_model.offset
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
-            )
+        if total is not None:
+            # Get the total amount of pages in the database for a given query
+            if total == 0:
+                total_pages = 1
+            else:
+                total_pages = math.ceil(total / filter_model.size)
+
+            if not cursor_params and filter_model.page > total_pages:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{total} items for this query. The maximum page value "
+                    f"therefore is {total_pages}."
+                )
 
-        # Get a page of the actual data
+        # Get a page of the actual data. One additional item is fetched to
+        # find out whether there are more items after this page.
         item_schemas: List[AnySchema] = (
-            session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
-            )
+            session.exec(query.limit(filter_model.size + 1).offset(offset))
             .unique()
             .all()
         )
+        has_more = len(item_schemas) > filter_model.size
+        item_schemas = item_schemas[: filter_model.size]
+
+        next_cursor = None
+        if has_more:
+            last_item = item_schemas[-1]
+            next_cursor = filter_model.encode_cursor(
+                sort_value=getattr(last_item, column), id=last_item.id
+            )
+
+        if total is None:
+            # Without counting, we only know about the items up to and
+            # including this page and whether there are more.
+            total = offset + len(item_schemas) + int(has_more)
+            total_pages = filter_model.page + int(has_more)
 
         # Convert this page of items from schemas to models.
         items: List[B] = []
+        if custom_schemas_to_models_conversion:
+            # If a batch conversion function is provided, convert all items
+            # of the page at once.
+            return Page(
+                total=total,
+                total_pages=total_pages,
+                items=custom_schemas_to_models_conversion(item_schemas),
+                index=filter_model.page,
+                max_size=filter_model.size,
+                next_cursor=next_cursor,
+            )
         for schema in item_schemas:
             # If a custom conversion function is provided, use it.
             if custom_schema_to_model_conversion:
@@ -774,8 +837,50 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
+    @staticmethod
+    def _keyset_condition(
+        sort_column: Any,
+        id_column: Any,
+        sort_value: Any,
+        last_id: UUID,
+        descending: bool,
+    ) -> Any:
+        """Builds the condition to select all items after a keyset cursor.
+
+        Items are ordered by the sort column first and their ID second. NULL
+        values of the sort column are treated as smaller than all other
+        values, which is how both SQLite and MySQL sort them.
+
+        Args:
+            sort_column: The column by which the items are sorted.
+            id_column: The ID column of the table.
+            sort_value: The sort column value of the last item of the
+                previous page.
+            last_id: The ID of the last item of the previous page.
+            descending: Whether the items are sorted in descending order.
+
+        Returns:
+            The condition for the query.
+        """
+        id_after = id_column < last_id if descending else id_column > last_id
+
+        if sort_value is None:
+            if descending:
+                return and_(sort_column.is_(None), id_after)
+            return or_(
+                sort_column.isnot(None),
+                and_(sort_column.is_(None), id_after),
+            )
+
+        if descending:
+            value_after = or_(sort_column < sort_value, sort_column.is_(None))
+        else:
+            value_after = sort_column > sort_value
+        return or_(value_after, and_(sort_column == sort_value, id_after))
+
     # ====================================
     # ZenML Store interface implementation
     # ====================================
@@ -3349,74 +3454,209 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created step run.
-
-        Raises:
-            EntityExistsError: if the step run already exists.
-            KeyError: if the pipeline run doesn't exist.
         """
         with Session(self.engine) as session:
+            step_schema = self._create_run_step(
+                step_run=step_run, session=session
+            )
+            session.commit()
 
-            # Check if the pipeline run exists
-            run = session.exec(
-                select(PipelineRunSchema).where(
-                    PipelineRunSchema.id == step_run.pipeline_run_id
-                )
-            ).first()
-            if run is None:
-                raise KeyError(
-                    f"Unable to create step '{step_run.name}': No pipeline run "
-                    f"with ID '{step_run.pipeline_run_id}' found."
-                )
+            return self._run_step_schema_to_model(step_schema)
 
-            # Check if the step name already exists in the pipeline run
-            existing_step_run = session.exec(
-                select(StepRunSchema)
-                .where(StepRunSchema.name == step_run.name)
-                .where(
+    def prepare_run_step(
+        self, step_run: StepRunPrepareRequestModel
+    ) -> StepRunResponseModel:
+        """Prepares and creates a step run.
+
+        Args:
+            step_run: The step run to prepare and create.
+
+        Returns:
+            The created step run.
+
+        Raises:
+            InputResolutionError: if the inputs of the step run can't be
+                resolved.
+        """
+        from zenml.orchestrators.cache_utils import compute_cache_key
+
+        step = step_run.step
+        with Session(self.engine) as session:
+            # Resolve the inputs and parent steps from the other steps of the
+            # pipeline run. Steps are referenced by their configuration name,
+            # which gets stored as the entrypoint name of the step run.
+            run_steps = session.exec(
+                select(StepRunSchema.entrypoint_name, StepRunSchema.id).where(
                     StepRunSchema.pipeline_run_id == step_run.pipeline_run_id
                 )
-            ).first()
-            if existing_step_run is not None:
-                raise EntityExistsError(
-                    f"Unable to create step '{step_run.name}': A step with this "
-                    f"name already exists in the pipeline run with ID "
-                    f"'{step_run.pipeline_run_id}'."
-                )
+            ).all()
+            run_step_ids = {name: id_ for name, id_ in run_steps}
 
-            # Create the step
-            step_schema = StepRunSchema.from_request(step_run)
-            session.add(step_schema)
+            input_step_ids = set()
+            for input_ in step.spec.inputs.values():
+                if input_.step_name not in run_step_ids:
+                    raise InputResolutionError(
+                        f"No step `{input_.step_name}` found in current run."
+                    )
+                input_step_ids.add(run_step_ids[input_.step_name])
+
+            run_step_outputs: Dict[Tuple[UUID, str], UUID] = {}
+            if input_step_ids:
+                output_links = session.exec(
+                    select(StepRunOutputArtifactSchema).where(
+                        StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                            input_step_ids
+                        )
+                    )
+                ).all()
+                run_step_outputs = {
+                    (link.step_id, link.name): link.artifact_id
+                    for link in output_links
+                }
 
-            # Save parent step IDs into the database.
-            for parent_step_id in step_run.parent_step_ids:
-                self._set_run_step_parent_step(
-                    child_id=step_schema.id,
-                    parent_id=parent_step_id,
-                    session=session,
-                )
+            input_artifact_ids: Dict[str, UUID] = {}
+            for name, input_ in step.spec.inputs.items():
+                step_id = run_step_ids[input_.step_name]
+                try:
+                    input_artifact_ids[name] = run_step_outputs[
+                        (step_id, input_.output_name)
+                    ]
+                except KeyError:
+                    raise InputResolutionError(
+                        f"No output `{input_.output_name}` found for step "
+                        f"`{input_.step_name}`."
+                    )
 
-            # Save input artifact IDs into the database.
-            for input_name, artifact_id in step_run.input_artifacts.items():
-                self._set_run_step_input_artifact(
-                    run_step_id=step_schema.id,
-                    artifact_id=artifact_id,
-                    name=input_name,
-                    session=session,
-                )
+            step_run.input_artifacts = input_artifact_ids
+            step_run.parent_step_ids = [
+                run_step_ids[upstream_step]
+                for upstream_step in step.spec.upstream_steps
+            ]
 
-            # Save output artifact IDs into the database.
-            for output_name, artifact_id in step_run.output_artifacts.items():
-                self._set_run_step_output_artifact(
-                    step_run_id=step_schema.id,
-                    artifact_id=artifact_id,
-                    name=output_name,
-                    session=session,
+            input_artifact_content_hashes: Dict[str, Optional[str]] = {}
+            if step.config.content_addressed_cache and input_artifact_ids:
+                content_hashes = dict(
+                    session.exec(
+                        select(
+                            ArtifactSchema.id, ArtifactSchema.content_hash
+                        ).where(
+                            ArtifactSchema.id.in_(  # type: ignore[attr-defined]
+                                list(input_artifact_ids.values())
+                            )
+                        )
+                    ).all()
                 )
+                input_artifact_content_hashes = {
+                    name: content_hashes.get(artifact_id)
+                    for name, artifact_id in input_artifact_ids.items()
+                }
+
+            step_run.cache_key = compute_cache_key(
+                step=step,
+                input_artifact_ids=input_artifact_ids,
+                artifact_store_id=step_run.artifact_store_id,
+                artifact_store_path=step_run.artifact_store_path,
+                workspace_id=step_run.workspace,
+                input_artifact_content_hashes=input_artifact_content_hashes,
+            )
 
+            if step_run.cache_enabled:
+                cached_step_run = session.exec(
+                    select(StepRunSchema)
+                    .where(StepRunSchema.workspace_id == step_run.workspace)
+                    .where(StepRunSchema.cache_key == step_run.cache_key)
+                    .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+                    .order_by(desc(StepRunSchema.created))
+                ).first()
+                if cached_step_run:
+                    step_run.original_step_run_id = cached_step_run.id
+                    step_run.output_artifacts = {
+                        link.name: link.artifact_id
+                        for link in cached_step_run.output_artifacts
+                    }
+                    step_run.status = ExecutionStatus.CACHED
+                    step_run.end_time = step_run.start_time
+
+            step_schema = self._create_run_step(
+                step_run=step_run, session=session
+            )
             session.commit()
 
             return self._run_step_schema_to_model(step_schema)
 
+    def _create_run_step(
+        self, step_run: StepRunRequestModel, session: Session
+    ) -> StepRunSchema:
+        """Creates a step run without committing the session.
+
+        Args:
+            step_run: The step run to create.
+            session: The database session to use.
+
+        Returns:
+            The schema of the created step run.
+
+        Raises:
+            EntityExistsError: if the step run already exists.
+            KeyError: if the pipeline run doesn't exist.
+        """
+        # Check if the pipeline run exists
+        run = session.exec(
+            select(PipelineRunSchema).where(
+                PipelineRunSchema.id == step_run.pipeline_run_id
+            )
+        ).first()
+        if run is None:
+            raise KeyError(
+                f"Unable to create step '{step_run.name}': No pipeline run "
+                f"with ID '{step_run.pipeline_run_id}' found."
+            )
+
+        # Check if the step name already exists in the pipeline run
+        existing_step_run = session.exec(
+            select(StepRunSchema)
+            .where(StepRunSchema.name == step_run.name)
+            .where(StepRunSchema.pipeline_run_id == step_run.pipeline_run_id)
+        ).first()
+        if existing_step_run is not None:
+            raise EntityExistsError(
+                f"Unable to create step '{step_run.name}': A step with this "
+                f"name already exists in the pipeline run with ID "
+                f"'{step_run.pipeline_run_id}'."
+            )
+
+        # Create the step
+        step_schema = StepRunSchema.from_request(step_run)
+        session.add(step_schema)
+
+        # Save parent step IDs into the database.
+        for parent_step_id in step_run.parent_step_ids:
+            self._set_run_step_parent_step(
+                child_id=step_schema.id,
+                parent_id=parent_step_id,
+                session=session,
+            )
+
+        # Save input artifact IDs into the database.
+        for input_name, artifact_id in step_run.input_artifacts.items():
+            self._set_run_step_input_artifact(
+                run_step_id=step_schema.id,
+                artifact_id=artifact_id,
+                name=input_name,
+                session=session,
+            )
+
+        # Save output artifact IDs into the database.
+        for output_name, artifact_id in step_run.output_artifacts.items():
+            self._set_run_step_output_artifact(
+                step_run_id=step_schema.id,
+                artifact_id=artifact_id,
+                name=output_name,
+                session=session,
+            )
+
+        return step_schema
+
     def _set_run_step_parent_step(
         self, child_id: UUID, parent_id: UUID, session: Session
     ) -> None:
@@ -3605,54 +3845,115 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The run step model.
         """
+        return self._run_step_schemas_to_models([step_run])[0]
+
+    def _run_step_schemas_to_models(
+        self, step_runs: Sequence[StepRunSchema]
+    ) -> List[StepRunResponseModel]:
+        """Converts multiple run step schemas to step models.
+
+        The parent steps and input/output artifacts of all step runs are
+        loaded with a fixed number of queries instead of separate queries for
+        each step run.
+
+        Args:
+            step_runs: The run step schemas to convert.
+
+        Returns:
+            The run step models, in the same order as the schemas.
+        """
+        if not step_runs:
+            return []
+
+        step_run_ids = [step_run.id for step_run in step_runs]
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        input_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        output_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+
         with Session(self.engine) as session:
             # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
+            parent_links = session.exec(
+                select(StepRunParentsSchema).where(
+                    StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
             ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+            for parent_link in parent_links:
+                parent_step_ids[parent_link.child_id].append(
+                    parent_link.parent_id
+                )
 
-            # Get input artifacts.
+            # Get input and output artifacts.
             input_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
                     StepRunInputArtifactSchema.name,
+                    StepRunInputArtifactSchema.step_id,
                 )
                 .where(
                     ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
                 )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(*self._artifact_schema_load_options())
             ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
-
-            # Get output artifacts.
             output_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
                     StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.step_id,
                 )
                 .where(
                     ArtifactSchema.id
                     == StepRunOutputArtifactSchema.artifact_id
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(*self._artifact_schema_load_options())
             ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
+
+            artifact_schemas = {
+                artifact.id: artifact
+                for artifact, _, _ in input_artifact_list
+                + output_artifact_list
             }
+            artifact_models = dict(
+                zip(
+                    artifact_schemas.keys(),
+                    self._artifact_schemas_to_models(
+                        list(artifact_schemas.values()), session=session
+                    ),
+                )
+            )
+            for artifact, input_name, step_run_id in input_artifact_list:
+                input_artifacts[step_run_id][input_name] = artifact_models[
+                    artifact.id
+                ]
+            for artifact, output_name, step_run_id in output_artifact_list:
+                output_artifacts[step_run_id][output_name] = artifact_models[
+                    artifact.id
+                ]
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
+        # Convert to models.
+        return [
+            step_run.to_model(
+                parent_step_ids=parent_step_ids[step_run.id],
+                input_artifacts=input_artifacts[step_run.id],
+                output_artifacts=output_artifacts[step_run.id],
             )
+            for step_run in step_runs
+        ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3667,13 +3968,15 @@ class SqlZenStore(BaseZenStore):
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
+            query = select(StepRunSchema).options(
+                selectinload(StepRunSchema.run_metadata)
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=StepRunSchema,
                 filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
+                custom_schemas_to_models_conversion=self._run_step_schemas_to_models,
             )
 
     def update_run_step(
@@ -3741,22 +4044,45 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The created artifact.
         """
-        with Session(self.engine) as session:
+        return self.create_artifacts([artifact])[0]
+
+    def create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single transaction.
 
-            # Save artifact.
-            artifact_schema = ArtifactSchema.from_request(artifact)
-            session.add(artifact_schema)
+        Args:
+            artifacts: The artifacts to create.
 
-            # Save visualizations of the artifact.
-            if artifact.visualizations:
-                for vis in artifact.visualizations:
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+        with Session(self.engine) as session:
+            artifact_schemas = []
+            for artifact in artifacts:
+                # Save artifact.
+                artifact_schema = ArtifactSchema.from_request(artifact)
+                session.add(artifact_schema)
+                artifact_schemas.append(artifact_schema)
+
+                # Save visualizations of the artifact.
+                for vis in artifact.visualizations or []:
                     vis_schema = ArtifactVisualizationSchema.from_model(
                         visualization=vis, artifact_id=artifact_schema.id
                     )
                     session.add(vis_schema)
 
+                # Save metadata of the artifact.
+                for run_metadata in artifact.run_metadata:
+                    run_metadata = run_metadata.copy(
+                        update={"artifact_id": artifact_schema.id}
+                    )
+                    session.add(RunMetadataSchema.from_request(run_metadata))
+
             session.commit()
-            return self._artifact_schema_to_model(artifact_schema)
+            return self._artifact_schemas_to_models(
+                artifact_schemas, session=session
+            )
 
     def _artifact_schema_to_model(
         self, artifact_schema: ArtifactSchema
@@ -3769,22 +4095,74 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The converted artifact model.
         """
-        # Find the producer step run ID.
-        with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
+        return self._artifact_schemas_to_models([artifact_schema])[0]
+
+    def _artifact_schemas_to_models(
+        self,
+        artifact_schemas: Sequence[ArtifactSchema],
+        session: Optional[Session] = None,
+    ) -> List[ArtifactResponseModel]:
+        """Converts multiple artifact schemas to models.
+
+        The producer step runs of all artifacts are loaded in a single query.
+
+        Args:
+            artifact_schemas: The artifact schemas to convert.
+            session: An optional database session to use. If not given, a new
+                session will be created.
+
+        Returns:
+            The converted artifact models, in the same order as the schemas.
+        """
+        if not artifact_schemas:
+            return []
+
+        if session is None:
+            with Session(self.engine) as session:
+                return self._artifact_schemas_to_models(
+                    artifact_schemas, session=session
                 )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
 
-            # Convert the artifact schema to a model.
-            return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+        # Find the producer step run IDs.
+        producer_links = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                StepRunOutputArtifactSchema.artifact_id.in_(  # type: ignore[attr-defined]
+                    [artifact.id for artifact in artifact_schemas]
+                )
+            )
+            .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+            .where(StepRunSchema.status != ExecutionStatus.CACHED)
+        ).all()
+        producer_step_run_ids: Dict[UUID, UUID] = {}
+        for artifact_id, step_run_id in producer_links:
+            producer_step_run_ids.setdefault(artifact_id, step_run_id)
+
+        # Convert the artifact schemas to models.
+        return [
+            artifact_schema.to_model(
+                producer_step_run_id=producer_step_run_ids.get(
+                    artifact_schema.id
+                )
             )
+            for artifact_schema in artifact_schemas
+        ]
+
+    @staticmethod
+    def _artifact_schema_load_options() -> List[Any]:
+        """Loader options to eagerly load the relationships of artifacts.
+
+        Returns:
+            The loader options to use when querying artifact schemas that
+            will be converted to models.
+        """
+        return [
+            selectinload(ArtifactSchema.run_metadata),
+            selectinload(ArtifactSchema.visualizations),
+        ]
 
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -3822,7 +4200,9 @@ class SqlZenStore(BaseZenStore):
             A list of all artifacts matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(ArtifactSchema)
+            query = select(ArtifactSchema).options(
+                *self._artifact_schema_load_options()
+            )
             if artifact_filter_model.only_unused:
                 query = query.where(
                     ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
@@ -3839,7 +4219,7 @@ class SqlZenStore(BaseZenStore):
                 query=query,
                 table=ArtifactSchema,
                 filter_model=artifact_filter_model,
-                custom_schema_to_model_conversion=self._artifact_schema_to_model,
+                custom_schemas_to_models_conversion=self._artifact_schemas_to_models,
             )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
@@ -3863,6 +4243,55 @@ class SqlZenStore(BaseZenStore):
             session.delete(artifact)
             session.commit()
 
+    def delete_unused_artifacts(self, artifact_ids: List[UUID]) -> List[UUID]:
+        """Deletes multiple artifacts that are not used in any step runs.
+
+        Whether an artifact is unused is checked in the same transaction in
+        which the artifacts get deleted, so artifacts that got reused (e.g.
+        by a cached step) in the meantime are never deleted.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to delete.
+
+        Returns:
+            The IDs of the deleted artifacts. Artifacts that don't exist or
+            are used in step runs are skipped.
+        """
+        if not artifact_ids:
+            return []
+
+        with Session(self.engine) as session:
+            artifacts = session.exec(
+                select(ArtifactSchema)
+                .where(
+                    ArtifactSchema.id.in_(  # type: ignore[attr-defined]
+                        artifact_ids
+                    )
+                )
+                .where(
+                    ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
+                        select(StepRunOutputArtifactSchema.artifact_id)
+                    )
+                )
+                .where(
+                    ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
+                        select(StepRunInputArtifactSchema.artifact_id)
+                    )
+                )
+                .options(
+                    # Load all cascaded relationships upfront instead of
+                    # issuing separate queries for each deleted artifact.
+                    selectinload(ArtifactSchema.run_metadata),
+                    selectinload(ArtifactSchema.visualizations),
+                    selectinload(ArtifactSchema.input_to_step_runs),
+                    selectinload(ArtifactSchema.output_of_step_runs),
+                )
+            ).all()
+            for artifact in artifacts:
+                session.delete(artifact)
+            session.commit()
+            return [artifact.id for artifact in artifacts]
+
     # ------------
     # Run Metadata
     # ------------
@@ -0,0 +1,159 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Client-side caches for responses of zen stores."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+CacheKey = Tuple[str, Hashable]
+
+
+class BaseStoreCache(ABC):
+    """Interface for caches of zen store responses.
+
+    Cache entries are identified by a key consisting of the kind of the
+    cached entity (e.g. `"flavor"`) and a kind-specific identifier.
+    """
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Gets a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value or `None` if no valid cache entry exists.
+        """
+
+    @abstractmethod
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Caches a value.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+
+    @abstractmethod
+    def invalidate(self, kind: str, identifier: Hashable = None) -> None:
+        """Invalidates cache entries.
+
+        Args:
+            kind: The kind of entries to invalidate.
+            identifier: The identifier of the entry to invalidate. If not
+                given, all entries of the given kind are invalidated.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+
+
+class TTLStoreCache(BaseStoreCache):
+    """Thread-safe and size-bounded in-memory cache with expiring entries.
+
+    If the cache is full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: Number of seconds after which cache entries expire.
+            max_size: The maximum number of entries in the cache.
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Gets a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value or `None` if the entry doesn't exist or has
+            expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expiration_time, value = entry
+            if time.monotonic() >= expiration_time:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Caches a value.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        if self._ttl <= 0 or self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, identifier: Hashable = None) -> None:
+        """Invalidates cache entries.
+
+        Args:
+            kind: The kind of entries to invalidate.
+            identifier: The identifier of the entry to invalidate. If not
+                given, all entries of the given kind are invalidated.
+        """
+        with self._lock:
+            if identifier is not None:
+                self._entries.pop((kind, identifier), None)
+                return
+
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the cache.
+
+        Returns:
+            The number of entries, including expired ones that were not
+            evicted yet.
+        """
+        return len(self._entries)
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
@@ -59,6 +59,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunPrepareRequestModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -1231,6 +1232,31 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def prepare_run_step(
+        self, step_run: StepRunPrepareRequestModel
+    ) -> StepRunResponseModel:
+        """Prepares and creates a step run.
+
+        Resolves the input artifacts and parent steps of the step run from
+        the other step runs of its pipeline run, computes its cache key and,
+        if caching is enabled, reuses the outputs of a cached step run. The
+        resulting step run is then created in the same transaction.
+
+        Args:
+            step_run: The step run to prepare and create.
+
+        Returns:
+            The created step run. If a cached step run was found, the status
+            of the created step run will be `ExecutionStatus.CACHED`.
+
+        Raises:
+            EntityExistsError: if the step run already exists.
+            KeyError: if the pipeline run doesn't exist.
+            InputResolutionError: if the inputs of the step run can't be
+                resolved.
+        """
+
     @abstractmethod
     def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
         """Get a step run by ID.
@@ -1295,6 +1321,19 @@ class ZenStoreInterface(ABC):
             The created artifact.
         """
 
+    @abstractmethod
+    def create_artifacts(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single operation.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+
     @abstractmethod
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -1334,6 +1373,18 @@ class ZenStoreInterface(ABC):
             KeyError: if the artifact doesn't exist.
         """
 
+    @abstractmethod
+    def delete_unused_artifacts(self, artifact_ids: List[UUID]) -> List[UUID]:
+        """Deletes multiple artifacts that are not used in any step runs.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to delete.
+
+        Returns:
+            The IDs of the deleted artifacts. Artifacts that don't exist or
+            are used in step runs are skipped.
+        """
+
     # ------------
     # Run Metadata
     # ------------
@@ -106,6 +106,8 @@ def auto_environment(
     session_mocker.patch("analytics.track")
     session_mocker.patch("analytics.group")
     session_mocker.patch("analytics.identify")
+    # Send analytics synchronously so they don't run concurrently with tests
+    session_mocker.patch("zenml.utils.analytics_utils.ANALYTICS_QUEUE_SIZE", 0)
 
     environment_name = request.config.getoption("environment", None)
     no_provision = request.config.getoption("no_provision", False)
@@ -13,6 +13,9 @@
 #  permissions and limitations under the License.
 """Test zenml artifact CLI commands."""
 
+import os
+from uuid import uuid4
+
 from click.testing import CliRunner
 
 from zenml.cli.cli import cli
@@ -96,3 +99,61 @@ def test_artifact_prune(clean_workspace_with_run):
     assert result.exit_code == 0
     existing_artifacts = clean_workspace_with_run.list_artifacts()
     assert len(existing_artifacts) == 0
+
+
+def test_artifact_prune_dry_run(clean_workspace_with_run):
+    """Test that zenml artifact prune --dry-run doesn't delete anything."""
+    existing_runs = clean_workspace_with_run.list_runs()
+    clean_workspace_with_run.delete_pipeline_run(existing_runs[0].name)
+    existing_artifacts = clean_workspace_with_run.list_artifacts()
+    assert len(existing_artifacts) == 2
+
+    runner = CliRunner()
+    prune_command = cli.commands["artifact"].commands["prune"]
+    result = runner.invoke(prune_command, ["--dry-run"])
+    assert result.exit_code == 0
+    assert "Found 2 unused artifacts" in result.output
+    assert len(clean_workspace_with_run.list_artifacts()) == 2
+    for artifact in existing_artifacts:
+        assert clean_workspace_with_run.active_stack.artifact_store.exists(
+            artifact.uri
+        )
+
+
+def test_artifact_prune_honors_retention_period(clean_workspace_with_run):
+    """Test that zenml artifact prune keeps recently created artifacts."""
+    existing_runs = clean_workspace_with_run.list_runs()
+    clean_workspace_with_run.delete_pipeline_run(existing_runs[0].name)
+
+    runner = CliRunner()
+    prune_command = cli.commands["artifact"].commands["prune"]
+    result = runner.invoke(prune_command, ["--older-than", "1", "-y"])
+    assert result.exit_code == 0
+    assert len(clean_workspace_with_run.list_artifacts()) == 2
+
+    result = runner.invoke(prune_command, ["-y"])
+    assert result.exit_code == 0
+    assert len(clean_workspace_with_run.list_artifacts()) == 0
+
+
+def test_artifact_prune_deletes_orphaned_directories(
+    clean_workspace_with_run,
+):
+    """Test that zenml artifact prune --orphaned deletes orphaned data."""
+    artifact_store = clean_workspace_with_run.active_stack.artifact_store
+    orphaned_uri = os.path.join(
+        artifact_store.path, "some_step", "output", str(uuid4())
+    )
+    artifact_store.makedirs(orphaned_uri)
+    unrelated_uri = os.path.join(artifact_store.path, "mlruns", "0", "1")
+    artifact_store.makedirs(unrelated_uri)
+
+    runner = CliRunner()
+    prune_command = cli.commands["artifact"].commands["prune"]
+    result = runner.invoke(prune_command, ["--orphaned", "-y"])
+    assert result.exit_code == 0
+    assert not artifact_store.exists(orphaned_uri)
+    assert artifact_store.exists(unrelated_uri)
+    assert len(clean_workspace_with_run.list_artifacts()) == 2
+    for artifact in clean_workspace_with_run.list_artifacts():
+        assert artifact_store.exists(artifact.uri)
@@ -13,13 +13,23 @@
 #  permissions and limitations under the License.
 
 import os
+import subprocess
+import sys
+from importlib import import_module
+from typing import Dict, Tuple
 
 import click
 import pytest
 from click.testing import CliRunner
 
-from zenml.cli.cli import ZenMLCLI, cli
+from zenml.cli.cli import TagGroup, ZenMLCLI, cli
 from zenml.cli.formatter import ZenFormatter
+from zenml.cli.manifest import COMMAND_MODULES, LAZY_COMMANDS
+from zenml.enums import CliCategories
+
+# Maximum number of seconds it may take to import the CLI and show its help
+CLI_IMPORT_TIME_BUDGET = 1.0
+ENV_ZENML_BENCHMARK_CLI_IMPORT_TIME = "ZENML_BENCHMARK_CLI_IMPORT_TIME"
 
 
 @pytest.fixture(scope="function")
@@ -79,3 +89,118 @@ def test_cli_does_not_set_custom_source_root_if_inside_repository(
     runner.invoke(cli, ["version"])
 
     mock_set_custom_source_root.assert_not_called()
+
+
+def test_lazy_command_manifest_matches_cli_commands() -> None:
+    """Tests that the manifest lists all top-level CLI commands correctly."""
+    for module in COMMAND_MODULES:
+        import_module(module)
+
+    assert set(cli.commands) == set(LAZY_COMMANDS)
+    for name, command in cli.commands.items():
+        lazy_command = LAZY_COMMANDS[name]
+        assert command.callback.__module__ in lazy_command.modules
+        assert command.hidden == lazy_command.hidden
+        assert (
+            command.tag
+            if isinstance(command, TagGroup)
+            else CliCategories.OTHER_COMMANDS
+        ) == lazy_command.tag
+        assert command.get_short_help_str(
+            limit=1000
+        ) == click.utils.make_default_short_help(
+            lazy_command.help, max_length=1000
+        )
+
+
+def _get_import_times(stderr: str) -> Tuple[Dict[str, float], float]:
+    """Parses the output of `python -X importtime`.
+
+    Args:
+        stderr: The output.
+
+    Returns:
+        The cumulative import time in seconds of each imported module and the
+        total import time in seconds.
+    """
+    import_times = {}
+    total = 0.0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        seconds = int(cumulative) / 1e6
+        import_times[module.strip()] = seconds
+        # Nested imports are indented and already part of their parent
+        if not module[1:].startswith(" "):
+            total += seconds
+    return import_times, total
+
+
+def test_cli_help_import_time() -> None:
+    """Tests that showing the CLI help doesn't import the command modules."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from zenml.cli.cli import cli; "
+            "cli.main(['--help'], prog_name='zenml', standalone_mode=False)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times, total = _get_import_times(result.stderr)
+
+    assert "zenml.cli.cli" in import_times
+    assert "zenml.client" not in import_times
+    assert not set(COMMAND_MODULES).intersection(import_times)
+    if os.environ.get(ENV_ZENML_BENCHMARK_CLI_IMPORT_TIME):
+        # Wall-clock times depend on the machine, so the budget is only
+        # checked when benchmarking explicitly.
+        assert total < CLI_IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from zenml.cli import cli",
+        "import zenml.cli.cli; from zenml.cli import cli",
+        "import zenml.cli.stack; from zenml.cli import cli",
+    ],
+)
+def test_cli_group_is_importable_from_the_cli_package(statement) -> None:
+    """Tests that `zenml.cli.cli` is the CLI group and not its module."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; from zenml.cli.cli import ZenMLCLI; "
+            "assert isinstance(cli, ZenMLCLI), cli; "
+            "assert 'user' in cli.commands",
+        ],
+        check=True,
+    )
+
+    from zenml.cli import cli as cli_group
+
+    assert cli_group is cli
+
+
+def test_command_groups_are_importable_from_the_cli_package() -> None:
+    """Tests that command groups take precedence over submodules with the
+    same name, as they did when the command modules were star-imported."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import click; from zenml.cli import stack, utils; "
+            "assert isinstance(stack, click.Group), stack; "
+            "assert not isinstance(utils, click.Command), utils",
+        ],
+        check=True,
+    )
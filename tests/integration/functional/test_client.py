@@ -26,7 +26,7 @@ from tests.integration.functional.utils import sample_name
 from zenml.client import Client
 from zenml.config.pipeline_spec import PipelineSpec
 from zenml.config.source import Source
-from zenml.enums import SecretScope, StackComponentType
+from zenml.enums import ArtifactType, SecretScope, StackComponentType
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
@@ -37,6 +37,7 @@ from zenml.exceptions import (
 from zenml.io import fileio
 from zenml.metadata.metadata_types import MetadataTypeEnum
 from zenml.models import (
+    ArtifactRequestModel,
     ComponentResponseModel,
     PipelineBuildRequestModel,
     PipelineDeploymentRequestModel,
@@ -972,6 +973,41 @@ def test_deleting_deployments(clean_client):
         clean_client.get_deployment(str(response.id))
 
 
+def test_deleting_deduplicated_artifacts(clean_client, tmp_path):
+    """Tests that shared artifact data is deleted with the last artifact."""
+    artifact_store_id = clean_client.active_stack_model.components[
+        StackComponentType.ARTIFACT_STORE
+    ][0].id
+    uri = str(tmp_path / "artifact")
+    os.mkdir(uri)
+    artifacts = [
+        clean_client.zen_store.create_artifact(
+            ArtifactRequestModel(
+                name="output",
+                uri=uri,
+                materializer="module.Materializer",
+                data_type="module.DataType",
+                type=ArtifactType.DATA,
+                content_hash="content_hash",
+                artifact_store_id=artifact_store_id,
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+            )
+        )
+        for _ in range(2)
+    ]
+
+    clean_client.delete_artifact(
+        artifacts[0].id, delete_from_artifact_store=True
+    )
+    assert os.path.isdir(uri)
+
+    clean_client.delete_artifact(
+        artifacts[1].id, delete_from_artifact_store=True
+    )
+    assert not os.path.exists(uri)
+
+
 class ClientCrudTestConfig(BaseModel):
     entity_name: str
     create_args: Dict[str, Any] = {}
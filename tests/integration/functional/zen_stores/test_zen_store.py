@@ -1089,6 +1089,46 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_list_run_steps_with_cursor_returns_all_steps():
+    """Tests that cursor-based pagination returns every step exactly once."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(3):
+        all_steps = store.list_run_steps(StepRunFilterModel(size=50))
+
+        step_ids = []
+        page = store.list_run_steps(
+            StepRunFilterModel(size=2, skip_count=True)
+        )
+        step_ids += [step.id for step in page.items]
+        while page.next_cursor:
+            page = store.list_run_steps(
+                StepRunFilterModel(
+                    size=2, skip_count=True, after=page.next_cursor
+                )
+            )
+            step_ids += [step.id for step in page.items]
+
+        assert step_ids == [step.id for step in all_steps.items]
+
+
+def test_list_run_steps_matches_get_run_step():
+    """Tests that listed steps have the same relationships as fetched ones."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2):
+        steps = store.list_run_steps(StepRunFilterModel(size=50))
+        assert steps.total > 0
+
+        for step in steps.items:
+            fetched_step = store.get_run_step(step.id)
+            assert step.parent_step_ids == fetched_step.parent_step_ids
+            assert step.input_artifacts == fetched_step.input_artifacts
+            assert step.output_artifacts == fetched_step.output_artifacts
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -1132,3 +1172,28 @@ def test_artifacts_are_not_deleted_with_run():
 
         artifacts = store.list_artifacts(ArtifactFilterModel())
         assert artifacts.total == num_artifacts_before + num_runs * 2
+
+
+def test_deleting_unused_artifacts():
+    """Tests that deleting unused artifacts skips artifacts used in runs."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        artifact_ids = [
+            artifact.id
+            for step in store.list_run_steps(
+                StepRunFilterModel(pipeline_run_id=runs[0].id)
+            ).items
+            for artifact in step.output_artifacts.values()
+        ]
+        assert store.delete_unused_artifacts(artifact_ids) == []
+        for artifact_id in artifact_ids:
+            assert store.get_artifact(artifact_id)
+
+        store.delete_run(runs[0].id)
+        deleted_ids = store.delete_unused_artifacts(artifact_ids)
+        assert set(deleted_ids) == set(artifact_ids)
+        for artifact_id in artifact_ids:
+            with pytest.raises(KeyError):
+                store.get_artifact(artifact_id)
@@ -0,0 +1,158 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+from zenml.artifact_stores import local_artifact_cache
+from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
+
+
+def _create_artifact(root: str, name: str, size: int) -> str:
+    """Creates an artifact directory containing a single file."""
+    uri = os.path.join(root, name)
+    os.makedirs(uri)
+    with open(os.path.join(uri, "data.bin"), "wb") as f:
+        f.write(b"x" * size)
+    return uri
+
+
+def test_cache_returns_local_copy_and_counts_hits(tmp_path):
+    """Tests that artifacts are only downloaded once."""
+    uri = _create_artifact(str(tmp_path / "store"), "artifact", 10)
+    cache = LocalArtifactCache(str(tmp_path / "cache"), max_size=100)
+
+    path = cache.get(uri)
+    assert path != uri
+    with open(os.path.join(path, "data.bin"), "rb") as f:
+        assert f.read() == b"x" * 10
+
+    assert cache.get(uri) == path
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.bytes_downloaded == 10
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    """Tests that the cache stays within its size budget."""
+    store = str(tmp_path / "store")
+    uri_1 = _create_artifact(store, "artifact_1", 40)
+    uri_2 = _create_artifact(store, "artifact_2", 40)
+    uri_3 = _create_artifact(store, "artifact_3", 40)
+    cache = LocalArtifactCache(str(tmp_path / "cache"), max_size=100)
+
+    with cache.lease(uri_1) as path_1:
+        pass
+    with cache.lease(uri_2) as path_2:
+        pass
+    with cache.lease(uri_1):
+        pass
+    with cache.lease(uri_3):
+        pass
+
+    assert cache.evictions == 1
+    assert cache.size == 80
+    assert os.path.isdir(path_1)
+    assert not os.path.exists(path_2)
+
+
+def test_cache_skips_artifacts_exceeding_the_size(tmp_path):
+    """Tests that artifacts bigger than the cache are not cached."""
+    uri = _create_artifact(str(tmp_path / "store"), "artifact", 200)
+    cache_dir = str(tmp_path / "cache")
+    cache = LocalArtifactCache(cache_dir, max_size=100)
+
+    assert cache.get(uri) == uri
+    assert cache.bytes_downloaded == 0
+    assert not any(
+        os.path.isdir(os.path.join(cache_dir, name))
+        for name in os.listdir(cache_dir)
+    )
+
+
+def test_cache_loads_existing_entries(tmp_path):
+    """Tests that entries of previous processes are reused."""
+    uri = _create_artifact(str(tmp_path / "store"), "artifact", 10)
+    cache_dir = str(tmp_path / "cache")
+    with LocalArtifactCache(cache_dir, max_size=100).lease(uri) as path:
+        pass
+    os.makedirs(os.path.join(cache_dir, ".tmp-leftover"))
+
+    cache = LocalArtifactCache(cache_dir, max_size=100)
+    assert cache.size == 10
+    assert cache.get(uri) == path
+    assert cache.hits == 1
+    assert not os.path.exists(os.path.join(cache_dir, ".tmp-leftover"))
+
+
+def test_cache_does_not_evict_leased_entries(tmp_path):
+    """Tests that entries are not evicted while they are in use."""
+    store = str(tmp_path / "store")
+    uri_1 = _create_artifact(store, "artifact_1", 60)
+    uri_2 = _create_artifact(store, "artifact_2", 60)
+    cache = LocalArtifactCache(str(tmp_path / "cache"), max_size=100)
+
+    path_1 = cache.get(uri_1)
+    with cache.lease(uri_2) as path_2:
+        assert cache.evictions == 0
+        assert os.path.isdir(path_1)
+        assert os.path.isdir(path_2)
+
+    cache.release(uri_1)
+    with cache.lease(uri_2):
+        pass
+    assert os.path.isdir(path_1)
+
+    uri_3 = _create_artifact(store, "artifact_3", 10)
+    with cache.lease(uri_3):
+        pass
+    assert cache.evictions == 1
+    assert not os.path.exists(path_1)
+
+
+def test_cache_does_not_evict_entries_leased_by_other_processes(tmp_path):
+    """Tests that entries leased by another cache instance are kept."""
+    if local_artifact_cache.fcntl is None:
+        return
+
+    store = str(tmp_path / "store")
+    uri_1 = _create_artifact(store, "artifact_1", 60)
+    uri_2 = _create_artifact(store, "artifact_2", 60)
+    cache_dir = str(tmp_path / "cache")
+    other_cache = LocalArtifactCache(cache_dir, max_size=100)
+    cache = LocalArtifactCache(cache_dir, max_size=100)
+
+    with other_cache.lease(uri_1) as path_1:
+        with cache.lease(uri_1):
+            pass
+        with cache.lease(uri_2):
+            pass
+        assert cache.evictions == 0
+        assert os.path.isdir(path_1)
+
+
+def test_cache_keeps_temporary_entries_of_running_fills(tmp_path):
+    """Tests that only temporary entries of dead fills get removed."""
+    cache_dir = str(tmp_path / "cache")
+    leftover = os.path.join(cache_dir, ".tmp-leftover")
+    running = os.path.join(cache_dir, ".tmp-running")
+    os.makedirs(leftover)
+    os.makedirs(running)
+
+    with open(running + local_artifact_cache.LOCK_FILE_SUFFIX, "a") as f:
+        local_artifact_cache._lock_file(f)
+        cache = LocalArtifactCache(cache_dir, max_size=100)
+
+    assert cache.size == 0
+    assert not os.path.exists(leftover)
+    if local_artifact_cache.fcntl is not None:
+        assert os.path.isdir(running)
@@ -12,8 +12,11 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+from typing import List
+
 import pandas as pd
-from datasets import Dataset
+from datasets import Dataset, DatasetDict
 
 from tests.unit.test_general import _test_materializer
 from zenml.integrations.huggingface.materializers.huggingface_datasets_materializer import (
@@ -35,3 +38,51 @@ def test_huggingface_datasets_materializer(clean_client):
     data = dataset.data.to_pydict()
     assert "0" in data.keys()
     assert [1, 2, 3] in data.values()
+
+
+def test_huggingface_datasets_materializer_loads_local_datasets_in_place(
+    tmp_path,
+):
+    """Tests that datasets of local artifact stores are not copied."""
+    dataset = Dataset.from_pandas(pd.DataFrame([1, 2, 3]))
+    materializer = HFDatasetMaterializer(uri=str(tmp_path))
+    materializer.save(dataset)
+
+    loaded_dataset = materializer.load(Dataset)
+
+    assert loaded_dataset.cache_files
+    for cache_file in loaded_dataset.cache_files:
+        assert os.path.realpath(cache_file["filename"]).startswith(
+            os.path.realpath(tmp_path)
+        )
+    assert loaded_dataset.data.to_pydict() == dataset.data.to_pydict()
+
+
+def test_huggingface_datasets_materializer_keeps_artifacts_unchanged(
+    tmp_path,
+):
+    """Tests that processing loaded datasets doesn't write to the artifact."""
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+    dataset_dict = DatasetDict({"train": dataset, "test": dataset})
+
+    for ds, data_type in ((dataset, Dataset), (dataset_dict, DatasetDict)):
+        uri = str(tmp_path / data_type.__name__)
+        materializer = HFDatasetMaterializer(uri=uri)
+        materializer.save(ds)
+        files = sorted(_list_files(uri))
+
+        loaded_dataset = materializer.load(data_type)
+        loaded_dataset.map(lambda x: {"b": x["a"] * 2}).filter(
+            lambda x: x["a"] > 1
+        )
+
+        assert sorted(_list_files(uri)) == files
+
+
+def _list_files(path: str) -> List[str]:
+    """Lists all files of a local directory."""
+    return [
+        os.path.join(root, file)
+        for root, _, files in os.walk(path)
+        for file in files
+    ]
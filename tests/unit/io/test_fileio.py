@@ -24,6 +24,7 @@ from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import text
 
 from zenml.io import fileio
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.logger import get_logger
 from zenml.utils import io_utils
 
@@ -113,6 +114,58 @@ def test_copy_raises_error_when_file_exists(tmp_path) -> None:
         fileio.copy(src, dst)
 
 
+def test_copy_streams_between_filesystems_in_chunks(
+    tmp_path, monkeypatch
+) -> None:
+    """Test that copying between filesystems reads the source in chunks."""
+    src = os.path.join(tmp_path, "src.bin")
+    dst = os.path.join(tmp_path, "dst.bin")
+    contents = os.urandom(10_000)
+    with open(src, "wb") as f:
+        f.write(contents)
+
+    read_sizes = []
+
+    class ChunkRecordingFile:
+        def __init__(self, file):
+            self._file = file
+
+        def read(self, size=-1):
+            read_sizes.append(size)
+            return self._file.read(size)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self._file.close()
+
+    class SourceFilesystem(LocalFilesystem):
+        @staticmethod
+        def open(path, mode="r"):
+            return ChunkRecordingFile(LocalFilesystem.open(path, mode))
+
+    monkeypatch.setattr(
+        fileio,
+        "_get_filesystem",
+        lambda path: SourceFilesystem if path == src else LocalFilesystem,
+    )
+
+    fileio.copy(src, dst, chunk_size=4096)
+
+    with open(dst, "rb") as f:
+        assert f.read() == contents
+    assert read_sizes and set(read_sizes) == {4096}
+
+
+def test_copy_fails_for_invalid_chunk_size(tmp_path) -> None:
+    """Test that copy rejects chunk sizes that aren't positive."""
+    src = os.path.join(tmp_path, "test_file.txt")
+    io_utils.create_file_if_not_exists(src)
+    with pytest.raises(ValueError):
+        fileio.copy(src, os.path.join(tmp_path, "dst.txt"), chunk_size=0)
+
+
 def test_file_exists_function(tmp_path) -> None:
     """Test that file_exists returns True when the file exists."""
     with NamedTemporaryFile(dir=tmp_path) as temp_file:
@@ -156,6 +156,32 @@ def test_none_values():
         assert result == example
 
 
+def test_container_materializer_packs_small_elements(tmp_path):
+    """Tests that small elements are packed into a single file per type."""
+    example = [str(i).encode() for i in range(100)] + [1, "a", (1, 2)]
+    materializer = BuiltInContainerMaterializer(uri=str(tmp_path))
+    materializer.save(example)
+
+    assert sorted(os.listdir(tmp_path)) == ["metadata.json", "packed_0.bin"]
+    assert materializer.load(list) == example
+
+
+def test_container_materializer_saves_big_elements_separately(
+    tmp_path, mocker
+):
+    """Tests that big elements are saved into their own subdirectory."""
+    mocker.patch(
+        "zenml.materializers.built_in_materializer.PACKED_ELEMENT_MAX_SIZE",
+        1,
+    )
+    example = [b"abc", b"def"]
+    materializer = BuiltInContainerMaterializer(uri=str(tmp_path))
+    materializer.save(example)
+
+    assert sorted(os.listdir(tmp_path)) == ["0", "1", "metadata.json"]
+    assert materializer.load(list) == example
+
+
 class CustomType:
     """Custom type used for testing the container materializer below."""
 
@@ -84,3 +84,29 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_loads_memmap(tmp_path):
+    """Test that arrays are memory-mapped if `np.memmap` is requested."""
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(array)
+
+    result = materializer.load(np.memmap)
+    assert isinstance(result, np.memmap)
+    assert np.array_equal(result, array)
+
+    # Changes to the memory-mapped array are not written to the artifact
+    result[0, 0] = 42
+    assert materializer.load(np.ndarray)[0, 0] == 0
+
+
+def test_numpy_materializer_memmap_falls_back_for_object_arrays(tmp_path):
+    """Test that object arrays are loaded into memory instead."""
+    array = np.array(["a", 1], dtype=object)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(array)
+
+    result = materializer.load(np.memmap)
+    assert not isinstance(result, np.memmap)
+    assert np.array_equal(result, array)
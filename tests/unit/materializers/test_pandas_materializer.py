@@ -13,10 +13,12 @@
 #  permissions and limitations under the License.
 
 import datetime
+import os
 
 import pandas
 
 from tests.unit.test_general import _test_materializer
+from zenml.materializers import pandas_materializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
 
 
@@ -100,3 +102,28 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_shards_and_projects_columns(
+    tmp_path, monkeypatch
+):
+    """Test sharded storage with column projection, filters and batches."""
+    monkeypatch.setattr(pandas_materializer, "SHARD_SIZE", 100)
+    df = pandas.DataFrame(
+        {"A": range(20), "B": [str(i) for i in range(20)], "C": 1.0},
+        index=[f"row_{i}" for i in range(20)],
+    )
+
+    materializer = PandasMaterializer(uri=str(tmp_path))
+    materializer.save(df)
+    assert len(os.listdir(tmp_path / "shards")) > 1
+
+    assert df.equals(materializer.load(pandas.DataFrame))
+    assert df[["A"]].equals(materializer.read(columns=["A"]))
+    assert df[df["A"] >= 15][["A", "B"]].equals(
+        materializer.read(columns=["A", "B"], filters=[("A", ">=", 15)])
+    )
+
+    batches = list(materializer.iter_batches(batch_size=3, columns=["C"]))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert df[["C"]].equals(pandas.concat(batches))
@@ -245,3 +245,29 @@ def test_string_filter_model():
         filter_class=StrFilter,
         filter_value="a_random_string",
     )
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [
+        datetime(2023, 4, 1, 12, 30, 15, 123),
+        uuid.uuid4(),
+        "some_name",
+        42,
+        None,
+    ],
+)
+def test_filter_model_cursor_roundtrip(sort_value: Any):
+    """Test that pagination cursors can be decoded by filter models."""
+    id_ = uuid.uuid4()
+    cursor = BaseFilterModel.encode_cursor(sort_value=sort_value, id=id_)
+
+    filter_model = BaseFilterModel(after=cursor)
+    assert filter_model.cursor_params == (sort_value, id_)
+    assert not filter_model.list_of_filters
+
+
+def test_filter_model_invalid_cursor_fails():
+    """Test that the filter model rejects invalid pagination cursors."""
+    with pytest.raises(ValidationError):
+        BaseFilterModel(after="not_a_cursor")
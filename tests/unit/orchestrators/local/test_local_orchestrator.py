@@ -12,8 +12,18 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
 from zenml.enums import StackComponentType
 from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestratorSettings,
+)
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +33,98 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+def test_local_orchestrator_settings_default_to_sequential_execution():
+    """Tests that the local orchestrator runs steps sequentially by default
+    and rejects invalid worker counts."""
+    assert LocalOrchestratorSettings().max_workers == 1
+    assert LocalOrchestratorSettings(max_workers=4).max_workers == 4
+
+    with pytest.raises(ValidationError):
+        LocalOrchestratorSettings(max_workers=0)
+
+
+def _run_in_parallel_mode(mocker, local_orchestrator, run_step):
+    """Runs a pipeline with a diamond-shaped DAG in parallel mode.
+
+    Args:
+        mocker: The pytest mocker.
+        local_orchestrator: The orchestrator to run the pipeline with.
+        run_step: Function that simulates the step subprocess. It receives
+            the step name and returns the exit code.
+    """
+
+    def _call(command, **kwargs):
+        return run_step(command[command.index("--step_name") + 1])
+
+    mocker.patch(
+        "zenml.orchestrators.local.local_orchestrator.subprocess.call",
+        side_effect=_call,
+    )
+    mocker.patch("zenml.orchestrators.local.local_orchestrator.Client")
+    mocker.patch(
+        "zenml.orchestrators.local.local_orchestrator.orchestrator_utils"
+    )
+    mocker.patch.object(
+        local_orchestrator,
+        "get_settings",
+        return_value=LocalOrchestratorSettings(max_workers=2),
+    )
+    mocker.patch.object(
+        local_orchestrator,
+        "requires_resources_in_orchestration_environment",
+        return_value=False,
+    )
+
+    upstream_steps = {"a": [], "b": [], "c": ["a", "b"]}
+    deployment = SimpleNamespace(
+        id=uuid4(),
+        schedule=None,
+        step_configurations={
+            name: SimpleNamespace(spec=SimpleNamespace(upstream_steps=steps))
+            for name, steps in upstream_steps.items()
+        },
+    )
+    local_orchestrator.prepare_or_run_pipeline(
+        deployment=deployment,
+        stack=SimpleNamespace(id=uuid4()),
+        environment={},
+    )
+
+
+def test_local_orchestrator_runs_independent_steps_in_parallel(
+    mocker, local_orchestrator
+):
+    """Tests that independent steps run concurrently in parallel mode."""
+    # Both independent steps need to run at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=10)
+    finished_steps = []
+
+    def _run_step(step_name):
+        if step_name in ("a", "b"):
+            barrier.wait()
+        finished_steps.append(step_name)
+        return 0
+
+    _run_in_parallel_mode(mocker, local_orchestrator, _run_step)
+
+    assert sorted(finished_steps[:2]) == ["a", "b"]
+    assert finished_steps[2:] == ["c"]
+
+
+def test_local_orchestrator_fails_run_if_step_fails_in_parallel_mode(
+    mocker, local_orchestrator
+):
+    """Tests that a failing step fails the run and no downstream steps are
+    started."""
+    started_steps = []
+
+    def _run_step(step_name):
+        started_steps.append(step_name)
+        return 1 if step_name == "b" else 0
+
+    with pytest.raises(RuntimeError, match="Failed to run nodes"):
+        _run_in_parallel_mode(mocker, local_orchestrator, _run_step)
+
+    assert "c" not in started_steps
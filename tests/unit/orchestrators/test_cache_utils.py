@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import ANY
 from uuid import uuid4
@@ -22,6 +23,7 @@ from zenml.config.compiler import Compiler
 from zenml.config.source import Source
 from zenml.config.step_configurations import Step
 from zenml.enums import ExecutionStatus, SorterOps
+from zenml.models import StepRunPrepareRequestModel
 from zenml.models.page_model import Page
 from zenml.orchestrators import cache_utils
 from zenml.steps import Output, step
@@ -60,6 +62,23 @@ def generate_cache_key_kwargs(local_artifact_store):
     }
 
 
+def test_compute_cache_key_matches_generated_cache_key(
+    generate_cache_key_kwargs,
+):
+    """Check that computing the cache key from the artifact store ID and path
+    results in the same key as generating it from the artifact store."""
+    artifact_store = generate_cache_key_kwargs["artifact_store"]
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    key_2 = cache_utils.compute_cache_key(
+        step=generate_cache_key_kwargs["step"],
+        input_artifact_ids=generate_cache_key_kwargs["input_artifact_ids"],
+        artifact_store_id=artifact_store.id,
+        artifact_store_path=artifact_store.path,
+        workspace_id=generate_cache_key_kwargs["workspace_id"],
+    )
+    assert key_1 == key_2
+
+
 def test_generate_cache_key_is_deterministic(generate_cache_key_kwargs):
     """Check that the cache key does not change if the inputs are the same."""
     key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
@@ -156,6 +175,40 @@ def test_generate_cache_key_considers_caching_parameters(
     assert key_1 != key_2
 
 
+def test_content_addressed_cache_key_uses_input_content_hashes(
+    generate_cache_key_kwargs,
+):
+    """Check that content-addressed keys only depend on the input content."""
+    generate_cache_key_kwargs["step"].config.__config__.allow_mutation = True
+    generate_cache_key_kwargs["step"].config.content_addressed_cache = True
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "digest"
+    }
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 == key_2
+
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "other_digest"
+    }
+    key_3 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 != key_3
+
+
+def test_content_hashes_are_ignored_without_content_addressed_cache(
+    generate_cache_key_kwargs,
+):
+    """Check that content hashes don't change the key in the default mode."""
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "digest"
+    }
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 == key_2
+
+
 def test_fetching_cached_step_run_queries_cache_candidates(
     mocker, create_step_run
 ):
@@ -233,3 +286,89 @@ def test_fetching_cached_step_run_uses_latest_candidate(
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == response_2
+
+
+def test_preparing_step_run_reuses_cached_step_run(
+    clean_client, sample_pipeline_run_request_model, sample_step_request_model
+):
+    """Tests that preparing a step run registers it as cached if a step run
+    with the same cache key completed before."""
+    workspace_id = clean_client.active_workspace.id
+    sample_step_request_model.workspace = workspace_id
+    sample_pipeline_run_request_model.workspace = workspace_id
+
+    # Create a pipeline run and prepare a completed step run
+    clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+    sample_step_request_model.pipeline_run_id = (
+        sample_pipeline_run_request_model.id
+    )
+    artifact_store = clean_client.active_stack.artifact_store
+    prepare_request = StepRunPrepareRequestModel(
+        **sample_step_request_model.dict(),
+        artifact_store_id=artifact_store.id,
+        artifact_store_path=artifact_store.path,
+        cache_enabled=True,
+    )
+    response_1 = clean_client.zen_store.prepare_run_step(prepare_request)
+    assert response_1.status == ExecutionStatus.COMPLETED
+    assert response_1.cache_key == cache_utils.generate_cache_key(
+        step=sample_step_request_model.step,
+        input_artifact_ids={},
+        artifact_store=artifact_store,
+        workspace_id=workspace_id,
+    )
+
+    # Prepare the same step in another pipeline run
+    sample_pipeline_run_request_model.id = uuid4()
+    sample_pipeline_run_request_model.name = "new_run_name"
+    clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+    prepare_request.pipeline_run_id = sample_pipeline_run_request_model.id
+    response_2 = clean_client.zen_store.prepare_run_step(prepare_request)
+
+    assert response_2.status == ExecutionStatus.CACHED
+    assert response_2.original_step_run_id == response_1.id
+    assert response_2.cache_key == response_1.cache_key
+
+
+def test_getting_content_addressed_outputs():
+    """Tests that only outputs consumed by steps with content-addressed
+    caching are returned."""
+
+    def _create_step(name, content_addressed_cache, inputs):
+        return Step.parse_obj(
+            {
+                "spec": {
+                    "source": "module.step_class",
+                    "upstream_steps": [],
+                    "inputs": {
+                        input_name: {
+                            "step_name": "upstream",
+                            "output_name": output_name,
+                        }
+                        for input_name, output_name in inputs.items()
+                    },
+                },
+                "config": {
+                    "name": name,
+                    "content_addressed_cache": content_addressed_cache,
+                },
+            }
+        )
+
+    deployment = SimpleNamespace(
+        step_configurations={
+            "upstream": _create_step("upstream", True, {}),
+            "step_1": _create_step("step_1", True, {"input": "output_1"}),
+            "step_2": _create_step("step_2", None, {"input": "output_2"}),
+        }
+    )
+
+    assert cache_utils.get_content_addressed_outputs(
+        step_name="upstream", deployment=deployment
+    ) == {"output_1"}
+    assert (
+        cache_utils.get_content_addressed_outputs(
+            step_name="step_1", deployment=deployment
+        )
+        == set()
+    )
@@ -12,10 +12,20 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    FailurePolicy,
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -68,3 +78,118 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_critical_path_lengths():
+    """Test `dag_runner.get_critical_path_lengths()`."""
+    dag = {1: [], 2: [1], 3: [1], 4: [3], 5: [4]}
+    assert get_critical_path_lengths(dag) == {1: 4, 2: 1, 3: 3, 4: 2, 5: 1}
+    assert get_critical_path_lengths({1: [2], 2: [1]}) == {1: 0, 2: 0}
+
+
+def test_dag_runner_max_parallelism():
+    """Test that the DAG runner never runs more nodes than allowed."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    dag = {node: [] for node in range(10)}
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=3)
+    runner.run()
+
+    assert max_running <= 3
+    assert all(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+    assert set(runner.node_timings) == set(dag)
+    assert all(
+        timings.run_duration >= 0 and timings.wait_duration >= 0
+        for timings in runner.node_timings.values()
+    )
+
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(dag, run_fn, max_parallelism=0)
+
+
+def test_dag_runner_bounds_parallelism_by_default(mocker):
+    """Test that the DAG runner doesn't start a thread per node by default."""
+    mocker.patch("zenml.orchestrators.dag_runner.DEFAULT_MAX_PARALLELISM", 2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    ThreadedDagRunner({node: [] for node in range(6)}, run_fn).run()
+
+    assert max_running == 2
+
+
+def test_dag_runner_prioritizes_critical_path():
+    """Test that ready nodes with the longest critical path run first."""
+    order = []
+    dag = {1: [], 2: [], 3: [2], 4: [3]}
+    ThreadedDagRunner(dag, order.append, max_parallelism=1).run()
+    assert order == [2, 3, 1, 4]
+
+
+def _failing_run_fn(node):
+    """Run function that fails for node `2`."""
+    if node == 2:
+        raise ValueError("Node failed.")
+
+
+def test_dag_runner_continue_on_failure():
+    """Test that independent nodes still run if a node fails."""
+    # 1->2->3, 4
+    dag = {1: [], 2: [1], 3: [2], 4: []}
+    runner = ThreadedDagRunner(
+        dag, _failing_run_fn, failure_policy=FailurePolicy.CONTINUE
+    )
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert runner.node_states == {
+        1: NodeStatus.COMPLETED,
+        2: NodeStatus.FAILED,
+        3: NodeStatus.SKIPPED,
+        4: NodeStatus.COMPLETED,
+    }
+    assert isinstance(runner.node_errors[2], ValueError)
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started once a node failed."""
+    # 2->1, 3->4
+    dag = {1: [2], 2: [], 3: [], 4: [3]}
+    runner = ThreadedDagRunner(
+        dag,
+        _failing_run_fn,
+        max_parallelism=1,
+        failure_policy=FailurePolicy.FAIL_FAST,
+    )
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert runner.node_states == {
+        1: NodeStatus.SKIPPED,
+        2: NodeStatus.FAILED,
+        3: NodeStatus.SKIPPED,
+        4: NodeStatus.SKIPPED,
+    }
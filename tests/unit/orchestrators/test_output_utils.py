@@ -13,9 +13,14 @@
 #  permissions and limitations under the License.
 
 import os
+from functools import partialmethod
 
 import pytest
 
+from zenml.client import Client
+from zenml.config.source import Source
+from zenml.enums import ArtifactType, StackComponentType
+from zenml.models.artifact_models import ArtifactRequestModel
 from zenml.orchestrators import output_utils
 
 
@@ -45,3 +50,80 @@ def test_output_artifact_preparation(create_step_run, local_stack):
         output_utils.prepare_output_artifact_uris(
             step_run=step_run, stack=local_stack, step=step_run.step
         )
+
+
+def test_finding_duplicate_artifacts(clean_client, tmp_path):
+    """Tests finding existing artifacts with the same content."""
+    artifact_store_id = clean_client.active_stack_model.components[
+        StackComponentType.ARTIFACT_STORE
+    ][0].id
+    artifact = clean_client.zen_store.create_artifact(
+        ArtifactRequestModel(
+            name="output",
+            uri=str(tmp_path),
+            materializer="module.Materializer",
+            data_type="module.DataType",
+            type=ArtifactType.DATA,
+            content_hash="content_hash",
+            artifact_store_id=artifact_store_id,
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+        )
+    )
+
+    def _find(content_hash: str, materializer: str, data_type: str):
+        return output_utils.find_duplicate_artifact(
+            artifact_store_id=artifact_store_id,
+            content_hash=content_hash,
+            materializer=Source.from_import_path(materializer),
+            data_type=Source.from_import_path(data_type),
+        )
+
+    duplicate = _find("content_hash", "module.Materializer", "module.DataType")
+    assert duplicate.id == artifact.id
+
+    assert not _find("other_hash", "module.Materializer", "module.DataType")
+    assert not _find("content_hash", "module.Other", "module.DataType")
+    assert not _find("content_hash", "module.Materializer", "module.Other")
+
+    # The data of the artifact doesn't exist anymore
+    os.rmdir(tmp_path)
+    assert not _find("content_hash", "module.Materializer", "module.DataType")
+
+
+def test_finding_duplicate_artifacts_on_later_pages(
+    mocker, clean_client, tmp_path
+):
+    """Tests that all artifacts with the same content hash are inspected."""
+    artifact_store_id = clean_client.active_stack_model.components[
+        StackComponentType.ARTIFACT_STORE
+    ][0].id
+    artifacts = [
+        clean_client.zen_store.create_artifact(
+            ArtifactRequestModel(
+                name="output",
+                uri=str(tmp_path),
+                materializer=materializer,
+                data_type="module.DataType",
+                type=ArtifactType.DATA,
+                content_hash="content_hash",
+                artifact_store_id=artifact_store_id,
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+            )
+        )
+        for materializer in ("module.Other", "module.Materializer")
+    ]
+    mocker.patch.object(
+        Client,
+        "list_artifacts",
+        partialmethod(Client.list_artifacts, size=1),
+    )
+
+    duplicate = output_utils.find_duplicate_artifact(
+        artifact_store_id=artifact_store_id,
+        content_hash="content_hash",
+        materializer=Source.from_import_path("module.Materializer"),
+        data_type=Source.from_import_path("module.DataType"),
+    )
+    assert duplicate.id == artifacts[1].id
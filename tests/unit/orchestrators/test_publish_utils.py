@@ -76,6 +76,40 @@ def test_publish_output_artifacts(clean_client):
     assert isinstance(return_val["arias_model"], UUID)
 
 
+def test_publish_output_artifacts_with_metadata(clean_client, mocker):
+    """Tests that artifacts and their metadata are published at once."""
+    create_artifacts_spy = mocker.spy(
+        clean_client.zen_store, "create_artifacts"
+    )
+    artifacts = {
+        name: ArtifactRequestModel(
+            uri=f"some/uri/{name}/",
+            materializer="some_materializer",
+            data_type="some data type",
+            type=ArtifactType.DATA,
+            name=name,
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+        )
+        for name in ["output_1", "output_2"]
+    }
+
+    artifact_ids = publish_utils.publish_output_artifacts(
+        artifacts,
+        output_artifact_metadata={
+            "output_1": {"key": "value", "pi": 3.14},
+        },
+    )
+
+    assert create_artifacts_spy.call_count == 1
+    metadata = clean_client.get_artifact(artifact_ids["output_1"]).metadata
+    assert {key: m.value for key, m in metadata.items()} == {
+        "key": "value",
+        "pi": 3.14,
+    }
+    assert not clean_client.get_artifact(artifact_ids["output_2"]).metadata
+
+
 def test_publishing_a_successful_step_run(mocker):
     """Tests publishing a successful step run."""
     mock_update_run_step = mocker.patch(
@@ -196,29 +230,6 @@ def test_updating_the_pipeline_run_status(
         call_kwargs["run_update"].status == new_status
 
 
-def test_publish_output_artifact_metadata(mocker):
-    """Unit test for `publish_output_artifact_metadata`."""
-    mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
-    )
-    output_artifact_ids = {
-        "output_name": uuid4(),
-        "output_name_2": uuid4(),
-    }
-    output_artifact_metadata = {
-        "output_name": {
-            "key": "value",
-            "key_2": "value_2",
-        },
-        "output_name_2": {"pi": 3.14},
-    }
-    publish_utils.publish_output_artifact_metadata(
-        output_artifact_ids=output_artifact_ids,
-        output_artifact_metadata=output_artifact_metadata,
-    )
-    assert mock_create_run.call_count == 3  # once per key-value pair
-
-
 def test_publish_pipeline_run_metadata(mocker):
     """Unit test for `publish_pipeline_run_metadata`."""
     mock_create_run = mocker.patch(
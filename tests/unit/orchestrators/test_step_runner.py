@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
 import sys
 from uuid import uuid4
 
@@ -166,3 +167,86 @@ def test_loading_unmaterialized_input_artifact(
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact == artifact_response
+
+
+def test_content_hash_is_only_computed_if_requested(mocker, local_stack):
+    """Tests that the content hash of an output is only computed if it can be
+    used for content-addressed caching or deduplication."""
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    materializer = mocker.MagicMock()
+    materializer.compute_content_hash.return_value = "digest"
+
+    _, content_hash = runner._analyze_output_artifact(
+        output_name="output",
+        materializer=materializer,
+        data=1,
+        artifact_metadata_enabled=False,
+        compute_content_hash=False,
+    )
+    assert content_hash is None
+    materializer.compute_content_hash.assert_not_called()
+
+    _, content_hash = runner._analyze_output_artifact(
+        output_name="output",
+        materializer=materializer,
+        data=1,
+        artifact_metadata_enabled=False,
+        compute_content_hash=True,
+    )
+    assert content_hash == "digest"
+
+
+def test_deduplicated_outputs_are_saved_if_their_data_was_deleted(
+    mocker, local_stack, tmp_path
+):
+    """Tests that outputs referencing deleted data are saved again."""
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    materializer_class = mocker.MagicMock()
+    deleted_uri = str(tmp_path / "deleted")
+    existing_uri = str(tmp_path / "existing")
+    os.makedirs(existing_uri)
+    output_artifact_uris = {
+        "deleted": str(tmp_path / "output_1"),
+        "existing": str(tmp_path / "output_2"),
+        "saved": str(tmp_path / "output_3"),
+    }
+    output_artifacts = {
+        "deleted": mocker.MagicMock(uri=deleted_uri),
+        "existing": mocker.MagicMock(uri=existing_uri),
+        "saved": mocker.MagicMock(uri=output_artifact_uris["saved"]),
+    }
+
+    runner._restore_deduplicated_output_artifacts(
+        output_data={"deleted": 1, "existing": 2, "saved": 3},
+        output_materializers=dict.fromkeys(
+            output_artifacts, materializer_class
+        ),
+        output_artifact_uris=output_artifact_uris,
+        output_artifacts=output_artifacts,
+    )
+
+    materializer_class.assert_called_once_with(deleted_uri)
+    materializer_class.return_value.save.assert_called_once_with(1)
+    assert os.path.isdir(deleted_uri)
@@ -11,15 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from types import TracebackType
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from unittest.mock import patch
 from uuid import UUID
 
 from pytest_mock import MockFixture
 
 from zenml.enums import StackComponentType, StoreType
+from zenml.utils import analytics_utils
 from zenml.utils.analytics_utils import (
     AnalyticsEvent,
     get_segment_key,
@@ -286,3 +289,107 @@ def test_track_event_conditions():
     assert track_event(AnalyticsEvent.OPT_IN_ANALYTICS)
     assert track_event(AnalyticsEvent.OPT_OUT_ANALYTICS)
     assert not track_event(AnalyticsEvent.EVENT_TEST)
+
+
+def _use_background_worker(mocker: MockFixture, queue_size: int) -> None:
+    """Sends analytics calls through a new background worker."""
+    mocker.patch.object(analytics_utils, "ANALYTICS_QUEUE_SIZE", queue_size)
+    worker = analytics_utils._AnalyticsWorker()
+    mocker.patch.object(analytics_utils, "_analytics_worker", worker)
+    mocker.patch.object(
+        analytics_utils, "_is_analytics_enabled", return_value=True
+    )
+
+
+def test_tracking_events_does_not_block(mocker: MockFixture) -> None:
+    """Tests that events are tracked without waiting for them to be sent."""
+    _use_background_worker(mocker, queue_size=10)
+    release = threading.Event()
+    sent = threading.Event()
+
+    def _track_event(**kwargs: Any) -> bool:
+        release.wait(timeout=10)
+        sent.set()
+        return True
+
+    mocker.patch.object(analytics_utils, "_track_event", new=_track_event)
+
+    assert track_event(AnalyticsEvent.EVENT_TEST)
+    assert not sent.is_set()
+
+    release.set()
+    assert sent.wait(timeout=10)
+
+
+def test_events_are_dropped_if_queue_is_full(mocker: MockFixture) -> None:
+    """Tests that tracking events never waits for a full queue."""
+    _use_background_worker(mocker, queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _track_event(**kwargs: Any) -> bool:
+        started.set()
+        release.wait(timeout=10)
+        return True
+
+    mocker.patch.object(analytics_utils, "_track_event", new=_track_event)
+
+    assert track_event(AnalyticsEvent.EVENT_TEST)
+    assert started.wait(timeout=10)
+    assert track_event(AnalyticsEvent.EVENT_TEST)
+    assert not track_event(AnalyticsEvent.EVENT_TEST)
+    release.set()
+
+
+def test_flushing_sends_queued_events_within_timeout(
+    mocker: MockFixture,
+) -> None:
+    """Tests that queued events are flushed without waiting indefinitely."""
+    _use_background_worker(mocker, queue_size=10)
+    sent: List[int] = []
+    release = threading.Event()
+
+    def _track_event(**kwargs: Any) -> bool:
+        sent.append(1)
+        return True
+
+    mocker.patch.object(analytics_utils, "_track_event", new=_track_event)
+
+    for _ in range(3):
+        assert track_event(AnalyticsEvent.EVENT_TEST)
+    analytics_utils._analytics_worker.flush(timeout=10)
+    assert len(sent) == 3
+    assert analytics_utils._analytics_worker._thread is None
+
+    def _hanging_track_event(**kwargs: Any) -> bool:
+        release.wait(timeout=10)
+        return True
+
+    mocker.patch.object(
+        analytics_utils, "_track_event", new=_hanging_track_event
+    )
+    assert track_event(AnalyticsEvent.EVENT_TEST)
+    thread = analytics_utils._analytics_worker._thread
+    assert thread is not None and thread.daemon
+
+    start = time.monotonic()
+    analytics_utils._analytics_worker.flush(timeout=0.1)
+    assert time.monotonic() - start < 5
+    release.set()
+
+
+def test_store_properties_are_cached(mocker: MockFixture) -> None:
+    """Tests that store properties are fetched once for each store."""
+    store = mocker.MagicMock()
+    other_store = mocker.MagicMock()
+
+    for _ in range(2):
+        analytics_utils.get_analytics_user_id(store)
+        analytics_utils.get_analytics_store_info(store)
+    assert store.get_user.call_count == 1
+    assert store.get_store_info.call_count == 1
+
+    analytics_utils.get_analytics_user_id(other_store)
+    analytics_utils.get_analytics_user_id(store)
+    assert other_store.get_user.call_count == 1
+    assert store.get_user.call_count == 2
@@ -0,0 +1,183 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from zenml.artifact_stores import LocalArtifactStore, LocalArtifactStoreConfig
+from zenml.enums import ExecutionStatus, StackComponentType
+from zenml.models import ArtifactFilterModel
+from zenml.utils import artifact_gc_utils, pagination_utils
+
+
+def _create_artifact_store(path: str) -> LocalArtifactStore:
+    """Creates a local artifact store."""
+    return LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(path=path),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+def _create_artifact_dir(root: str, step_run_id: UUID) -> str:
+    """Creates an artifact directory of a step run."""
+    uri = os.path.join(root, "step", "output", str(step_run_id))
+    os.makedirs(uri)
+    return uri
+
+
+def test_finding_orphaned_artifact_uris(mocker, tmp_path):
+    """Tests that only orphaned artifact directories are found."""
+    artifact_store = _create_artifact_store(str(tmp_path))
+    step_run_statuses = {
+        uuid4(): status
+        for status in (
+            ExecutionStatus.RUNNING,
+            ExecutionStatus.COMPLETED,
+            ExecutionStatus.CACHED,
+            ExecutionStatus.FAILED,
+        )
+    }
+    uris = {
+        step_run_id: _create_artifact_dir(str(tmp_path), step_run_id)
+        for step_run_id in step_run_statuses
+    }
+    deleted_uri = _create_artifact_dir(str(tmp_path), uuid4())
+    known_uri = _create_artifact_dir(str(tmp_path), uuid4())
+    unrelated_uri = os.path.join(str(tmp_path), "mlruns", "0", uuid4().hex)
+    os.makedirs(unrelated_uri)
+
+    def _get_run_step(step_run_id):
+        if step_run_id in step_run_statuses:
+            return SimpleNamespace(status=step_run_statuses[step_run_id])
+        raise KeyError(step_run_id)
+
+    client = mocker.MagicMock()
+    client.iter_items.return_value = [SimpleNamespace(uri=known_uri)]
+    client.zen_store.get_run_step.side_effect = _get_run_step
+
+    failed_uri = next(
+        uri
+        for step_run_id, uri in uris.items()
+        if step_run_statuses[step_run_id] == ExecutionStatus.FAILED
+    )
+    assert artifact_gc_utils.find_orphaned_artifact_uris(
+        artifact_store, client=client
+    ) == sorted([failed_uri, deleted_uri])
+
+
+@pytest.mark.parametrize(
+    "status", [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED]
+)
+def test_artifacts_of_other_artifact_stores_are_not_orphaned(
+    mocker, tmp_path, status
+):
+    """Tests that artifacts are known regardless of their artifact store."""
+    artifact_store = _create_artifact_store(str(tmp_path))
+    artifacts = [
+        SimpleNamespace(
+            uri=_create_artifact_dir(str(tmp_path), uuid4()),
+            artifact_store_id=artifact_store_id,
+        )
+        for artifact_store_id in (uuid4(), None)
+    ]
+
+    def _list_artifacts(filter_model):
+        return SimpleNamespace(
+            items=[
+                artifact
+                for artifact in artifacts
+                if filter_model.artifact_store_id
+                in (None, artifact.artifact_store_id)
+            ]
+        )
+
+    client = mocker.MagicMock()
+    client.iter_items.side_effect = lambda list_method: list_method().items
+    client.zen_store.list_artifacts.side_effect = _list_artifacts
+    client.zen_store.get_run_step.return_value = SimpleNamespace(status=status)
+
+    assert (
+        artifact_gc_utils.find_orphaned_artifact_uris(
+            artifact_store, client=client
+        )
+        == []
+    )
+
+
+@pytest.mark.parametrize("shared", [True, False])
+def test_finding_shared_uris_checks_all_references(mocker, shared):
+    """Tests that references which aren't ignored are found on any page."""
+    artifact = SimpleNamespace(
+        id=uuid4(), artifact_store_id=uuid4(), content_hash="hash", uri="uri"
+    )
+    ignored_ids = [artifact.id, uuid4(), uuid4()]
+    reference_ids = ignored_ids + ([uuid4()] if shared else [])
+
+    def _list_artifacts(filter_model):
+        index = 0
+        if filter_model.cursor_params:
+            _, last_id = filter_model.cursor_params
+            index = reference_ids.index(last_id) + 1
+        has_more = index + 1 < len(reference_ids)
+        return SimpleNamespace(
+            index=1,
+            total_pages=1 + int(has_more),
+            items=[SimpleNamespace(id=reference_ids[index])],
+            next_cursor=ArtifactFilterModel.encode_cursor(
+                sort_value=None, id=reference_ids[index]
+            )
+            if has_more
+            else None,
+        )
+
+    client = mocker.MagicMock()
+    client.iter_items.side_effect = pagination_utils.iter_items
+    client.zen_store.list_artifacts.side_effect = _list_artifacts
+
+    shared_uris = artifact_gc_utils._find_shared_uris(
+        client, [artifact], ignored_artifact_ids=set(ignored_ids)
+    )
+    assert shared_uris == ({"uri"} if shared else set())
+    assert client.zen_store.list_artifacts.call_count == len(reference_ids)
+
+
+def test_deleting_uris_keeps_referenced_uris(tmp_path):
+    """Tests that data which got referenced before its deletion is kept."""
+    artifact_store = _create_artifact_store(str(tmp_path))
+    referenced_uri = _create_artifact_dir(str(tmp_path), uuid4())
+    unused_uri = _create_artifact_dir(str(tmp_path), uuid4())
+    report = artifact_gc_utils.ArtifactGarbageCollectionReport()
+
+    artifact_gc_utils._delete_uris(
+        artifact_store,
+        [referenced_uri, unused_uri],
+        report=report,
+        is_referenced=lambda uri: uri == referenced_uri,
+    )
+
+    assert report.uris == [unused_uri]
+    assert report.failed_uris == []
+    assert os.path.exists(referenced_uri)
+    assert not os.path.exists(unused_uri)
@@ -104,6 +104,24 @@ def test_copy_dir_works(tmp_path):
         assert f.read() == "some_content_about_aria"
 
 
+@pytest.mark.parametrize("max_workers", [1, 4, None])
+def test_copy_dir_copies_nested_files_in_parallel(tmp_path, max_workers):
+    """Tests copying nested directories with multiple workers."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(5):
+        file_path = os.path.join(dir_path, f"sub_{i % 2}", f"file_{i}.txt")
+        io_utils.create_file_if_not_exists(file_path, f"content_{i}")
+
+    new_dir_path = os.path.join(tmp_path, "test2")
+    io_utils.copy_dir(dir_path, new_dir_path, max_workers=max_workers)
+
+    for i in range(5):
+        file_path = os.path.join(new_dir_path, f"sub_{i % 2}", f"file_{i}.txt")
+        assert io_utils.read_file_contents_as_string(file_path) == (
+            f"content_{i}"
+        )
+
+
 def test_copy_dir_overwriting_works(tmp_path):
     """Tests copying directory overwriting."""
     dir_path = os.path.join(tmp_path, "test")
@@ -0,0 +1,148 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import math
+from datetime import datetime
+from typing import List, Optional
+from uuid import uuid4
+
+import pytest
+
+from zenml.models import BaseResponseModel, Page
+from zenml.utils import pagination_utils
+
+PAGE_SIZE = 3
+
+
+def _create_items(count: int) -> List[BaseResponseModel]:
+    """Creates response models to paginate."""
+    now = datetime.utcnow()
+    return [
+        BaseResponseModel(id=uuid4(), created=now, updated=now)
+        for _ in range(count)
+    ]
+
+
+class OffsetListMethod:
+    """List method that only supports offset-based pagination."""
+
+    def __init__(self, items: List[BaseResponseModel]) -> None:
+        self.items = items
+        self.requested_pages: List[int] = []
+
+    def __call__(self, page: int = 1) -> Page[BaseResponseModel]:
+        self.requested_pages.append(page)
+        start = (page - 1) * PAGE_SIZE
+        return Page(
+            index=page,
+            max_size=PAGE_SIZE,
+            total_pages=max(math.ceil(len(self.items) / PAGE_SIZE), 1),
+            total=len(self.items),
+            items=self.items[start : start + PAGE_SIZE],
+        )
+
+
+class CursorListMethod(OffsetListMethod):
+    """List method that supports cursor-based pagination."""
+
+    def __call__(
+        self,
+        page: int = 1,
+        after: Optional[str] = None,
+        skip_count: bool = False,
+    ) -> Page[BaseResponseModel]:
+        assert skip_count
+        self.requested_pages.append(page)
+        start = int(after) if after else 0
+        next_start = start + PAGE_SIZE
+        return Page(
+            index=page,
+            max_size=PAGE_SIZE,
+            total_pages=page,
+            total=next_start,
+            items=self.items[start:next_start],
+            next_cursor=str(next_start)
+            if next_start < len(self.items)
+            else None,
+        )
+
+
+class LegacyServerListMethod(OffsetListMethod):
+    """List method of a client connected to a server without cursor support.
+
+    The server ignores the cursor arguments and always counts the items.
+    """
+
+    def __call__(
+        self,
+        page: int = 1,
+        after: Optional[str] = None,
+        skip_count: bool = False,
+    ) -> Page[BaseResponseModel]:
+        return super().__call__(page=page)
+
+
+@pytest.mark.parametrize("count", [0, 1, PAGE_SIZE, 10])
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_iter_items_returns_all_items_in_order(count: int, prefetch: int):
+    """Tests that all items are returned in order with and w/o prefetching."""
+    items = _create_items(count)
+
+    list_method = OffsetListMethod(items)
+    assert (
+        list(pagination_utils.iter_items(list_method, prefetch=prefetch))
+        == items
+    )
+
+    list_method = CursorListMethod(items)
+    assert (
+        list(pagination_utils.iter_items(list_method, prefetch=prefetch))
+        == items
+    )
+    # Pages are never requested by their page number, which would require
+    # an offset query
+    assert set(list_method.requested_pages) == {1}
+    assert pagination_utils.depaginate(CursorListMethod(items)) == items
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_iter_items_falls_back_to_page_numbers_without_cursor(prefetch: int):
+    """Tests that all items are returned if the server doesn't return a
+    cursor even though the list method accepts the cursor arguments."""
+    items = _create_items(10)
+    list_method = LegacyServerListMethod(items)
+
+    assert (
+        list(pagination_utils.iter_items(list_method, prefetch=prefetch))
+        == items
+    )
+    assert list_method.requested_pages == [1, 2, 3, 4]
+
+
+def test_iter_pages_is_lazy():
+    """Tests that pages are only fetched when they are consumed."""
+    list_method = OffsetListMethod(_create_items(10))
+
+    pages = pagination_utils.iter_pages(list_method)
+    assert list_method.requested_pages == []
+    next(pages)
+    assert list_method.requested_pages == [1]
+    next(pages)
+    assert list_method.requested_pages == [1, 2]
+
+
+def test_iter_pages_fails_for_negative_prefetch():
+    """Tests that a negative prefetch value is rejected."""
+    with pytest.raises(ValueError):
+        next(pagination_utils.iter_pages(OffsetListMethod([]), prefetch=-1))
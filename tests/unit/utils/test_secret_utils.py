@@ -12,11 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+from types import SimpleNamespace
+from uuid import uuid4
+
 from hypothesis import given
 from hypothesis.strategies import from_regex
 from pydantic import BaseModel, Field
 
+from zenml.enums import StackComponentType
 from zenml.utils import secret_utils
+from zenml.zen_stores.store_cache import TTLStoreCache
 
 strategy = from_regex(r"[^.\s]{1,100}", fullmatch=True)
 
@@ -65,3 +70,128 @@ def test_secret_field_detection():
         secret_utils.is_secret_field(Model.__fields__["non_secret"]) is False
     )
     assert secret_utils.is_secret_field(Model.__fields__["secret"]) is True
+
+
+def test_store_secret_values_are_cached(mocker):
+    """Tests that secrets store lookups are cached until refreshed."""
+    mocker.patch.object(
+        secret_utils, "_secret_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mock_get_secret = mocker.patch(
+        "zenml.client.Client.get_secret_by_name_and_scope",
+        return_value=SimpleNamespace(secret_values={"key": "value"}),
+    )
+
+    for _ in range(2):
+        assert secret_utils.get_store_secret_values("secret") == {
+            "key": "value"
+        }
+    assert mock_get_secret.call_count == 1
+
+    secret_utils.refresh_secret_cache("secret")
+    secret_utils.get_store_secret_values("secret")
+    assert mock_get_secret.call_count == 2
+
+
+def test_missing_store_secrets_are_cached(mocker):
+    """Tests that secrets missing from the secrets store are cached."""
+    mocker.patch.object(
+        secret_utils, "_secret_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mock_get_secret = mocker.patch(
+        "zenml.client.Client.get_secret_by_name_and_scope",
+        side_effect=KeyError("secret"),
+    )
+
+    for _ in range(2):
+        assert secret_utils.get_store_secret_values("secret") is None
+    assert mock_get_secret.call_count == 1
+
+
+def test_prefetching_secrets(mocker):
+    """Tests that prefetching fetches each uncached secret once."""
+    mocker.patch.object(
+        secret_utils, "_secret_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mocker.patch.object(secret_utils, "SECRET_CACHE_TTL", 60)
+    mock_get_secret = mocker.patch(
+        "zenml.client.Client.get_secret_by_name_and_scope",
+        return_value=SimpleNamespace(secret_values={"key": "value"}),
+    )
+
+    references = [
+        secret_utils.SecretReference(name=name, key=key)
+        for name in ["a", "b"]
+        for key in ["key", "other_key"]
+    ]
+    secret_utils.prefetch_secrets(references)
+    assert mock_get_secret.call_count == 2
+
+    secret_utils.prefetch_secrets(references)
+    secret_utils.get_store_secret_values("a")
+    assert mock_get_secret.call_count == 2
+
+
+def test_store_secret_values_are_cached_per_client_scope(mocker):
+    """Tests that cached secrets are not shared between stores, users and
+    workspaces."""
+    mocker.patch.object(
+        secret_utils, "_secret_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mock_get_secret = mocker.patch(
+        "zenml.client.Client.get_secret_by_name_and_scope",
+        return_value=SimpleNamespace(secret_values={"key": "value"}),
+    )
+    scope = ["https://zenml.example.com", uuid4(), uuid4()]
+    mocker.patch.object(
+        secret_utils, "_get_cache_scope", side_effect=lambda: tuple(scope)
+    )
+
+    secret_utils.get_store_secret_values("secret")
+    for index in range(len(scope)):
+        scope[index] = str(uuid4())
+        secret_utils.get_store_secret_values("secret")
+    secret_utils.get_store_secret_values("secret")
+    assert mock_get_secret.call_count == 4
+
+
+def test_secrets_manager_secret_values_are_cached_per_secrets_manager(
+    mocker,
+):
+    """Tests that cached secrets are not shared between secrets managers."""
+    mocker.patch.object(
+        secret_utils, "_secret_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mocker.patch.object(
+        secret_utils,
+        "_get_cache_scope",
+        return_value=("https://zenml.example.com", uuid4(), uuid4()),
+    )
+    secrets_manager_ids = [uuid4()]
+    mocker.patch(
+        "zenml.client.Client.active_stack_model",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: SimpleNamespace(
+            components={
+                StackComponentType.SECRETS_MANAGER: [
+                    SimpleNamespace(id=secrets_manager_ids[0])
+                ]
+            }
+        ),
+    )
+    secrets_manager = mocker.MagicMock()
+    secrets_manager.get_secret.return_value = SimpleNamespace(
+        content={"key": "value"}
+    )
+
+    for _ in range(2):
+        assert secret_utils.get_secrets_manager_secret_values(
+            "secret", get_secrets_manager=lambda: secrets_manager
+        ) == {"key": "value"}
+    assert secrets_manager.get_secret.call_count == 1
+
+    secrets_manager_ids[0] = uuid4()
+    secret_utils.get_secrets_manager_secret_values(
+        "secret", get_secrets_manager=lambda: secrets_manager
+    )
+    assert secrets_manager.get_secret.call_count == 2
@@ -24,3 +24,24 @@ def test_get_source():
 def test_get_hashed_source():
     """Tests if hash of objects is computed properly."""
     assert source_code_utils.get_hashed_source_code(pytest.Cache)
+
+
+def test_normalized_source_code_ignores_formatting():
+    """Tests that normalization ignores comments, docstrings and formatting."""
+    source = '''
+    def f(a, b):
+        """Docstring."""
+        return a + b
+    '''
+    reformatted = """
+def f(a,   b):
+    # A comment.
+    return a + b
+"""
+    changed = """
+def f(a, b):
+    return a - b
+"""
+    normalized = source_code_utils.normalize_source_code(source)
+    assert normalized == source_code_utils.normalize_source_code(reformatted)
+    assert normalized != source_code_utils.normalize_source_code(changed)
@@ -320,3 +320,35 @@ def test_package_utility_functions():
         source_utils._get_package_version(package_name="non_existent_package")
         is None
     )
+
+
+def test_distribution_index_is_cached_until_python_path_changes(mocker):
+    """Tests that distribution package lookups are cached per `sys.path`."""
+    source_utils.invalidate_distribution_index()
+    if sys.version_info < (3, 10):
+        import importlib_metadata as metadata
+    else:
+        import importlib.metadata as metadata
+    mock_packages_distributions = mocker.patch.object(
+        metadata,
+        "packages_distributions",
+        return_value={"some_module": ["some-package"]},
+    )
+    mock_version = mocker.patch.object(metadata, "version", return_value="1")
+
+    for _ in range(2):
+        assert (
+            source_utils._get_package_for_module("some_module.submodule")
+            == "some-package"
+        )
+        assert source_utils._get_package_version("some-package") == "1"
+    assert mock_packages_distributions.call_count == 1
+    assert mock_version.call_count == 1
+
+    with source_utils.prepend_python_path("some_path"):
+        source_utils._get_package_for_module("some_module")
+        source_utils._get_package_version("some-package")
+    assert mock_packages_distributions.call_count == 2
+    assert mock_version.call_count == 2
+
+    source_utils.invalidate_distribution_index()
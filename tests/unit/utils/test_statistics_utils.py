@@ -0,0 +1,59 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import math
+
+import numpy as np
+import pytest
+
+from zenml.utils import statistics_utils
+
+
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_summary_statistics_match_numpy_across_chunks(monkeypatch, ddof):
+    """Tests that chunked statistics match the numpy results."""
+    monkeypatch.setattr(statistics_utils, "CHUNK_SIZE", 7)
+    arr = np.random.default_rng(1).normal(size=(10, 10)) * 100
+
+    statistics = statistics_utils.compute_summary_statistics(arr, ddof=ddof)
+
+    assert statistics.mean == pytest.approx(np.mean(arr))
+    assert statistics.std == pytest.approx(np.std(arr, ddof=ddof))
+    assert statistics.min == np.min(arr)
+    assert statistics.max == np.max(arr)
+
+
+def test_summary_statistics_ignore_nan_values():
+    """Tests that NaN values are ignored."""
+    statistics = statistics_utils.compute_summary_statistics(
+        np.array([1.0, np.nan, 3.0])
+    )
+    assert statistics == (2.0, 1.0, 1.0, 3.0)
+
+    statistics = statistics_utils.compute_summary_statistics(
+        np.array([np.nan])
+    )
+    assert all(math.isnan(value) for value in statistics)
+
+
+def test_sample_indices():
+    """Tests that samples are only taken from long sequences."""
+    assert statistics_utils.get_sample_indices(10, sample_size=10) is None
+
+    indices = statistics_utils.get_sample_indices(1000, sample_size=10)
+    assert len(set(indices)) == 10
+    assert list(indices) == sorted(indices)
+    assert np.array_equal(
+        indices, statistics_utils.get_sample_indices(1000, sample_size=10)
+    )
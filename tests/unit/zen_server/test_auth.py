@@ -0,0 +1,94 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import SecurityScopes
+
+from zenml.models.user_models import JWTToken, JWTTokenType
+from zenml.zen_server import auth
+from zenml.zen_stores.store_cache import TTLStoreCache
+
+
+def test_access_token_authentication_is_cached(mocker):
+    """Tests that access tokens are only verified once until invalidated."""
+    mocker.patch.object(
+        auth, "_auth_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    access_token = JWTToken(
+        token_type=JWTTokenType.ACCESS_TOKEN,
+        user_id=uuid4(),
+        permissions=["read"],
+    )
+    mock_decode = mocker.patch.object(
+        auth.JWTToken, "decode", return_value=access_token
+    )
+    mock_get_auth_context = mocker.patch.object(
+        auth,
+        "_get_access_token_auth_context",
+        return_value=mocker.sentinel.auth_context,
+    )
+
+    for _ in range(2):
+        assert (
+            auth.oauth2_password_bearer_authentication(
+                SecurityScopes(scopes=["read"]), token="token"
+            )
+            is mocker.sentinel.auth_context
+        )
+    assert mock_decode.call_count == 1
+    assert mock_get_auth_context.call_count == 1
+
+    # Cached tokens are still checked for the required scopes
+    with pytest.raises(HTTPException) as e:
+        auth.oauth2_password_bearer_authentication(
+            SecurityScopes(scopes=["write"]), token="token"
+        )
+    assert e.value.status_code == 403
+
+    auth.invalidate_auth_cache()
+    auth.oauth2_password_bearer_authentication(
+        SecurityScopes(scopes=["read"]), token="token"
+    )
+    assert mock_decode.call_count == 2
+    assert mock_get_auth_context.call_count == 2
+
+
+def test_failed_access_token_authentication_is_not_cached(mocker):
+    """Tests that tokens of unknown or inactive users are not cached."""
+    mocker.patch.object(
+        auth, "_auth_cache", TTLStoreCache(ttl=60, max_size=10)
+    )
+    mocker.patch.object(
+        auth.JWTToken,
+        "decode",
+        return_value=JWTToken(
+            token_type=JWTTokenType.ACCESS_TOKEN,
+            user_id=uuid4(),
+            permissions=["read"],
+        ),
+    )
+    mock_get_auth_context = mocker.patch.object(
+        auth, "_get_access_token_auth_context", return_value=None
+    )
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as e:
+            auth.oauth2_password_bearer_authentication(
+                SecurityScopes(scopes=["read"]), token="token"
+            )
+        assert e.value.status_code == 401
+    assert mock_get_auth_context.call_count == 2
@@ -0,0 +1,87 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from zenml.zen_server.zen_server_api import RequestDecompressionMiddleware
+
+MAX_SIZE = 1000
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Client for an app that echoes the request body it receives."""
+
+    async def echo(request: Request) -> Response:
+        return Response(
+            await request.body(),
+            headers={
+                "x-content-encoding": request.headers.get(
+                    "content-encoding", ""
+                )
+            },
+        )
+
+    app = Starlette(routes=[Route("/", echo, methods=["POST"])])
+    return TestClient(RequestDecompressionMiddleware(app, max_size=MAX_SIZE))
+
+
+def test_uncompressed_requests_are_passed_through(client):
+    """Tests that requests without gzip encoding are not modified."""
+    response = client.post("/", data=b"body")
+    assert response.status_code == 200
+    assert response.content == b"body"
+
+
+def test_gzip_encoded_requests_are_decompressed(client):
+    """Tests that gzip-encoded request bodies are decompressed."""
+    body = b"x" * MAX_SIZE
+    response = client.post(
+        "/",
+        data=gzip.compress(body),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.content == body
+    assert response.headers["x-content-encoding"] == ""
+
+
+@pytest.mark.parametrize("size", [MAX_SIZE + 1, 100 * 1024**2])
+def test_too_large_decompressed_requests_are_rejected(client, size):
+    """Tests that requests which decompress to more than the maximum size are
+    rejected."""
+    response = client.post(
+        "/",
+        data=gzip.compress(b"\0" * size),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize(
+    "body", [b"not gzip", gzip.compress(b"body")[:-4], gzip.compress(b"") * 2]
+)
+def test_invalid_gzip_encoded_requests_are_rejected(client, body):
+    """Tests that invalid or truncated gzip request bodies are rejected."""
+    response = client.post(
+        "/", data=body, headers={"Content-Encoding": "gzip"}
+    )
+    assert response.status_code == 400
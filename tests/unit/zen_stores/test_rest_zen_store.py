@@ -0,0 +1,157 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+from uuid import uuid4
+
+import pytest
+from urllib3.util.retry import RequestHistory
+
+from zenml.models import ComponentResponseModel, StackResponseModel
+from zenml.zen_stores import rest_zen_store
+from zenml.zen_stores.rest_zen_store import (
+    DEFAULT_HTTP_COMPRESSION_MIN_SIZE,
+    DEFAULT_HTTP_RETRIES,
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+@pytest.fixture
+def rest_store(mocker) -> RestZenStore:
+    """A REST store that doesn't connect to a server."""
+    mocker.patch.object(RestZenStore, "_initialize")
+    return RestZenStore(
+        config=RestZenStoreConfiguration(
+            url="https://zenml.example.com", api_token="token"
+        ),
+        skip_default_registrations=True,
+    )
+
+
+def test_only_idempotent_requests_are_retried(rest_store):
+    """Tests that only idempotent requests are retried on server errors."""
+    retries = rest_store.session.get_adapter(rest_store.url).max_retries
+    assert retries.total == DEFAULT_HTTP_RETRIES
+
+    for method in ["GET", "HEAD", "PUT", "DELETE"]:
+        assert retries.is_retry(method, status_code=503)
+    assert not retries.is_retry("GET", status_code=500)
+    assert not retries.is_retry("POST", status_code=503)
+
+
+def test_retry_backoff_is_jittered(mocker):
+    """Tests that up to the exponential backoff time is added as jitter."""
+    mock_uniform = mocker.patch.object(
+        rest_zen_store.random, "uniform", side_effect=lambda a, b: b
+    )
+    history = RequestHistory("GET", "/", None, 503, None)
+    retries = rest_zen_store._JitteredRetry(
+        total=5, backoff_factor=1, history=(history,) * 3
+    )
+
+    assert retries.get_backoff_time() == 8
+    mock_uniform.assert_called_once_with(0, 4)
+
+
+def test_request_bodies_are_compressed_if_enabled(rest_store):
+    """Tests that large request bodies are gzip-compressed if enabled."""
+    body = "x" * DEFAULT_HTTP_COMPRESSION_MIN_SIZE
+    request_kwargs = {"data": body}
+    rest_store._compress_request_body(request_kwargs)
+    assert request_kwargs == {"data": body}
+
+    rest_store.config.http_compression = True
+    rest_store._compress_request_body(request_kwargs)
+    assert request_kwargs["headers"] == {"Content-Encoding": "gzip"}
+    assert gzip.decompress(request_kwargs["data"]) == body.encode()
+
+    small_request_kwargs = {"data": "x"}
+    rest_store._compress_request_body(small_request_kwargs)
+    assert small_request_kwargs == {"data": "x"}
+
+
+@pytest.fixture
+def mock_requests(mocker):
+    """Mocks the HTTP requests and response parsing of the REST store."""
+    for model_class in [StackResponseModel, ComponentResponseModel]:
+        mocker.patch.object(
+            model_class, "parse_obj", return_value=mocker.MagicMock()
+        )
+    return {
+        method: mocker.patch.object(RestZenStore, method, return_value={})
+        for method in ["get", "put", "delete"]
+    }
+
+
+def test_cached_entities_are_fetched_once(rest_store, mock_requests):
+    """Tests that cached entities are served without sending requests."""
+    stack_id = uuid4()
+    component_id = uuid4()
+    for _ in range(3):
+        rest_store.get_stack(stack_id)
+        rest_store.get_stack_component(component_id)
+    assert mock_requests["get"].call_count == 2
+
+    # Other entities of the same kind are not served from the cache
+    rest_store.get_stack(uuid4())
+    assert mock_requests["get"].call_count == 3
+
+
+def test_updating_or_deleting_entities_invalidates_the_cache(
+    rest_store, mocker, mock_requests
+):
+    """Tests that updates and deletions drop the cached entities."""
+    stack_id = uuid4()
+    other_stack_id = uuid4()
+    rest_store.get_stack(stack_id)
+    rest_store.get_stack(other_stack_id)
+
+    rest_store.update_stack(stack_id, mocker.MagicMock())
+    rest_store.get_stack(stack_id)
+    rest_store.get_stack(other_stack_id)
+    assert mock_requests["get"].call_count == 3
+
+    rest_store.delete_stack(stack_id)
+    rest_store.get_stack(stack_id)
+    assert mock_requests["get"].call_count == 4
+
+
+def test_updating_components_invalidates_cached_stacks(
+    rest_store, mocker, mock_requests
+):
+    """Tests that component changes drop the stacks that embed them."""
+    stack_id = uuid4()
+    component_id = uuid4()
+    rest_store.get_stack(stack_id)
+    rest_store.get_stack_component(component_id)
+
+    rest_store.update_stack_component(component_id, mocker.MagicMock())
+    rest_store.get_stack(stack_id)
+    rest_store.get_stack_component(component_id)
+    assert mock_requests["get"].call_count == 4
+
+    rest_store.delete_stack_component(component_id)
+    rest_store.get_stack(stack_id)
+    rest_store.get_stack_component(component_id)
+    assert mock_requests["get"].call_count == 6
+
+
+def test_entities_are_not_cached_if_disabled(rest_store, mock_requests):
+    """Tests that entities are always fetched if the cache is disabled."""
+    rest_store.config.cache_ttl = 0
+    stack_id = uuid4()
+    for _ in range(2):
+        rest_store.get_stack(stack_id)
+    assert mock_requests["get"].call_count == 2
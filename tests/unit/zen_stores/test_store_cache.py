@@ -0,0 +1,80 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.zen_stores.store_cache import TTLStoreCache
+
+
+def test_cache_returns_cached_values():
+    """Tests that cached values are returned until they are invalidated."""
+    cache = TTLStoreCache(ttl=60, max_size=10)
+    assert cache.get(("flavor", 1)) is None
+
+    cache.set(("flavor", 1), "value")
+    assert cache.get(("flavor", 1)) == "value"
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    cache.invalidate("flavor", 1)
+    assert cache.get(("flavor", 1)) is None
+
+
+def test_cache_invalidates_all_entries_of_a_kind():
+    """Tests that invalidating a kind removes all its entries."""
+    cache = TTLStoreCache(ttl=60, max_size=10)
+    cache.set(("stack", 1), "stack_1")
+    cache.set(("stack", 2), "stack_2")
+    cache.set(("flavor", 1), "flavor")
+
+    cache.invalidate("stack")
+
+    assert cache.get(("stack", 1)) is None
+    assert cache.get(("stack", 2)) is None
+    assert cache.get(("flavor", 1)) == "flavor"
+
+
+def test_cache_entries_expire(mocker):
+    """Tests that cache entries expire after the TTL."""
+    mock_time = mocker.patch("zenml.zen_stores.store_cache.time.monotonic")
+    mock_time.return_value = 100
+    cache = TTLStoreCache(ttl=10, max_size=10)
+    cache.set(("build", 1), "build")
+
+    mock_time.return_value = 109
+    assert cache.get(("build", 1)) == "build"
+
+    mock_time.return_value = 110
+    assert cache.get(("build", 1)) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used_entries():
+    """Tests that the cache size is bounded."""
+    cache = TTLStoreCache(ttl=60, max_size=2)
+    cache.set(("component", 1), 1)
+    cache.set(("component", 2), 2)
+    # Access the first entry so the second one is the least recently used
+    cache.get(("component", 1))
+    cache.set(("component", 3), 3)
+
+    assert len(cache) == 2
+    assert cache.get(("component", 1)) == 1
+    assert cache.get(("component", 2)) is None
+    assert cache.get(("component", 3)) == 3
+
+
+def test_disabled_cache_does_not_store_values():
+    """Tests that a TTL of 0 disables caching."""
+    cache = TTLStoreCache(ttl=0, max_size=10)
+    cache.set(("store_info", "info"), "info")
+    assert cache.get(("store_info", "info")) is None